@@ -7,7 +7,7 @@ from app.backend.core.exceptions import AlertNotFound, DuplicateAlert
 from app.backend.models.alert import Alert
 from app.backend.models.push_subscription import PushSubscription
 from app.backend.models.user import User
-from app.backend.schemas.alert import AlertCreate, AlertResponse
+from app.backend.schemas.alert import MAX_PINNED_PRODUCTS, AlertCreate, AlertResponse
 from app.backend.services.alert_service import (
     create_alert,
     create_alert_for_push,
@@ -53,6 +53,7 @@ async def create_new_alert(
             alert = await create_alert(
                 db, current_user, data.search_query, data.target_price, data.store_slugs,
                 product_category=data.product_category,
+                pinned_product_urls=data.pinned_product_urls,
             )
             await db.commit()
         except DuplicateAlert as e:
@@ -75,6 +76,7 @@ async def create_new_alert(
             alert = await create_alert(
                 db, user, data.search_query, data.target_price, data.store_slugs,
                 product_category=data.product_category,
+                pinned_product_urls=data.pinned_product_urls,
             )
             await db.commit()
         except DuplicateAlert as e:
@@ -102,6 +104,7 @@ async def create_new_alert(
         alert = await create_alert_for_push(
             db, push_sub, data.search_query, data.target_price, data.store_slugs,
             product_category=data.product_category,
+            pinned_product_urls=data.pinned_product_urls,
         )
         await db.commit()
     except DuplicateAlert as e:
@@ -148,6 +151,57 @@ async def check_alert_now(
     return {"status": "checking", "alert_id": alert_id}
 
 
+async def _get_owned_alert(db: AsyncSession, alert_id: int, current_user: User) -> Alert:
+    result = await db.execute(select(Alert).where(Alert.id == alert_id))
+    alert = result.scalar_one_or_none()
+    if not alert or not alert.is_active:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found")
+    if alert.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your alert")
+    return alert
+
+
+@router.post("/alerts/{alert_id}/pin", response_model=AlertResponse)
+async def pin_lowest_product(
+    alert_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Pin the alert to the listing its lowest price was last seen at.
+
+    Later checks re-read just that product instead of searching again.
+    """
+    alert = await _get_owned_alert(db, alert_id, current_user)
+    if not alert.lowest_price_url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No product found yet for this alert",
+        )
+    pinned = list(alert.pinned_product_urls or [])
+    if alert.lowest_price_url not in pinned:
+        if len(pinned) >= MAX_PINNED_PRODUCTS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_PINNED_PRODUCTS} products can be pinned",
+            )
+        alert.pinned_product_urls = pinned + [alert.lowest_price_url]
+    await db.commit()
+    return alert
+
+
+@router.delete("/alerts/{alert_id}/pin", response_model=AlertResponse)
+async def unpin_products(
+    alert_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Go back to checking the alert by keyword search."""
+    alert = await _get_owned_alert(db, alert_id, current_user)
+    alert.pinned_product_urls = None
+    await db.commit()
+    return alert
+
+
 @router.delete("/alerts/{alert_id}")
 async def remove_alert(
     alert_id: int,
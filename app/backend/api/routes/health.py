@@ -1,8 +1,17 @@
 from fastapi import APIRouter
 
+from app.backend.scrapers.circuit_breaker import circuit_breaker
+from app.backend.services.store_latency import store_latency
+from app.shared.constants import STORE_CONFIGS
+
 router = APIRouter()
 
 
 @router.get("/health")
 async def health_check():
-    return {"status": "ok", "service": "ucuzbot"}
+    return {
+        "status": "ok",
+        "service": "ucuzbot",
+        "store_breakers": {slug: await circuit_breaker.state(slug) for slug in STORE_CONFIGS},
+        "store_latency": store_latency.snapshot(),
+    }
@@ -1,8 +1,17 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.backend.api.dependencies import get_db
-from app.backend.schemas.product import PriceHistoryResponse, PriceRecordResponse
+from app.backend.models.daily_price import AlertDailyPrice, ProductDailyPrice
+from app.backend.schemas.product import (
+    PriceHistoryResponse,
+    PricePointResponse,
+    PriceRecordResponse,
+    ProductPriceHistoryResponse,
+)
+from app.backend.services.price_rollups import get_daily_prices, lttb
 from app.backend.services.price_service import get_price_history
 from app.shared.constants import STORE_CONFIGS
 
@@ -10,11 +19,47 @@ router = APIRouter()
 
 
 @router.get("/prices/{alert_id}", response_model=PriceHistoryResponse)
-async def price_history(alert_id: int, db: AsyncSession = Depends(get_db)):
-    records = await get_price_history(db, alert_id)
+async def price_history(
+    alert_id: int,
+    from_: date | None = Query(None, alias="from"),
+    to: date | None = Query(None),
+    resolution: str = Query("raw", pattern="^(raw|day|week|month)$"),
+    points: int | None = Query(None, ge=3, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    if resolution == "raw":
+        records = await get_price_history(db, alert_id, from_, to)
+        return PriceHistoryResponse(
+            alert_id=alert_id,
+            records=[PriceRecordResponse.model_validate(r) for r in records],
+        )
+
+    rollups = await get_daily_prices(db, AlertDailyPrice, alert_id, from_, to, resolution)
+    if points:
+        rollups = lttb(rollups, points)
     return PriceHistoryResponse(
         alert_id=alert_id,
-        records=[PriceRecordResponse.model_validate(r) for r in records],
+        resolution=resolution,
+        points=[PricePointResponse.model_validate(p) for p in rollups],
+    )
+
+
+@router.get("/products/{product_id}/prices", response_model=ProductPriceHistoryResponse)
+async def product_price_history(
+    product_id: int,
+    from_: date | None = Query(None, alias="from"),
+    to: date | None = Query(None),
+    resolution: str = Query("day", pattern="^(day|week|month)$"),
+    points: int | None = Query(None, ge=3, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    rollups = await get_daily_prices(db, ProductDailyPrice, product_id, from_, to, resolution)
+    if points:
+        rollups = lttb(rollups, points)
+    return ProductPriceHistoryResponse(
+        product_id=product_id,
+        resolution=resolution,
+        points=[PricePointResponse.model_validate(p) for p in rollups],
     )
 
 
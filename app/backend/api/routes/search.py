@@ -1,32 +1,78 @@
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.backend.api.dependencies import check_rate_limit
-from app.backend.schemas.search import SearchResponse, SearchResult
-from app.backend.services.search_service import search_all_stores
+from app.backend.core.config import settings
+from app.backend.scrapers.base import ScrapedProduct
+from app.backend.schemas.search import (
+    SearchDoneEvent,
+    SearchResponse,
+    SearchResult,
+    StoreSearchEvent,
+)
+from app.backend.services.search_service import search_all_stores, stream_search_stores
 
 router = APIRouter()
 
 
+def _to_result(p: ScrapedProduct) -> SearchResult:
+    return SearchResult(
+        product_name=p.product_name,
+        price=p.price,
+        product_url=p.product_url,
+        store_slug=p.store_slug,
+        store_name=p.store_name,
+        image_url=p.image_url,
+        in_stock=p.in_stock,
+    )
+
+
 @router.get("/search", response_model=SearchResponse, dependencies=[Depends(check_rate_limit)])
 async def search_products(q: str = Query(min_length=2, max_length=200)):
-    products, errors = await search_all_stores(q)
+    products, errors = await search_all_stores(q, latency_budget=settings.SEARCH_LATENCY_BUDGET_SECONDS)
     return SearchResponse(
         query=q,
         total_results=len(products),
-        results=[
-            SearchResult(
-                product_name=p.product_name,
-                price=p.price,
-                product_url=p.product_url,
-                store_slug=p.store_slug,
-                store_name=p.store_name,
-                image_url=p.image_url,
-                in_stock=p.in_stock,
-            )
-            for p in products
-        ],
+        results=[_to_result(p) for p in products],
         errors=errors,
         searched_at=datetime.now(timezone.utc),
     )
+
+
+@router.get("/search/stream", dependencies=[Depends(check_rate_limit)])
+async def search_products_stream(q: str = Query(min_length=2, max_length=200)):
+    """Server-Sent Events: one ``store`` event per store as it answers
+    (each sorted by price), then a final ``done`` event."""
+
+    async def events() -> AsyncIterator[str]:
+        total = 0
+        errors: list[str] = []
+        async for batch in stream_search_stores(q, latency_budget=settings.SEARCH_LATENCY_BUDGET_SECONDS):
+            total += len(batch.products)
+            if batch.error:
+                errors.append(batch.error)
+            event = StoreSearchEvent(
+                store_slug=batch.store_slug,
+                results=[_to_result(p) for p in batch.products],
+                error=batch.error,
+                status=batch.status,
+            )
+            yield f"event: store\ndata: {event.model_dump_json()}\n\n"
+
+        done = SearchDoneEvent(
+            query=q,
+            total_results=total,
+            errors=errors,
+            searched_at=datetime.now(timezone.utc),
+        )
+        yield f"event: done\ndata: {done.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Stop nginx from buffering the stream.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -8,6 +8,8 @@ from aiogram.types import BotCommand
 from app.backend.bot.handlers import alerts, callbacks, fallback, search, start
 from app.backend.core.config import settings
 from app.backend.core.logging import setup_logging, get_logger
+from app.backend.core.redis_client import close_redis
+from app.backend.scrapers.client_pool import client_pool
 
 setup_logging()
 logger = get_logger(__name__)
@@ -52,7 +54,11 @@ async def main():
     ])
 
     logger.info("bot_starting")
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await client_pool.aclose()
+        await close_redis()
 
 
 if __name__ == "__main__":
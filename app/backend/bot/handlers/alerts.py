@@ -15,6 +15,7 @@ from app.backend.bot.keyboards import (
     no_alerts_keyboard,
     store_selection_keyboard,
 )
+from app.backend.core.config import settings
 from app.backend.db.base import async_session_factory
 from app.backend.models.bot_activity import log_bot_activity
 from app.backend.services.alert_service import (
@@ -67,7 +68,9 @@ async def alert_receive_query(message: Message, state: FSMContext):
         return
 
     wait_msg = await message.answer("⏳ Axtarılır... / Searching...")
-    products, _ = await search_all_stores(query, max_results_per_store=3)
+    products, _ = await search_all_stores(
+        query, max_results_per_store=3, latency_budget=settings.SEARCH_LATENCY_BUDGET_SECONDS
+    )
 
     if products:
         lines = [f"📊 Cari qiymətlər / Current prices for \"{query}\":\n"]
@@ -27,7 +27,7 @@ from app.backend.db.base import async_session_factory
 from app.backend.models.alert import Alert
 from app.backend.models.bot_activity import log_bot_activity
 from app.backend.models.user import User
-from app.backend.services.category_detector import CATEGORIES, detect_categories
+from app.backend.services.category_detector import detect_categories, get_categories
 from app.backend.services.alert_service import (
     create_alert,
     delete_alert,
@@ -138,7 +138,7 @@ async def handle_category_selection(callback: CallbackQuery, state: FSMContext):
     await state.update_data(product_category=slug)
     await state.set_state(AlertCreation.waiting_for_price)
 
-    cat = CATEGORIES.get(slug)
+    cat = get_categories().get(slug)
     cat_label = f"{cat.emoji} {cat.name_az}" if cat else slug
 
     await callback.message.edit_text(
@@ -223,7 +223,7 @@ async def _finalize_alert(callback: CallbackQuery, state: FSMContext, selected_s
         pass  # Non-critical: alert is saved, price check will run on next schedule
 
     store_names = [STORE_CONFIGS[s]["name"] for s in store_slugs if s in STORE_CONFIGS]
-    cat = CATEGORIES.get(product_category) if product_category else None
+    cat = get_categories().get(product_category) if product_category else None
     cat_line = f"\U0001f4c2 {cat.emoji} {cat.name_az}\n" if cat else ""
 
     await callback.message.edit_text(
@@ -277,7 +277,7 @@ async def handle_alert_actions(callback: CallbackQuery):
             return
 
         store_names = [STORE_CONFIGS.get(s, {}).get("name", s) for s in alert.store_slugs]
-        cat = CATEGORIES.get(alert.product_category) if alert.product_category else None
+        cat = get_categories().get(alert.product_category) if alert.product_category else None
         cat_line = f"\U0001f4c2 {cat.emoji} {cat.name_az}\n" if cat else ""
         text = (
             f"\U0001f4ca Alert #{alert.id}\n\n"
@@ -1,4 +1,5 @@
 import math
+import time
 
 from aiogram import Router
 from aiogram.filters import Command
@@ -14,15 +15,20 @@ from app.backend.bot.keyboards import (
     no_results_keyboard,
     pagination_keyboard,
 )
+from app.backend.core.config import settings
 from app.backend.db.base import async_session_factory
 from app.backend.models.bot_activity import log_bot_activity
 from app.backend.models.user import User
-from app.backend.services.search_service import search_all_stores
+from app.backend.services.search_service import stream_search_stores
 
 router = Router()
 
 RESULTS_PER_PAGE = 5
 
+# Minimum seconds between progressive edits of the "Searching..." message,
+# to stay well under Telegram's per-chat edit limits.
+PROGRESS_EDIT_INTERVAL = 1.0
+
 
 class SearchFlow(StatesGroup):
     waiting_for_query = State()
@@ -50,6 +56,14 @@ def format_search_results(products, query: str, page: int = 1) -> str:
     return "\n".join(lines)
 
 
+async def _show_progress(wait_msg: Message, products, query: str) -> None:
+    text = "\u23f3 Axtar\u0131l\u0131r... / Searching...\n\n" + format_search_results(products, query)
+    try:
+        await wait_msg.edit_text(text)
+    except Exception:
+        pass
+
+
 async def _execute_search(message: Message, query: str, state: FSMContext | None = None):
     """Reusable search execution — used by cmd_search, SearchFlow, and fallback."""
     if len(query) < 2:
@@ -58,7 +72,22 @@ async def _execute_search(message: Message, query: str, state: FSMContext | None
 
     wait_msg = await message.answer("\u23f3 Axtar\u0131l\u0131r... / Searching...")
 
-    products, errors = await search_all_stores(query)
+    # Show results progressively as each store answers instead of waiting
+    # for the slowest one.
+    products = []
+    errors: list[str] = []
+    last_edit = 0.0
+    async for batch in stream_search_stores(query, latency_budget=settings.SEARCH_LATENCY_BUDGET_SECONDS):
+        if batch.error:
+            errors.append(batch.error)
+        if not batch.products:
+            continue
+        products.extend(batch.products)
+        products.sort(key=lambda p: p.price)
+        now = time.monotonic()
+        if now - last_edit >= PROGRESS_EDIT_INTERVAL:
+            last_edit = now
+            await _show_progress(wait_msg, products, query)
 
     # Log search activity
     try:
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
+    REDIS_SOCKET_TIMEOUT: float = 2.0
 
     # Celery
     CELERY_BROKER_URL: str = "redis://redis:6379/1"
@@ -25,10 +26,44 @@ class Settings(BaseSettings):
     # Scraping
     SCRAPER_REQUEST_DELAY: int = 2
     SCRAPER_TIMEOUT: int = 15
+    SCRAPER_MAX_CONCURRENCY_PER_STORE: int = 4
+    SCRAPER_HTTP2: bool = True
+    SCRAPER_MAX_CONNECTIONS_PER_STORE: int = 10
+    SCRAPER_MAX_KEEPALIVE_CONNECTIONS: int = 5
+    SCRAPER_KEEPALIVE_EXPIRY: float = 30.0
+    SCRAPER_BREAKER_FAILURE_THRESHOLD: int = 5
+    SCRAPER_BREAKER_WINDOW_SECONDS: int = 120
+    SCRAPER_BREAKER_OPEN_SECONDS: int = 60
+    SCRAPER_RATE_LIMIT_PER_SECOND: float = 2.0
+    SCRAPER_RATE_LIMIT_BURST: int = 5
+    SCRAPER_GRAPHQL_BATCH_SIZE: int = 10
     SCRAPER_USER_AGENT: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
+    # Record responses to this directory / replay them from the store simulator
+    SCRAPER_RECORD_DIR: str = ""
+    SCRAPER_SIMULATOR_URL: str = ""
+
+    # Product categories (optional JSON overrides, hot-reloaded)
+    CATEGORIES_FILE: str = ""
+    CATEGORIES_RELOAD_SECONDS: float = 10.0
+
+    # Search cache
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: int = 600
+    SEARCH_CACHE_STALE_SECONDS: int = 1800
+    SEARCH_SINGLE_FLIGHT_REDIS: bool = False
+    SEARCH_SINGLE_FLIGHT_WAIT_SECONDS: float = 30.0
+
+    # Search deadlines
+    SEARCH_TIMEOUT_MAX_SECONDS: float = 30.0
+    SEARCH_TIMEOUT_MIN_SECONDS: float = 5.0
+    SEARCH_TIMEOUT_P95_MULTIPLIER: float = 2.0
+    SEARCH_HEDGE_ENABLED: bool = False
+    SEARCH_LATENCY_BUDGET_SECONDS: float = 12.0
+    STORE_LATENCY_WINDOW: int = 200
+    STORE_LATENCY_MIN_SAMPLES: int = 20
 
     # App
     APP_ENV: str = "production"
@@ -40,6 +75,14 @@ class Settings(BaseSettings):
     FREE_TIER_MAX_ALERTS: int = 5
     PREMIUM_TIER_MAX_ALERTS: int = 50
     PRICE_CHECK_INTERVAL_HOURS: int = 4
+    PRICE_CHECK_CONCURRENCY: int = 8
+    PRICE_CHECK_TICK_MINUTES: int = 5
+    PRICE_CHECK_MIN_INTERVAL_MINUTES: int = 30
+    PRICE_CHECK_MAX_INTERVAL_HOURS: int = 12
+    PRICE_CHECK_TICK_LOCK_SECONDS: int = 1800
+    PRICE_HISTORY_CHANGES_ONLY: bool = True
+    PRICE_HISTORY_RETENTION_DAYS: int = 90
+    PRICE_PARTITIONS_AHEAD_MONTHS: int = 3
 
     # JWT Auth
     JWT_SECRET_KEY: str = "change-me-in-production"
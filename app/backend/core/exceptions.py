@@ -8,6 +8,13 @@ class ScraperError(UcuzBotError):
         super().__init__(f"[{store_slug}] {message}")
 
 
+class StoreUnavailable(ScraperError):
+    """Raised without contacting the store while its circuit breaker is open."""
+
+    def __init__(self, store_slug: str):
+        super().__init__(store_slug, "circuit open, store temporarily unavailable")
+
+
 class AlertLimitReached(UcuzBotError):
     def __init__(self, max_alerts: int):
         self.max_alerts = max_alerts
@@ -0,0 +1,44 @@
+"""Shared async Redis client (``REDIS_URL``) for caching and coordination.
+
+The client's connection pool is bound to the event loop it was created on,
+so a new client is created whenever the running loop changes.
+"""
+
+import asyncio
+
+from redis.asyncio import Redis
+
+from app.backend.core.config import settings
+
+# Compare-and-delete so a process only releases a lock it still owns.
+UNLOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_client: Redis | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_redis() -> Redis:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or loop is not _client_loop:
+        _client = Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_redis() -> None:
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -0,0 +1,33 @@
+"""In-process request coalescing.
+
+``SingleFlight.do(key, fn)`` runs ``fn()`` once per key at a time; callers
+arriving while a call for the same key is in flight await that call's
+result instead of starting their own.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    def __init__(self):
+        self._calls: dict[str, asyncio.Task[T]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        task = self._calls.get(key)
+        # A task left behind by a previous event loop can't be awaited here.
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        # Shield so one caller being cancelled (e.g. by a timeout) doesn't
+        # cancel the shared call for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
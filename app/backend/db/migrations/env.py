@@ -7,7 +7,16 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.backend.core.config import settings
 from app.backend.db.base import Base
-from app.backend.models import User, Store, Alert, PriceRecord  # noqa: F401
+from app.backend.models import (  # noqa: F401
+    User,
+    Store,
+    Alert,
+    Product,
+    PriceObservation,
+    AlertObservation,
+    ProductDailyPrice,
+    AlertDailyPrice,
+)
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.database_url)
@@ -0,0 +1,133 @@
+"""Replace per-alert price_records with shared products and price observations
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "products",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("store_slug", sa.String(50), nullable=False),
+        sa.Column("product_url", sa.Text(), nullable=False),
+        sa.Column("product_name", sa.String(1000), nullable=True),
+        sa.Column("image_url", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("store_slug", "product_url", name="uq_products_store_url"),
+    )
+
+    op.create_table(
+        "price_observations",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "product_id",
+            sa.Integer(),
+            sa.ForeignKey("products.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("observed_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index(
+        "idx_price_observations_product_id", "price_observations", ["product_id", "observed_at"]
+    )
+    op.create_index("idx_price_observations_observed_at", "price_observations", ["observed_at"])
+
+    op.create_table(
+        "alert_observations",
+        sa.Column(
+            "alert_id",
+            sa.Integer(),
+            sa.ForeignKey("alerts.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "observation_id",
+            sa.Integer(),
+            sa.ForeignKey("price_observations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+    )
+    op.create_index(
+        "idx_alert_observations_observation_id", "alert_observations", ["observation_id"]
+    )
+
+    # Backfill: one product per (store, url), one observation per product per
+    # check (rows written by the same check share scraped_at), and a link for
+    # every alert that saw it. Rows without a URL can't be identified and are
+    # dropped.
+    op.execute(
+        """
+        INSERT INTO products (store_slug, product_url, product_name, created_at, last_seen_at)
+        SELECT store_slug,
+               product_url,
+               (array_agg(product_name ORDER BY scraped_at DESC))[1],
+               min(scraped_at),
+               max(scraped_at)
+        FROM price_records
+        WHERE coalesce(product_url, '') <> ''
+        GROUP BY store_slug, product_url
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO price_observations (product_id, price, observed_at)
+        SELECT p.id, min(r.price), r.scraped_at
+        FROM price_records r
+        JOIN products p ON p.store_slug = r.store_slug AND p.product_url = r.product_url
+        GROUP BY p.id, r.scraped_at
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO alert_observations (alert_id, observation_id)
+        SELECT DISTINCT r.alert_id, o.id
+        FROM price_records r
+        JOIN products p ON p.store_slug = r.store_slug AND p.product_url = r.product_url
+        JOIN price_observations o ON o.product_id = p.id AND o.observed_at = r.scraped_at
+        """
+    )
+
+    op.drop_table("price_records")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "price_records",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("alert_id", sa.Integer(), sa.ForeignKey("alerts.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("store_slug", sa.String(50), nullable=False),
+        sa.Column("product_name", sa.String(1000), nullable=True),
+        sa.Column("price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("product_url", sa.Text(), nullable=True),
+        sa.Column("scraped_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("idx_price_records_alert_id", "price_records", ["alert_id"])
+    op.create_index("idx_price_records_scraped_at", "price_records", ["scraped_at"])
+
+    op.execute(
+        """
+        INSERT INTO price_records (alert_id, store_slug, product_name, price, product_url, scraped_at)
+        SELECT ao.alert_id, p.store_slug, p.product_name, o.price, p.product_url, o.observed_at
+        FROM alert_observations ao
+        JOIN price_observations o ON o.id = ao.observation_id
+        JOIN products p ON p.id = o.product_id
+        """
+    )
+
+    op.drop_table("alert_observations")
+    op.drop_table("price_observations")
+    op.drop_table("products")
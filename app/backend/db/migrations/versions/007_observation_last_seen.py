@@ -0,0 +1,28 @@
+"""Add last_seen_at to price_observations for change-only price history
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "price_observations",
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.execute("UPDATE price_observations SET last_seen_at = observed_at")
+
+
+def downgrade() -> None:
+    op.drop_column("price_observations", "last_seen_at")
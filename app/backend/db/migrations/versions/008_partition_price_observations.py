@@ -0,0 +1,178 @@
+"""Range-partition price_observations and alert_observations by month
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("price_observations", "alert_observations")
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partitions(first: date, last: date) -> None:
+    month = first
+    while month <= last:
+        upper = _add_months(month, 1)
+        for table in TABLES:
+            op.execute(
+                f"CREATE TABLE {table}_{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        month = upper
+
+
+def upgrade() -> None:
+    # Keep the id sequence (and so existing ids) for the new parent table.
+    op.execute("ALTER TABLE alert_observations RENAME TO alert_observations_old")
+    op.execute("ALTER TABLE price_observations RENAME TO price_observations_old")
+    op.execute("ALTER TABLE price_observations_old ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER SEQUENCE price_observations_id_seq OWNED BY NONE")
+    op.execute("ALTER INDEX price_observations_pkey RENAME TO price_observations_old_pkey")
+    op.execute("ALTER INDEX alert_observations_pkey RENAME TO alert_observations_old_pkey")
+    op.drop_index("idx_price_observations_product_id", table_name="price_observations_old")
+    op.drop_index("idx_price_observations_observed_at", table_name="price_observations_old")
+    op.drop_index("idx_alert_observations_observation_id", table_name="alert_observations_old")
+
+    # A partitioned table's primary key must include the partition key, so
+    # links carry observed_at and reference (id, observed_at).
+    op.execute(
+        """
+        CREATE TABLE price_observations (
+            id INTEGER NOT NULL DEFAULT nextval('price_observations_id_seq'),
+            product_id INTEGER NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+            price NUMERIC(10, 2) NOT NULL,
+            observed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            last_seen_at TIMESTAMPTZ DEFAULT now(),
+            PRIMARY KEY (id, observed_at)
+        ) PARTITION BY RANGE (observed_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE price_observations_id_seq OWNED BY price_observations.id")
+    op.create_index(
+        "idx_price_observations_product_id", "price_observations", ["product_id", "observed_at"]
+    )
+    op.create_index("idx_price_observations_observed_at", "price_observations", ["observed_at"])
+
+    op.execute(
+        """
+        CREATE TABLE alert_observations (
+            alert_id INTEGER NOT NULL REFERENCES alerts(id) ON DELETE CASCADE,
+            observation_id INTEGER NOT NULL,
+            observed_at TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (alert_id, observation_id, observed_at),
+            FOREIGN KEY (observation_id, observed_at)
+                REFERENCES price_observations (id, observed_at) ON DELETE CASCADE
+        ) PARTITION BY RANGE (observed_at)
+        """
+    )
+    op.create_index(
+        "idx_alert_observations_observation_id",
+        "alert_observations",
+        ["observation_id", "observed_at"],
+    )
+
+    conn = op.get_bind()
+    oldest = conn.execute(sa.text("SELECT min(observed_at) FROM price_observations_old")).scalar()
+    this_month = date.today().replace(day=1)
+    first = oldest.date().replace(day=1) if oldest is not None else this_month
+    _create_partitions(min(first, this_month), _add_months(this_month, MONTHS_AHEAD))
+    for table in TABLES:
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    op.execute(
+        """
+        INSERT INTO price_observations (id, product_id, price, observed_at, last_seen_at)
+        SELECT id, product_id, price, coalesce(observed_at, now()), last_seen_at
+        FROM price_observations_old
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO alert_observations (alert_id, observation_id, observed_at)
+        SELECT ao.alert_id, o.id, o.observed_at
+        FROM alert_observations_old ao
+        JOIN price_observations o ON o.id = ao.observation_id
+        """
+    )
+
+    op.drop_table("alert_observations_old")
+    op.drop_table("price_observations_old")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE alert_observations RENAME TO alert_observations_part")
+    op.execute("ALTER TABLE price_observations RENAME TO price_observations_part")
+    op.execute("ALTER TABLE price_observations_part ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER SEQUENCE price_observations_id_seq OWNED BY NONE")
+    op.execute("ALTER INDEX price_observations_pkey RENAME TO price_observations_part_pkey")
+    op.execute("ALTER INDEX alert_observations_pkey RENAME TO alert_observations_part_pkey")
+    op.drop_index("idx_price_observations_product_id", table_name="price_observations_part")
+    op.drop_index("idx_price_observations_observed_at", table_name="price_observations_part")
+    op.drop_index("idx_alert_observations_observation_id", table_name="alert_observations_part")
+
+    op.execute(
+        """
+        CREATE TABLE price_observations (
+            id INTEGER PRIMARY KEY DEFAULT nextval('price_observations_id_seq'),
+            product_id INTEGER NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+            price NUMERIC(10, 2) NOT NULL,
+            observed_at TIMESTAMPTZ DEFAULT now(),
+            last_seen_at TIMESTAMPTZ DEFAULT now()
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE price_observations_id_seq OWNED BY price_observations.id")
+    op.create_index(
+        "idx_price_observations_product_id", "price_observations", ["product_id", "observed_at"]
+    )
+    op.create_index("idx_price_observations_observed_at", "price_observations", ["observed_at"])
+    op.create_table(
+        "alert_observations",
+        sa.Column(
+            "alert_id",
+            sa.Integer(),
+            sa.ForeignKey("alerts.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "observation_id",
+            sa.Integer(),
+            sa.ForeignKey("price_observations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+    )
+    op.create_index(
+        "idx_alert_observations_observation_id", "alert_observations", ["observation_id"]
+    )
+
+    op.execute(
+        """
+        INSERT INTO price_observations (id, product_id, price, observed_at, last_seen_at)
+        SELECT id, product_id, price, observed_at, last_seen_at FROM price_observations_part
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO alert_observations (alert_id, observation_id)
+        SELECT DISTINCT alert_id, observation_id FROM alert_observations_part
+        """
+    )
+
+    op.execute("DROP TABLE alert_observations_part CASCADE")
+    op.execute("DROP TABLE price_observations_part CASCADE")
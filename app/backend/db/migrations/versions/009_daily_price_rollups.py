@@ -0,0 +1,94 @@
+"""Add daily price rollups per product and per alert
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rollup_columns() -> list[sa.Column]:
+    return [
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("min_price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("max_price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("first_price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("last_price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "product_daily_prices",
+        sa.Column(
+            "product_id",
+            sa.Integer(),
+            sa.ForeignKey("products.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        *_rollup_columns(),
+    )
+    op.create_table(
+        "alert_daily_prices",
+        sa.Column(
+            "alert_id",
+            sa.Integer(),
+            sa.ForeignKey("alerts.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        *_rollup_columns(),
+    )
+
+    # Backfill from the observations still retained. A change-only run only
+    # counts towards the day it started on.
+    op.execute(
+        """
+        INSERT INTO product_daily_prices
+            (product_id, day, min_price, max_price, first_price, last_price, count)
+        SELECT product_id,
+               (observed_at AT TIME ZONE 'UTC')::date,
+               min(price),
+               max(price),
+               (array_agg(price ORDER BY observed_at))[1],
+               (array_agg(price ORDER BY observed_at DESC))[1],
+               count(*)
+        FROM price_observations
+        GROUP BY product_id, (observed_at AT TIME ZONE 'UTC')::date
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO alert_daily_prices
+            (alert_id, day, min_price, max_price, first_price, last_price, count)
+        SELECT alert_id,
+               (observed_at AT TIME ZONE 'UTC')::date,
+               min(low),
+               max(low),
+               (array_agg(low ORDER BY observed_at))[1],
+               (array_agg(low ORDER BY observed_at DESC))[1],
+               count(*)
+        FROM (
+            SELECT ao.alert_id, o.observed_at, min(o.price) AS low
+            FROM alert_observations ao
+            JOIN price_observations o
+                ON o.id = ao.observation_id AND o.observed_at = ao.observed_at
+            GROUP BY ao.alert_id, o.observed_at
+        ) per_check
+        GROUP BY alert_id, (observed_at AT TIME ZONE 'UTC')::date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("alert_daily_prices")
+    op.drop_table("product_daily_prices")
@@ -0,0 +1,29 @@
+"""Index active alerts by last_checked_at
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_alerts_due",
+        "alerts",
+        ["last_checked_at"],
+        postgresql_where=sa.text("is_active AND NOT is_triggered"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_alerts_due", table_name="alerts")
@@ -0,0 +1,181 @@
+"""Monthly range partitions of the price history tables.
+
+``price_observations`` and ``alert_observations`` are partitioned by
+``observed_at``, one partition per calendar month named ``<table>_YYYY_MM``
+plus a ``<table>_default`` catch-all. Partitions are created
+``PRICE_PARTITIONS_AHEAD_MONTHS`` ahead by the daily cleanup task, and
+retention drops whole months instead of deleting rows.
+"""
+
+import re
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.backend.core.config import settings
+from app.backend.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Dropped in this order: links reference observations.
+PARTITIONED_TABLES = ("alert_observations", "price_observations")
+
+_MONTH_SUFFIX = re.compile(r"_(\d{4})_(\d{2})$")
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_{month:%Y_%m}"
+
+
+async def list_partitions(session: AsyncSession, table: str) -> dict[date, str]:
+    """Monthly partitions of *table* by first day of month."""
+    result = await session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    )
+    partitions = {}
+    for (name,) in result.all():
+        match = _MONTH_SUFFIX.search(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+async def _move_out_of_default(session: AsyncSession, month: date) -> int:
+    """Set aside the rows the DEFAULT partitions hold for *month*.
+
+    ``CREATE TABLE ... PARTITION OF`` fails while DEFAULT has rows in the
+    new range (e.g. after the cleanup task missed a few days), so they are
+    copied to temp tables and deleted here, then re-inserted by
+    :func:`_restore_from_default` once the partitions exist. Returns the
+    number of rows moved; with none, nothing is touched.
+    """
+    bounds = {"lower": month, "upper": add_months(month, 1)}
+    in_range = "observed_at >= :lower AND observed_at < :upper"
+    stray = 0
+    for table in PARTITIONED_TABLES:
+        stray += await session.scalar(
+            text(f"SELECT count(*) FROM {table}_default WHERE {in_range}"), bounds
+        )
+    if not stray:
+        return 0
+    # The whole month from both tables, links first: deleting an observation
+    # would cascade to links already sitting in a monthly partition.
+    for table in PARTITIONED_TABLES:
+        await session.execute(
+            text(f"CREATE TEMP TABLE moving_{table} ON COMMIT DROP AS SELECT * FROM {table} WHERE {in_range}"),
+            bounds,
+        )
+        await session.execute(text(f"DELETE FROM {table} WHERE {in_range}"), bounds)
+    return stray
+
+
+async def _restore_from_default(session: AsyncSession) -> None:
+    for table in reversed(PARTITIONED_TABLES):
+        await session.execute(text(f"INSERT INTO {table} SELECT * FROM moving_{table}"))
+        await session.execute(text(f"DROP TABLE moving_{table}"))
+
+
+async def ensure_partitions(session: AsyncSession, today: date | None = None) -> list[str]:
+    """Create any missing partitions from this month to the look-ahead.
+
+    Rows that already landed in DEFAULT for a new month are moved into its
+    partition.
+    """
+    this_month = (today or date.today()).replace(day=1)
+    existing = {table: await list_partitions(session, table) for table in PARTITIONED_TABLES}
+    created = []
+    for offset in range(settings.PRICE_PARTITIONS_AHEAD_MONTHS + 1):
+        month = add_months(this_month, offset)
+        # Observations first: links reference them.
+        missing = [table for table in reversed(PARTITIONED_TABLES) if month not in existing[table]]
+        if not missing:
+            continue
+        moved = await _move_out_of_default(session, month)
+        for table in missing:
+            name = partition_name(table, month)
+            await session.execute(text(
+                f"CREATE TABLE {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            ))
+            created.append(name)
+        if moved:
+            await _restore_from_default(session)
+            logger.warning("partition_default_rows_moved", month=month.isoformat(), rows=moved)
+    if created:
+        logger.info("partitions_created", partitions=created)
+    return created
+
+
+async def _carry_forward(
+    session: AsyncSession, partitions: list[str], boundary: date, cutoff: datetime
+) -> None:
+    """Copy still-current price runs out of the partitions about to be dropped.
+
+    With change-only history a run that started months ago can still be the
+    product's current price. It is re-inserted starting at *boundary* (with
+    its alert links) so dropping its original partition doesn't lose it.
+    """
+    source = " UNION ALL ".join(f"SELECT * FROM {name}" for name in partitions)
+    await session.execute(
+        text(
+            "CREATE TEMP TABLE carried_observations ON COMMIT DROP AS "
+            "SELECT id, observed_at, product_id, price, last_seen_at, "
+            "nextval('price_observations_id_seq') AS new_id "
+            f"FROM ({source}) expiring WHERE last_seen_at >= :cutoff"
+        ),
+        {"cutoff": cutoff},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO price_observations (id, product_id, price, observed_at, last_seen_at) "
+            "SELECT new_id, product_id, price, :boundary, last_seen_at FROM carried_observations"
+        ),
+        {"boundary": boundary},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO alert_observations (alert_id, observation_id, observed_at) "
+            "SELECT ao.alert_id, c.new_id, :boundary FROM alert_observations ao "
+            "JOIN carried_observations c "
+            "ON ao.observation_id = c.id AND ao.observed_at = c.observed_at"
+        ),
+        {"boundary": boundary},
+    )
+    await session.execute(text("DROP TABLE carried_observations"))
+
+
+async def drop_partitions_before(session: AsyncSession, cutoff: datetime) -> list[str]:
+    """Detach and drop every monthly partition that ends before *cutoff*."""
+    boundary = cutoff.date().replace(day=1)
+    expired: dict[str, list[str]] = {}
+    for table in PARTITIONED_TABLES:
+        partitions = await list_partitions(session, table)
+        expired[table] = [
+            name for month, name in sorted(partitions.items()) if add_months(month, 1) <= boundary
+        ]
+    if not any(expired.values()):
+        return []
+
+    if expired["price_observations"]:
+        await _carry_forward(session, expired["price_observations"], boundary, cutoff)
+
+    dropped = []
+    for table in PARTITIONED_TABLES:
+        for name in expired[table]:
+            await session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            await session.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    logger.info("partitions_dropped", partitions=dropped)
+    return dropped
@@ -79,6 +79,15 @@ async def startup_event():
     logger.info("stores_seeded")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    from app.backend.core.redis_client import close_redis
+    from app.backend.scrapers.client_pool import client_pool
+
+    await client_pool.aclose()
+    await close_redis()
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.backend.main:app",
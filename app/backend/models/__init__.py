@@ -1,8 +1,21 @@
 from app.backend.models.user import User
 from app.backend.models.store import Store
 from app.backend.models.alert import Alert
-from app.backend.models.price_record import PriceRecord
+from app.backend.models.product import Product
+from app.backend.models.price_observation import AlertObservation, PriceObservation
+from app.backend.models.daily_price import AlertDailyPrice, ProductDailyPrice
 from app.backend.models.push_subscription import PushSubscription
 from app.backend.models.bot_activity import BotActivity
 
-__all__ = ["User", "Store", "Alert", "PriceRecord", "PushSubscription", "BotActivity"]
+__all__ = [
+    "User",
+    "Store",
+    "Alert",
+    "Product",
+    "PriceObservation",
+    "AlertObservation",
+    "ProductDailyPrice",
+    "AlertDailyPrice",
+    "PushSubscription",
+    "BotActivity",
+]
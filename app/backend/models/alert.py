@@ -32,6 +32,8 @@ class Alert(Base):
     target_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     store_slugs: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False)
     product_category: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # Listings to re-read directly instead of re-running the search.
+    pinned_product_urls: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_triggered: Mapped[bool] = mapped_column(Boolean, default=False)
     triggered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -46,11 +48,14 @@ class Alert(Base):
 
     user: Mapped["User | None"] = relationship(back_populates="alerts")  # noqa: F821
     push_subscription: Mapped["PushSubscription | None"] = relationship()  # noqa: F821
-    price_records: Mapped[list["PriceRecord"]] = relationship(  # noqa: F821
-        back_populates="alert", cascade="all, delete-orphan"
-    )
 
     __table_args__ = (
         Index("idx_alerts_user_id", "user_id"),
         Index("idx_alerts_active", "is_active", postgresql_where=(is_active == True)),  # noqa: E712
+        # The scheduler's "checked before" scan.
+        Index(
+            "idx_alerts_due",
+            "last_checked_at",
+            postgresql_where=((is_active == True) & (is_triggered == False)),  # noqa: E712
+        ),
     )
@@ -0,0 +1,42 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, ForeignKey, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.backend.db.base import Base
+
+
+class _DailyPriceColumns:
+    """Daily rollup of a price series, maintained on every check."""
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    min_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    max_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    first_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    last_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+
+class ProductDailyPrice(_DailyPriceColumns, Base):
+    """A product's price per day (UTC)."""
+
+    __tablename__ = "product_daily_prices"
+
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"), primary_key=True
+    )
+
+
+class AlertDailyPrice(_DailyPriceColumns, Base):
+    """An alert's lowest price per check, rolled up per day (UTC).
+
+    Kept after the raw observations are dropped, so long-range alert
+    charts don't depend on the retention window.
+    """
+
+    __tablename__ = "alert_daily_prices"
+
+    alert_id: Mapped[int] = mapped_column(
+        ForeignKey("alerts.id", ondelete="CASCADE"), primary_key=True
+    )
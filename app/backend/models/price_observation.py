@@ -0,0 +1,69 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    Numeric,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.backend.db.base import Base
+
+
+class PriceObservation(Base):
+    """A product's price, shared by every alert whose checks returned it.
+
+    With ``PRICE_HISTORY_CHANGES_ONLY`` a row covers a whole run of checks
+    that saw the same price: ``observed_at`` is the first, ``last_seen_at``
+    the latest. The table is range-partitioned by month on ``observed_at``
+    (see ``db/partitions.py``), which is why it is part of the primary key.
+    """
+
+    __tablename__ = "price_observations"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    observed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
+    )
+    product_id: Mapped[int] = mapped_column(ForeignKey("products.id", ondelete="CASCADE"))
+    price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    product: Mapped["Product"] = relationship()  # noqa: F821
+
+    __table_args__ = (
+        Index("idx_price_observations_product_id", "product_id", "observed_at"),
+        Index("idx_price_observations_observed_at", "observed_at"),
+        {"postgresql_partition_by": "RANGE (observed_at)"},
+    )
+
+
+class AlertObservation(Base):
+    """Links an alert to the observations its checks returned.
+
+    Partitioned like ``price_observations`` so a month of links is dropped
+    together with the month of observations it points at.
+    """
+
+    __tablename__ = "alert_observations"
+
+    alert_id: Mapped[int] = mapped_column(
+        ForeignKey("alerts.id", ondelete="CASCADE"), primary_key=True
+    )
+    observation_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["observation_id", "observed_at"],
+            ["price_observations.id", "price_observations.observed_at"],
+            ondelete="CASCADE",
+        ),
+        Index("idx_alert_observations_observation_id", "observation_id", "observed_at"),
+        {"postgresql_partition_by": "RANGE (observed_at)"},
+    )
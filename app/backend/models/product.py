@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.backend.db.base import Base
+
+
+class Product(Base):
+    """A store listing, shared by every alert whose searches return it."""
+
+    __tablename__ = "products"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    store_slug: Mapped[str] = mapped_column(String(50), nullable=False)
+    product_url: Mapped[str] = mapped_column(Text, nullable=False)
+    product_name: Mapped[str | None] = mapped_column(String(1000))
+    image_url: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("store_slug", "product_url", name="uq_products_store_url"),
+    )
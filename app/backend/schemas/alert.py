@@ -1,10 +1,13 @@
 from datetime import datetime
 from decimal import Decimal
+
 from pydantic import BaseModel, Field, field_validator
 
+from app.backend.scrapers.registry import scraper_registry
 from app.shared.constants import StoreSlug
 
 VALID_STORE_SLUGS = {s.value for s in StoreSlug}
+MAX_PINNED_PRODUCTS = 10
 
 
 class AlertCreate(BaseModel):
@@ -14,6 +17,7 @@ class AlertCreate(BaseModel):
     store_slugs: list[str] = Field(min_length=1)
     product_category: str | None = None
     push_endpoint: str | None = None
+    pinned_product_urls: list[str] | None = Field(default=None, max_length=MAX_PINNED_PRODUCTS)
 
     @field_validator("store_slugs")
     @classmethod
@@ -23,6 +27,16 @@ class AlertCreate(BaseModel):
             raise ValueError(f"Invalid store slugs: {', '.join(invalid)}")
         return v
 
+    @field_validator("pinned_product_urls")
+    @classmethod
+    def validate_pinned_product_urls(cls, v: list[str] | None) -> list[str] | None:
+        if not v:
+            return None
+        invalid = [url for url in v if scraper_registry.for_url(url) is None]
+        if invalid:
+            raise ValueError(f"Not a product URL of a supported store: {', '.join(invalid)}")
+        return list(dict.fromkeys(v))
+
 
 class AlertResponse(BaseModel):
     id: int
@@ -30,6 +44,7 @@ class AlertResponse(BaseModel):
     target_price: Decimal
     store_slugs: list[str]
     product_category: str | None = None
+    pinned_product_urls: list[str] | None = None
     is_active: bool
     is_triggered: bool
     triggered_at: datetime | None
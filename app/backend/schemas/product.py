@@ -1,19 +1,40 @@
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime
 from pydantic import BaseModel
 
 
 class PriceRecordResponse(BaseModel):
     id: int
+    product_id: int | None = None
     store_slug: str
     product_name: str | None
     price: Decimal
     product_url: str | None
     scraped_at: datetime
+    last_seen_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
+
+
+class PricePointResponse(BaseModel):
+    day: date
+    min_price: Decimal
+    max_price: Decimal
+    first_price: Decimal
+    last_price: Decimal
+    count: int
 
     model_config = {"from_attributes": True}
 
 
 class PriceHistoryResponse(BaseModel):
     alert_id: int
-    records: list[PriceRecordResponse]
+    resolution: str = "raw"
+    records: list[PriceRecordResponse] = []
+    points: list[PricePointResponse] = []
+
+
+class ProductPriceHistoryResponse(BaseModel):
+    product_id: int
+    resolution: str
+    points: list[PricePointResponse]
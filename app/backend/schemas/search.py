@@ -1,5 +1,7 @@
 from decimal import Decimal
 from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -19,3 +21,19 @@ class SearchResponse(BaseModel):
     results: list[SearchResult]
     errors: list[str] = []
     searched_at: datetime
+
+
+class StoreSearchEvent(BaseModel):
+    store_slug: str
+    results: list[SearchResult]
+    error: str | None = None
+    # "unavailable": open breaker, timed out or over the latency budget
+    # (try again later); "failed": the store answered with an error.
+    status: Literal["ok", "unavailable", "failed"] = "ok"
+
+
+class SearchDoneEvent(BaseModel):
+    query: str
+    total_results: int
+    errors: list[str] = []
+    searched_at: datetime
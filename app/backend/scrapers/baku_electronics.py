@@ -10,6 +10,33 @@ from app.backend.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_NEXT_DATA_MARKER = 'id="__NEXT_DATA__"'
+
+
+def extract_next_data(html: str) -> dict | None:
+    """Slice the ``__NEXT_DATA__`` JSON straight out of the page.
+
+    Next.js renders it as one ``<script id="__NEXT_DATA__" ...>`` tag, so
+    finding the marker and the closing tag avoids parsing the whole
+    document. Returns ``None`` when the tag isn't where it is expected.
+    """
+    marker = html.find(_NEXT_DATA_MARKER)
+    if marker == -1:
+        return None
+    start = html.find(">", marker) + 1
+    end = html.find("</script>", start)
+    if start == 0 or end == -1:
+        return None
+    return json.loads(html[start:end])
+
+
+def _extract_next_data_soup(html: str) -> dict | None:
+    soup = BeautifulSoup(html, "lxml")
+    next_data_tag = soup.find("script", id="__NEXT_DATA__")
+    if not next_data_tag or not next_data_tag.string:
+        return None
+    return json.loads(next_data_tag.string)
+
 
 @scraper_registry.register
 class BakuElectronicsScraper(BaseScraper):
@@ -17,28 +44,66 @@ class BakuElectronicsScraper(BaseScraper):
     store_name = "Baku Electronics"
     base_url = "https://www.bakuelectronics.az"
 
+    # Next.js build id, learned from the last rendered page. Shared by all
+    # instances in the process; cleared when the data route stops accepting it.
+    _build_id: str | None = None
+
     async def search(self, query: str, max_results: int = 10) -> list[ScrapedProduct]:
+        build_id = type(self)._build_id
+        if build_id:
+            try:
+                return await self._search_data_route(build_id, query, max_results)
+            except Exception as e:
+                # Usually a new deployment: the old build id 404s. The HTML
+                # page below carries the new one.
+                logger.info("baku_electronics_data_route_failed", build_id=build_id, error=str(e))
+                type(self)._build_id = None
         return await self._search_nextjs(query, max_results)
 
+    async def _search_data_route(
+        self, build_id: str, query: str, max_results: int
+    ) -> list[ScrapedProduct]:
+        # The page's getServerSideProps as JSON: same products, no HTML.
+        # Not retried — any failure falls straight back to the HTML page.
+        client = await self._get_client()
+        response = await client.get(
+            f"{self.base_url}/_next/data/{build_id}/axtaris-neticesi.json",
+            params={"name": query},
+            headers={"Accept": "application/json", "x-nextjs-data": "1"},
+        )
+        response.raise_for_status()
+        page_props = response.json().get("pageProps")
+        if page_props is None:
+            raise ValueError("no pageProps in data route response")
+        return self._parse_products(page_props, max_results)
+
     async def _search_nextjs(self, query: str, max_results: int) -> list[ScrapedProduct]:
         # Baku Electronics uses Next.js. Search results page is at /axtaris-neticesi?name=...
         # Product data is embedded in __NEXT_DATA__ script tag.
         url = f"{self.base_url}/axtaris-neticesi?name={quote_plus(query)}"
         html = await self._get_page(url)
-        soup = BeautifulSoup(html, "lxml")
+        return self.parse_results(html, max_results)
 
-        next_data_tag = soup.find("script", id="__NEXT_DATA__")
-        if not next_data_tag or not next_data_tag.string:
+    def parse_results(self, html: str, max_results: int = 10) -> list[ScrapedProduct]:
+        try:
+            data = extract_next_data(html)
+        except ValueError as e:
+            logger.warning("baku_electronics_fast_parse_failed", error=str(e))
+            data = None
+        if data is None:
+            data = _extract_next_data_soup(html)
+        if data is None:
             logger.warning("baku_electronics_no_next_data")
             return []
 
-        data = json.loads(next_data_tag.string)
-        products_wrapper = (
-            data.get("props", {})
-            .get("pageProps", {})
-            .get("products", {})
-            .get("products", {})
-        )
+        build_id = data.get("buildId")
+        if build_id and build_id != type(self)._build_id:
+            logger.info("baku_electronics_build_id", build_id=build_id)
+            type(self)._build_id = build_id
+        return self._parse_products(data.get("props", {}).get("pageProps", {}), max_results)
+
+    def _parse_products(self, page_props: dict, max_results: int) -> list[ScrapedProduct]:
+        products_wrapper = page_props.get("products", {}).get("products", {})
 
         items = products_wrapper.get("items", [])
         if not items:
@@ -1,19 +1,46 @@
 import asyncio
+import json
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
+from urllib.parse import urlsplit
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.backend.core.config import settings
+from app.backend.core.exceptions import StoreUnavailable
 from app.backend.core.logging import get_logger
-from app.shared.constants import DEFAULT_HEADERS
+from app.backend.scrapers.circuit_breaker import circuit_breaker
+from app.backend.scrapers.client_pool import client_pool
 
 logger = get_logger(__name__)
 
+_JSON_LD = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+_META = re.compile(r'<meta\s[^>]*>', re.IGNORECASE)
+_META_ATTR = re.compile(r'(property|name|content)=["\']([^"\']*)["\']', re.IGNORECASE)
+
+
+def _host(url: str) -> str:
+    host = urlsplit(url).hostname or ""
+    return host.removeprefix("www.")
+
+
+def _ld_products(node):
+    """Every schema.org Product in a JSON-LD document."""
+    if isinstance(node, list):
+        for child in node:
+            yield from _ld_products(child)
+    elif isinstance(node, dict):
+        types = node.get("@type")
+        if types == "Product" or (isinstance(types, list) and "Product" in types):
+            yield node
+        yield from _ld_products(node.get("@graph", []))
+
 
 @dataclass
 class ScrapedProduct:
@@ -32,29 +59,105 @@ class BaseScraper(ABC):
     store_name: str
     base_url: str
 
-    def __init__(self):
-        self._client: httpx.AsyncClient | None = None
-
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=settings.SCRAPER_TIMEOUT,
-                headers={
-                    "User-Agent": settings.SCRAPER_USER_AGENT,
-                    **DEFAULT_HEADERS,
-                },
-                follow_redirects=True,
-            )
-        return self._client
+        # Shared keep-alive client for this store; owned by client_pool.
+        return client_pool.get(self.store_slug)
 
     async def close(self) -> None:
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        # Pooled clients outlive a single search and are closed by the
+        # process that owns the event loop (see client_pool.aclose).
+        pass
+
+    # True when search_many answers several queries in one request.
+    supports_batch_search: bool = False
 
     @abstractmethod
     async def search(self, query: str, max_results: int = 10) -> list[ScrapedProduct]:
         ...
 
+    @classmethod
+    def owns_url(cls, url: str) -> bool:
+        return _host(url) == _host(cls.base_url)
+
+    async def fetch_product(self, url: str) -> ScrapedProduct | None:
+        """Current name and price of the product at *url* (one of this
+        store's product pages), or ``None`` if it is gone (404/410) or has
+        no price.
+
+        The default reads the page's schema.org JSON-LD ``Product`` or its
+        ``product:price:amount`` meta tags with regular expressions — no
+        HTML tree. Stores with a cheaper product endpoint override this.
+        """
+        # One attempt: the caller runs this under a deadline and retries
+        # on the next check, and a 404/410 means the listing is gone.
+        client = await self._get_client()
+        response = await client.get(url)
+        if response.status_code in (404, 410):
+            return None
+        response.raise_for_status()
+        return self._product_from_page(url, response.text)
+
+    def _product_from_page(self, url: str, html: str) -> ScrapedProduct | None:
+        for block in _JSON_LD.findall(html):
+            try:
+                document = json.loads(block)
+            except ValueError:
+                continue
+            for node in _ld_products(document):
+                offers = node.get("offers") or {}
+                if isinstance(offers, list):
+                    offers = offers[0] if offers else {}
+                price = offers.get("price", offers.get("lowPrice"))
+                if price in (None, ""):
+                    continue
+                image = node.get("image")
+                if isinstance(image, list):
+                    image = image[0] if image else None
+                return ScrapedProduct(
+                    product_name=node.get("name", ""),
+                    price=self._parse_price(str(price)),
+                    product_url=url,
+                    store_slug=self.store_slug,
+                    store_name=self.store_name,
+                    image_url=image if isinstance(image, str) else None,
+                    in_stock="OutOfStock" not in str(offers.get("availability", "")),
+                )
+
+        meta = {}
+        for tag in _META.findall(html):
+            attrs = {k.lower(): v for k, v in _META_ATTR.findall(tag)}
+            key = attrs.get("property") or attrs.get("name")
+            if key and "content" in attrs:
+                meta.setdefault(key, attrs["content"])
+        price = meta.get("product:price:amount") or meta.get("og:price:amount")
+        if not price:
+            return None
+        return ScrapedProduct(
+            product_name=meta.get("og:title", ""),
+            price=self._parse_price(price),
+            product_url=url,
+            store_slug=self.store_slug,
+            store_name=self.store_name,
+            image_url=meta.get("og:image"),
+            in_stock=meta.get("product:availability", "in stock").lower() not in ("out of stock", "oos"),
+        )
+
+    async def search_many(
+        self, queries: list[str], max_results: int = 10
+    ) -> dict[str, list[ScrapedProduct]]:
+        """Results for each of *queries*; queries that failed are missing.
+
+        Stores with a batch API override this to answer all of them in one
+        request (see ``supports_batch_search``).
+        """
+        results = {}
+        for query in queries:
+            try:
+                results[query] = await self.search(query, max_results)
+            except Exception as e:
+                logger.error("scraper_search_failed", store=self.store_slug, query=query, error=str(e))
+        return results
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=2, min=2, max=8), reraise=True)
     async def _get_page(self, url: str) -> str:
         client = await self._get_client()
@@ -114,13 +217,36 @@ class BaseScraper(ABC):
         except InvalidOperation as e:
             raise ValueError(f"Cannot parse price: {price_str}") from e
 
-    async def safe_search(self, query: str, max_results: int = 10) -> list[ScrapedProduct]:
+    async def guarded_search(self, query: str, max_results: int = 10) -> list[ScrapedProduct]:
+        """:meth:`search` behind the store's circuit breaker.
+
+        Raises :class:`StoreUnavailable` without any network traffic while
+        the breaker is open; otherwise records the outcome with the breaker
+        and re-raises scraper errors.
+        """
+        if not await circuit_breaker.allow_request(self.store_slug):
+            logger.info("scraper_circuit_open", store=self.store_slug, query=query)
+            raise StoreUnavailable(self.store_slug)
         try:
             results = await self.search(query, max_results)
-            logger.info("scraper_search_success", store=self.store_slug, query=query, results=len(results))
-            return results
         except Exception as e:
             logger.error("scraper_search_failed", store=self.store_slug, query=query, error=str(e))
+            await circuit_breaker.record_failure(self.store_slug)
+            raise
+        logger.info("scraper_search_success", store=self.store_slug, query=query, results=len(results))
+        await circuit_breaker.record_success(self.store_slug)
+        return results
+
+    async def safe_search(self, query: str, max_results: int = 10) -> list[ScrapedProduct]:
+        """:meth:`guarded_search`, swallowing scraper errors as an empty result.
+
+        :class:`StoreUnavailable` still propagates, so callers can report it.
+        """
+        try:
+            return await self.guarded_search(query, max_results)
+        except StoreUnavailable:
+            raise
+        except Exception:
             return []
         finally:
             await self.close()
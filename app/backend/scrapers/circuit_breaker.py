@@ -0,0 +1,102 @@
+"""Per-store circuit breaker shared across processes through Redis.
+
+States, derived from three keys per store:
+
+- **closed** — normal operation. Failures are counted in a sliding
+  ``SCRAPER_BREAKER_WINDOW_SECONDS`` window; reaching
+  ``SCRAPER_BREAKER_FAILURE_THRESHOLD`` opens the breaker.
+- **open** — the ``:open`` key exists (it expires after
+  ``SCRAPER_BREAKER_OPEN_SECONDS``). Every search fails fast without
+  touching the store.
+- **half_open** — ``:open`` has expired but ``:tripped`` is still set. One
+  process at a time wins the ``:probe`` key and sends a real request;
+  success closes the breaker, failure opens it again.
+
+Because the keys live in Redis, an outage noticed by the Celery worker also
+short-circuits the API and the bot. If Redis itself is unreachable the
+breaker stays out of the way (always closed).
+"""
+
+from app.backend.core.config import settings
+from app.backend.core.logging import get_logger
+from app.backend.core.redis_client import get_redis
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "breaker"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _key(store_slug: str, part: str) -> str:
+    return f"{KEY_PREFIX}:{store_slug}:{part}"
+
+
+class CircuitBreaker:
+    async def state(self, store_slug: str) -> str:
+        try:
+            is_open, tripped = await get_redis().mget(
+                _key(store_slug, "open"), _key(store_slug, "tripped")
+            )
+        except Exception as e:
+            logger.warning("circuit_breaker_unavailable", store=store_slug, error=str(e))
+            return CLOSED
+        if is_open:
+            return OPEN
+        if tripped:
+            return HALF_OPEN
+        return CLOSED
+
+    async def allow_request(self, store_slug: str) -> bool:
+        state = await self.state(store_slug)
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        # Half-open: let a single probe through across all processes.
+        try:
+            return bool(await get_redis().set(
+                _key(store_slug, "probe"), "1", nx=True, ex=int(settings.SEARCH_TIMEOUT_MAX_SECONDS)
+            ))
+        except Exception:
+            return True
+
+    async def record_success(self, store_slug: str) -> None:
+        try:
+            removed = await get_redis().delete(
+                _key(store_slug, "failures"), _key(store_slug, "tripped"), _key(store_slug, "probe")
+            )
+        except Exception:
+            return
+        if removed:
+            logger.info("circuit_breaker_reset", store=store_slug)
+
+    async def record_failure(self, store_slug: str) -> None:
+        redis = get_redis()
+        try:
+            if await redis.exists(_key(store_slug, "tripped")):
+                # A failed half-open probe re-opens immediately.
+                await self._open(store_slug)
+                return
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.incr(_key(store_slug, "failures"))
+                pipe.expire(_key(store_slug, "failures"), settings.SCRAPER_BREAKER_WINDOW_SECONDS, nx=True)
+                failures, _ = await pipe.execute()
+            if failures >= settings.SCRAPER_BREAKER_FAILURE_THRESHOLD:
+                await self._open(store_slug)
+        except Exception as e:
+            logger.warning("circuit_breaker_unavailable", store=store_slug, error=str(e))
+
+    async def _open(self, store_slug: str) -> None:
+        redis = get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(_key(store_slug, "open"), "1", ex=settings.SCRAPER_BREAKER_OPEN_SECONDS)
+            pipe.set(_key(store_slug, "tripped"), "1")
+            pipe.delete(_key(store_slug, "failures"), _key(store_slug, "probe"))
+            await pipe.execute()
+        logger.warning("circuit_breaker_opened", store=store_slug)
+
+
+circuit_breaker = CircuitBreaker()
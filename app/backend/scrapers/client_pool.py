@@ -0,0 +1,96 @@
+"""Process-wide pool of long-lived httpx clients, one per store.
+
+Scrapers used to open and close their own ``httpx.AsyncClient`` on every
+search, paying a fresh TCP + TLS handshake to each store every time. The
+pool keeps one keep-alive (and, when ``h2`` is installed, HTTP/2) client per
+store slug for the life of the process, and every request it sends is
+gated by the store's rate limiter. Owners of the event loop — the
+FastAPI app, the bot and the Celery worker — call :meth:`ClientPool.aclose`
+on shutdown.
+
+``SCRAPER_RECORD_DIR`` and ``SCRAPER_SIMULATOR_URL`` wrap the transport to
+record responses or replay them from the store simulator (see
+:mod:`app.backend.scrapers.recording`).
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import httpx
+
+from app.backend.core.config import settings
+from app.backend.core.logging import get_logger
+from app.backend.scrapers.rate_limiter import rate_limiter
+from app.backend.scrapers.recording import RecordingTransport, SimulatorTransport
+from app.shared.constants import DEFAULT_HEADERS
+
+logger = get_logger(__name__)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class ClientPool:
+    def __init__(self):
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self, store_slug: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Connections belong to the loop that opened them; clients from a
+            # previous (closed) loop can't be reused or even closed cleanly.
+            self._clients.clear()
+            self._loop = loop
+
+        client = self._clients.get(store_slug)
+        if client is None or client.is_closed:
+            client = self._clients[store_slug] = self._create_client(store_slug)
+        return client
+
+    @staticmethod
+    def _create_transport(store_slug: str) -> httpx.AsyncBaseTransport:
+        transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+            http2=settings.SCRAPER_HTTP2 and _HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.SCRAPER_MAX_CONNECTIONS_PER_STORE,
+                max_keepalive_connections=settings.SCRAPER_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.SCRAPER_KEEPALIVE_EXPIRY,
+            ),
+        )
+        if settings.SCRAPER_SIMULATOR_URL:
+            transport = SimulatorTransport(transport, store_slug, settings.SCRAPER_SIMULATOR_URL)
+        if settings.SCRAPER_RECORD_DIR:
+            transport = RecordingTransport(transport, store_slug, Path(settings.SCRAPER_RECORD_DIR))
+        return transport
+
+    @classmethod
+    def _create_client(cls, store_slug: str) -> httpx.AsyncClient:
+        async def _rate_limit(request: httpx.Request) -> None:
+            await rate_limiter.acquire(store_slug)
+
+        return httpx.AsyncClient(
+            timeout=settings.SCRAPER_TIMEOUT,
+            headers={
+                "User-Agent": settings.SCRAPER_USER_AGENT,
+                **DEFAULT_HEADERS,
+            },
+            follow_redirects=True,
+            transport=cls._create_transport(store_slug),
+            # Every request to the store, retries and hedges included, takes
+            # a token from the store's shared bucket first. The simulator is
+            # local, so replays aren't throttled.
+            event_hooks={"request": [] if settings.SCRAPER_SIMULATOR_URL else [_rate_limit]},
+        )
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.items())
+        self._clients.clear()
+        for store_slug, client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("client_pool_close_failed", store=store_slug, error=str(e))
+
+
+client_pool = ClientPool()
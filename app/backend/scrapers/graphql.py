@@ -0,0 +1,63 @@
+"""Pack several searches into one GraphQL request with field aliases.
+
+A store search is a single root field, e.g.
+``products(search: $query, pageSize: $limit) { ... }``. For a batch the
+field is repeated under the aliases ``q0``, ``q1``, ... each with its own
+query variable, so N searches cost one round trip::
+
+    query Search($q0: String!, $q1: String!, $limit: Int!) {
+        q0: products(search: $q0, pageSize: $limit) { ... }
+        q1: products(search: $q1, pageSize: $limit) { ... }
+    }
+
+Queries travel as variables, so they need no escaping.
+"""
+
+from app.backend.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def alias(index: int) -> str:
+    return f"q{index}"
+
+
+def build_batch_query(field: str, arguments: str, selection: str, count: int) -> str:
+    """Document running *field* once per search.
+
+    *arguments* is the field's argument list written with the ``$query`` and
+    ``$limit`` placeholders; *selection* is its selection set (without braces).
+    """
+    variables = ", ".join(f"${alias(i)}: String!" for i in range(count))
+    fields = "\n".join(
+        f"    {alias(i)}: {field}({arguments.replace('$query', '$' + alias(i))}) {{{selection}}}"
+        for i in range(count)
+    )
+    return f"query Search({variables}, $limit: Int!) {{\n{fields}\n}}"
+
+
+def batch_variables(queries: list[str], limit: int) -> dict:
+    return {**{alias(i): q for i, q in enumerate(queries)}, "limit": limit}
+
+
+def split_batch_response(payload: dict, queries: list[str], store_slug: str) -> dict[str, dict]:
+    """Each query's field result by query.
+
+    A search that errored comes back as ``null`` (with an entry in
+    ``errors``) while the others still succeed; it is left out.
+    """
+    data = payload.get("data") or {}
+    results = {}
+    for i, query in enumerate(queries):
+        result = data.get(alias(i))
+        if result is not None:
+            results[query] = result
+    if len(results) < len(queries) or payload.get("errors"):
+        logger.warning(
+            "graphql_batch_partial",
+            store=store_slug,
+            queries=len(queries),
+            answered=len(results),
+            errors=[e.get("message") for e in payload.get("errors") or []][:3],
+        )
+    return results
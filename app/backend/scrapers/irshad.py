@@ -1,5 +1,7 @@
+from dataclasses import dataclass
 from urllib.parse import quote_plus
 
+import lxml.html
 from bs4 import BeautifulSoup
 
 from app.backend.scrapers.base import BaseScraper, ScrapedProduct
@@ -9,6 +11,38 @@ from app.backend.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _class_xpath(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath equivalents of the BeautifulSoup selectors in _extract_cards_soup.
+_GRID_XPATH = "//*[@id='productGridItems']"
+_ITEMS_XPATH = f".//*[{_class_xpath('product')}]"
+_NAME_XPATH = f".//a[{_class_xpath('product__name')}]"
+_PRICE_XPATHS = tuple(
+    f".//*[{_class_xpath(cls)}]" for cls in ("new-price", "old-price", "product__price__current")
+)
+_IMG_XPATH = f".//*[{_class_xpath('product__img')}]//img"
+
+
+@dataclass
+class _Card:
+    name: str
+    href: str
+    price_text: str | None
+    image_url: str | None
+
+
+def _text(el) -> str:
+    # Same as BeautifulSoup's get_text(strip=True).
+    return "".join(s.strip() for s in el.itertext())
+
+
+def _first(el, xpath: str):
+    found = el.xpath(xpath)
+    return found[0] if found else None
+
+
 @scraper_registry.register
 class IrshadScraper(BaseScraper):
     store_slug = "irshad"
@@ -20,51 +54,102 @@ class IrshadScraper(BaseScraper):
         # This endpoint returns HTML with product cards in #productGridItems
         url = f"{self.base_url}/az/products/list?q={quote_plus(query)}"
         html = await self._get_page(url)
-        soup = BeautifulSoup(html, "lxml")
+        return self.parse_results(html, max_results)
 
-        grid = soup.select_one("#productGridItems")
-        if not grid:
+    def parse_results(self, html: str, max_results: int = 10) -> list[ScrapedProduct]:
+        try:
+            cards = self._extract_cards(html, max_results)
+        except Exception as e:
+            logger.warning("irshad_fast_parse_failed", error=str(e))
+            cards = None
+        if cards is None:
+            cards = self._extract_cards_soup(html, max_results)
+        if cards is None:
             logger.warning("irshad_no_product_grid")
             return []
 
         products = []
+        for card in cards:
+            if card.price_text is None:
+                continue
+            try:
+                price = self._parse_price(card.price_text)
+            except ValueError:
+                continue
+
+            href = card.href
+            product_url = href if href.startswith("http") else f"{self.base_url}{href}"
+            products.append(ScrapedProduct(
+                product_name=card.name,
+                price=price,
+                product_url=product_url,
+                store_slug=self.store_slug,
+                store_name=self.store_name,
+                image_url=card.image_url,
+            ))
+
+        return products
+
+    @staticmethod
+    def _extract_cards(html: str, max_results: int) -> list[_Card] | None:
+        """Pull the product cards out with lxml and XPath only, without
+        building a BeautifulSoup tree over the whole page."""
+        grid = _first(lxml.html.fromstring(html), _GRID_XPATH)
+        if grid is None:
+            return None
+
+        cards = []
+        for item in grid.xpath(_ITEMS_XPATH)[:max_results]:
+            name_el = _first(item, _NAME_XPATH)
+            if name_el is None:
+                continue
+
+            # Price: prefer .new-price (discounted), fall back to .old-price
+            price_el = None
+            for xpath in _PRICE_XPATHS:
+                price_el = _first(item, xpath)
+                if price_el is not None:
+                    break
+
+            img_el = _first(item, _IMG_XPATH)
+            cards.append(_Card(
+                name=_text(name_el),
+                href=name_el.get("href", ""),
+                price_text=_text(price_el) if price_el is not None else None,
+                image_url=(img_el.get("src") or img_el.get("data-src")) if img_el is not None else None,
+            ))
+        return cards
+
+    @staticmethod
+    def _extract_cards_soup(html: str, max_results: int) -> list[_Card] | None:
+        soup = BeautifulSoup(html, "lxml")
+
+        grid = soup.select_one("#productGridItems")
+        if not grid:
+            return None
+
+        cards = []
         items = grid.select(".product")
         for item in items[:max_results]:
             name_el = item.select_one("a.product__name")
             if not name_el:
                 continue
 
-            name = name_el.get_text(strip=True)
-            href = name_el.get("href", "")
-            product_url = href if href.startswith("http") else f"{self.base_url}{href}"
-
-            # Price: prefer .new-price (discounted), fall back to .old-price
             price_el = item.select_one(".new-price")
             if not price_el:
                 price_el = item.select_one(".old-price")
             if not price_el:
                 price_el = item.select_one(".product__price__current")
 
-            if not price_el:
-                continue
-
-            try:
-                price = self._parse_price(price_el.get_text(strip=True))
-            except ValueError:
-                continue
-
             img_el = item.select_one(".product__img img")
             image_url = None
             if img_el:
                 image_url = img_el.get("src") or img_el.get("data-src")
 
-            products.append(ScrapedProduct(
-                product_name=name,
-                price=price,
-                product_url=product_url,
-                store_slug=self.store_slug,
-                store_name=self.store_name,
+            cards.append(_Card(
+                name=name_el.get_text(strip=True),
+                href=name_el.get("href", ""),
+                price_text=price_el.get_text(strip=True) if price_el else None,
                 image_url=image_url,
             ))
-
-        return products
+        return cards
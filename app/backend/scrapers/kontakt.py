@@ -1,6 +1,9 @@
+from dataclasses import replace
 from decimal import Decimal
+from urllib.parse import urlsplit
 
 from app.backend.scrapers.base import BaseScraper, ScrapedProduct
+from app.backend.scrapers.graphql import batch_variables, build_batch_query, split_batch_response
 from app.backend.scrapers.registry import scraper_registry
 from app.backend.core.logging import get_logger
 
@@ -13,40 +16,61 @@ class KontaktScraper(BaseScraper):
     store_name = "Kontakt Home"
     base_url = "https://kontakt.az"
 
-    GRAPHQL_QUERY = """
-    {
-        products(search: "%s", pageSize: %d) {
-            items {
-                name
-                url_key
-                price_range {
-                    minimum_price {
-                        final_price {
-                            value
-                            currency
-                        }
+    supports_batch_search = True
+
+    GRAPHQL_ARGUMENTS = "search: $query, pageSize: $limit"
+    GRAPHQL_SELECTION = """
+        items {
+            name
+            url_key
+            price_range {
+                minimum_price {
+                    final_price {
+                        value
+                        currency
                     }
                 }
-                small_image {
-                    url
-                }
             }
-            total_count
+            small_image {
+                url
+            }
         }
-    }
+        total_count
     """
 
     async def search(self, query: str, max_results: int = 10) -> list[ScrapedProduct]:
         return await self._search_graphql(query, max_results)
 
+    async def fetch_product(self, url: str) -> ScrapedProduct | None:
+        # Product pages are /<url_key>.html; look the key up in GraphQL
+        # instead of downloading the page.
+        url_key = urlsplit(url).path.strip("/").removesuffix(".html")
+        found = await self._graphql("filter: {url_key: {eq: $query}}, pageSize: $limit", [url_key], 1)
+        # A delisted product comes back as no items (or, on some keys, a
+        # null field): the pin is dead, not the store.
+        products = self._parse_items(found[url_key], 1) if url_key in found else []
+        return replace(products[0], product_url=url) if products else None
+
+    async def search_many(
+        self, queries: list[str], max_results: int = 10
+    ) -> dict[str, list[ScrapedProduct]]:
+        """All *queries* in one GraphQL request, one aliased field each."""
+        found = await self._graphql(self.GRAPHQL_ARGUMENTS, queries, max_results)
+        return {query: self._parse_items(result, max_results) for query, result in found.items()}
+
     async def _search_graphql(self, query: str, max_results: int) -> list[ScrapedProduct]:
+        found = await self._graphql(self.GRAPHQL_ARGUMENTS, [query], max_results)
+        # A null field (logged by split_batch_response) reads as no results.
+        return self._parse_items(found[query], max_results) if query in found else []
+
+    async def _graphql(self, arguments: str, queries: list[str], limit: int) -> dict[str, dict]:
+        """Run the products field once per query (see scrapers.graphql)."""
         client = await self._get_client()
-        safe_query = query.replace('"', '\\"')
-        graphql_query = self.GRAPHQL_QUERY % (safe_query, max_results)
+        graphql_query = build_batch_query("products", arguments, self.GRAPHQL_SELECTION, len(queries))
 
         response = await client.post(
             f"{self.base_url}/graphql",
-            json={"query": graphql_query},
+            json={"query": graphql_query, "variables": batch_variables(queries, limit)},
             headers={
                 "Content-Type": "application/json",
                 "Accept": "application/json",
@@ -61,10 +85,11 @@ class KontaktScraper(BaseScraper):
             },
         )
         response.raise_for_status()
-        data = response.json()
+        return split_batch_response(response.json(), queries, self.store_slug)
 
+    def _parse_items(self, result: dict, max_results: int) -> list[ScrapedProduct]:
         products = []
-        items = data.get("data", {}).get("products", {}).get("items", [])
+        items = result.get("items") or []
         for item in items[:max_results]:
             name = item.get("name", "")
             url_key = item.get("url_key", "")
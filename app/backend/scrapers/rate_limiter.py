@@ -0,0 +1,75 @@
+"""Distributed token-bucket rate limiter per store, backed by Redis.
+
+Every outgoing request to a store takes one token from that store's bucket
+(the pooled httpx client for the store calls :meth:`acquire` from a request
+hook), so the limit holds across the API, the bot and any number of Celery
+workers. Rates come from ``rate_limit`` in ``STORE_CONFIGS``, falling back
+to ``SCRAPER_RATE_LIMIT_PER_SECOND`` / ``SCRAPER_RATE_LIMIT_BURST``.
+
+If Redis is unreachable requests are let through unthrottled rather than
+failing the search.
+"""
+
+import asyncio
+
+from app.backend.core.config import settings
+from app.backend.core.logging import get_logger
+from app.backend.core.redis_client import get_redis
+from app.shared.constants import STORE_CONFIGS
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "ratelimit"
+
+# Refill the bucket from the elapsed time (Redis server clock, so all hosts
+# agree), then take a token if one is available. Returns 0 when a token was
+# taken, otherwise the milliseconds until the next token is due.
+_TAKE_TOKEN_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call("TIME")
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - ts) * rate)
+
+local wait_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait_ms = math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("PEXPIRE", KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return wait_ms
+"""
+
+
+def _limits(store_slug: str) -> tuple[float, int]:
+    config = STORE_CONFIGS.get(store_slug, {}).get("rate_limit", {})
+    return (
+        config.get("per_second", settings.SCRAPER_RATE_LIMIT_PER_SECOND),
+        config.get("burst", settings.SCRAPER_RATE_LIMIT_BURST),
+    )
+
+
+class StoreRateLimiter:
+    async def acquire(self, store_slug: str) -> None:
+        """Wait until a request to *store_slug* is allowed."""
+        rate, burst = _limits(store_slug)
+        key = f"{KEY_PREFIX}:{store_slug}"
+        while True:
+            try:
+                wait_ms = await get_redis().eval(_TAKE_TOKEN_SCRIPT, 1, key, rate, burst)
+            except Exception as e:
+                logger.warning("rate_limiter_unavailable", store=store_slug, error=str(e))
+                return
+            if not wait_ms:
+                return
+            logger.debug("rate_limited", store=store_slug, wait_ms=wait_ms)
+            await asyncio.sleep(wait_ms / 1000)
+
+
+rate_limiter = StoreRateLimiter()
@@ -0,0 +1,138 @@
+"""Record store responses to disk and replay them through a local simulator.
+
+With ``SCRAPER_RECORD_DIR`` set, every response a scraper receives is saved
+as a JSON "cassette" under ``<dir>/<store_slug>/<key>.json``, where the key
+hashes the request method, URL and body. ``benchmarks/store_simulator.py``
+serves a directory of cassettes back over HTTP, and with
+``SCRAPER_SIMULATOR_URL`` set the pooled clients send every store request
+there instead of to the live site, so searches can be benchmarked offline
+and reproducibly.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import httpx
+
+from app.backend.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Headers the simulator uses to identify the original request.
+ORIGINAL_URL_HEADER = "X-Simulator-Url"
+STORE_HEADER = "X-Simulator-Store"
+
+# The body is stored decoded, so these no longer describe it.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def request_key(method: str, url: str, body: bytes = b"") -> str:
+    digest = hashlib.sha256(f"{method.upper()} {url}\n".encode() + body)
+    return digest.hexdigest()[:24]
+
+
+def cassette_path(root: Path, store_slug: str, key: str) -> Path:
+    return root / store_slug / f"{key}.json"
+
+
+def load_cassettes(root: Path) -> dict[str, dict]:
+    """Every cassette under *root*, by request key."""
+    cassettes = {}
+    for path in root.glob("*/*.json"):
+        cassette = json.loads(path.read_text(encoding="utf-8"))
+        cassettes[cassette["key"]] = cassette
+    return cassettes
+
+
+def cassette_response(cassette: dict) -> tuple[int, dict[str, str], bytes]:
+    """Status, headers and body to replay for *cassette*."""
+    body = cassette["body"].encode(cassette.get("encoding") or "utf-8")
+    return cassette["status"], cassette["headers"], body
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests through to *transport* and save each response."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, store_slug: str, root: Path):
+        self._transport = transport
+        self._store_slug = store_slug
+        self._root = root
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        start = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        # Read through a Response bound to the request so the body is decoded.
+        received = httpx.Response(
+            response.status_code, headers=response.headers, stream=response.stream, request=request
+        )
+        try:
+            content = await received.aread()
+        finally:
+            await received.aclose()
+        elapsed = time.perf_counter() - start
+
+        headers = {k: v for k, v in received.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        key = request_key(request.method, str(request.url), body)
+        cassette = {
+            "key": key,
+            "store_slug": self._store_slug,
+            "method": request.method,
+            "url": str(request.url),
+            "request_body": body.decode("utf-8", errors="replace"),
+            "status": received.status_code,
+            "headers": headers,
+            "encoding": received.encoding,
+            "body": received.text,
+            "elapsed": round(elapsed, 4),
+        }
+        path = cassette_path(self._root, self._store_slug, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(cassette, ensure_ascii=False, indent=2), encoding="utf-8")
+            logger.debug("scraper_response_recorded", store=self._store_slug, url=str(request.url))
+        except OSError as e:
+            logger.warning("scraper_record_failed", store=self._store_slug, error=str(e))
+
+        return httpx.Response(
+            received.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class SimulatorTransport(httpx.AsyncBaseTransport):
+    """Send every request to the store simulator instead of the live site.
+
+    The path is kept under ``/<store_slug>`` for readable simulator logs; the
+    simulator matches cassettes on the original URL, passed in a header.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, store_slug: str, simulator_url: str):
+        self._transport = transport
+        self._store_slug = store_slug
+        self._simulator = httpx.URL(simulator_url.rstrip("/"))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = self._simulator.copy_with(
+            path=f"{self._simulator.path.rstrip('/')}/{self._store_slug}{request.url.path}",
+            query=request.url.query,
+        )
+        headers = httpx.Headers(request.headers)
+        headers["Host"] = url.netloc.decode("ascii")
+        headers[ORIGINAL_URL_HEADER] = str(request.url)
+        headers[STORE_HEADER] = self._store_slug
+        replay = httpx.Request(
+            request.method, url, headers=headers, stream=request.stream, extensions=request.extensions
+        )
+        return await self._transport.handle_async_request(replay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -22,6 +22,10 @@ class ScraperRegistry:
         self._ensure_discovered()
         return dict(self._scrapers)
 
+    def for_url(self, url: str) -> type[BaseScraper] | None:
+        """The scraper for the store whose site *url* is on."""
+        return next((cls for cls in self.get_all().values() if cls.owns_url(url)), None)
+
     def create_instance(self, store_slug: str) -> BaseScraper | None:
         cls = self.get(store_slug)
         if cls:
@@ -36,7 +40,10 @@ class ScraperRegistry:
     def _discover(self) -> None:
         package_path = Path(__file__).parent
         for _, module_name, _ in pkgutil.iter_modules([str(package_path)]):
-            if module_name in ("base", "registry", "__init__"):
+            if module_name in (
+                "base", "registry", "client_pool", "circuit_breaker", "graphql",
+                "rate_limiter", "recording", "__init__",
+            ):
                 continue
             importlib.import_module(f"app.backend.scrapers.{module_name}")
 
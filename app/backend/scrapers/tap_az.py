@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from app.backend.scrapers.base import BaseScraper, ScrapedProduct
+from app.backend.scrapers.graphql import batch_variables, build_batch_query, split_batch_response
 from app.backend.scrapers.registry import scraper_registry
 from app.backend.core.logging import get_logger
 
@@ -14,24 +15,23 @@ class TapAzScraper(BaseScraper):
     base_url = "https://tap.az"
 
     GRAPHQL_URL = "https://tap.az/graphql"
-    GRAPHQL_QUERY = """
-    {
-        ads(keywords: "%s", first: %d, source: DESKTOP) {
-            nodes {
+    supports_batch_search = True
+
+    GRAPHQL_ARGUMENTS = "keywords: $query, first: $limit, source: DESKTOP"
+    GRAPHQL_SELECTION = """
+        nodes {
+            id
+            title
+            price
+            path
+            region
+            photo {
+                url
+            }
+            shop {
                 id
-                title
-                price
-                path
-                region
-                photo {
-                    url
-                }
-                shop {
-                    id
-                }
             }
         }
-    }
     """
 
     @staticmethod
@@ -42,25 +42,41 @@ class TapAzScraper(BaseScraper):
         return matched >= len(query_words) * 0.6
 
     async def search(self, query: str, max_results: int = 10) -> list[ScrapedProduct]:
+        found = await self._search_graphql_batch([query], max_results)
+        # A null field (logged by split_batch_response) reads as no results.
+        return self._parse_nodes(found[query], query, max_results) if query in found else []
+
+    async def search_many(
+        self, queries: list[str], max_results: int = 10
+    ) -> dict[str, list[ScrapedProduct]]:
+        """All *queries* in one GraphQL request, one aliased field each."""
+        found = await self._search_graphql_batch(queries, max_results)
+        return {
+            query: self._parse_nodes(result, query, max_results) for query, result in found.items()
+        }
+
+    async def _search_graphql_batch(self, queries: list[str], max_results: int) -> dict[str, dict]:
         client = await self._get_client()
-        safe_query = query.replace('"', '\\"')
         # Fetch extra results to compensate for filtering
         fetch_count = max_results * 3
-        graphql_query = self.GRAPHQL_QUERY % (safe_query, fetch_count)
+        graphql_query = build_batch_query(
+            "ads", self.GRAPHQL_ARGUMENTS, self.GRAPHQL_SELECTION, len(queries)
+        )
 
         response = await client.post(
             self.GRAPHQL_URL,
-            json={"query": graphql_query},
+            json={"query": graphql_query, "variables": batch_variables(queries, fetch_count)},
             headers={
                 "Content-Type": "application/json",
                 "Accept": "application/json",
             },
         )
         response.raise_for_status()
-        data = response.json()
+        return split_batch_response(response.json(), queries, self.store_slug)
 
+    def _parse_nodes(self, result: dict, query: str, max_results: int) -> list[ScrapedProduct]:
         products = []
-        nodes = data.get("data", {}).get("ads", {}).get("nodes", [])
+        nodes = result.get("nodes") or []
         for node in nodes:
             title = node.get("title", "")
             if not title:
@@ -1,6 +1,7 @@
+from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.backend.core.exceptions import AlertNotFound, DuplicateAlert
@@ -46,6 +47,7 @@ async def create_alert(
     target_price: Decimal,
     store_slugs: list[str],
     product_category: str | None = None,
+    pinned_product_urls: list[str] | None = None,
 ) -> Alert:
     existing = await _find_duplicate_alert(session, user_id=user.id, search_query=search_query)
     if existing:
@@ -57,6 +59,7 @@ async def create_alert(
         target_price=target_price,
         store_slugs=store_slugs,
         product_category=product_category,
+        pinned_product_urls=pinned_product_urls,
     )
     session.add(alert)
     await session.flush()
@@ -71,6 +74,7 @@ async def create_alert_for_push(
     target_price: Decimal,
     store_slugs: list[str],
     product_category: str | None = None,
+    pinned_product_urls: list[str] | None = None,
 ) -> Alert:
     if push_sub.user_id:
         existing = await _find_duplicate_alert(session, user_id=push_sub.user_id, search_query=search_query)
@@ -88,6 +92,7 @@ async def create_alert_for_push(
         target_price=target_price,
         store_slugs=store_slugs,
         product_category=product_category,
+        pinned_product_urls=pinned_product_urls,
     )
     session.add(alert)
     await session.flush()
@@ -127,6 +132,18 @@ async def get_all_active_alerts(session: AsyncSession) -> list[Alert]:
     return list(result.scalars().all())
 
 
+async def get_active_alerts_checked_before(session: AsyncSession, before: datetime) -> list[Alert]:
+    """Active alerts never checked or last checked before *before*."""
+    result = await session.execute(
+        select(Alert).where(
+            Alert.is_active == True,  # noqa: E712
+            Alert.is_triggered == False,  # noqa: E712
+            or_(Alert.last_checked_at.is_(None), Alert.last_checked_at < before),
+        )
+    )
+    return list(result.scalars().all())
+
+
 async def delete_alert(session: AsyncSession, alert_id: int, telegram_id: int) -> None:
     result = await session.execute(
         select(Alert)
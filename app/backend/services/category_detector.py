@@ -3,11 +3,26 @@
 Detects product categories from search queries so that post-scrape
 relevance filtering can hard-exclude irrelevant products (e.g. phone
 cases when the user is searching for an actual phone).
+
+Each category's trigger keywords are compiled with
+:func:`~app.backend.services.relevance.compile_words`, the same trie regex
+that matches exclude words, so a query is scanned once per category however
+many keywords it has. Category definitions can be extended or overridden from the JSON
+file named by ``CATEGORIES_FILE``; it is re-read when it changes, without a
+restart.
 """
 
+import json
+import os
+import re
+import time
 from dataclasses import dataclass, field
 
-from app.backend.services.relevance import ACCESSORY_WORDS
+from app.backend.core.config import settings
+from app.backend.core.logging import get_logger
+from app.backend.services.relevance import ACCESSORY_WORDS, compile_words
+
+logger = get_logger(__name__)
 
 
 @dataclass(frozen=True)
@@ -17,6 +32,24 @@ class ProductCategory:
     emoji: str
     trigger_keywords: tuple[str, ...] = ()
     exclude_words: frozenset[str] = field(default_factory=frozenset)
+    # exclude_words compiled once, so excluding a product is one regex pass.
+    exclude_pattern: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    # trigger_keywords in a lookahead, so overlapping keywords all match.
+    trigger_pattern: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        pattern = compile_words(self.exclude_words) if self.exclude_words else None
+        object.__setattr__(self, "exclude_pattern", pattern)
+        trigger = None
+        if self.trigger_keywords:
+            trigger = re.compile(f"(?=({compile_words(frozenset(self.trigger_keywords)).pattern}))")
+        object.__setattr__(self, "trigger_pattern", trigger)
+
+    def longest_trigger(self, text: str) -> int:
+        """Length of the longest trigger keyword in *text* (0 if none)."""
+        if self.trigger_pattern is None:
+            return 0
+        return max((len(m[1]) for m in self.trigger_pattern.finditer(text)), default=0)
 
 
 # ── Extra domain words to exclude per category ──
@@ -33,7 +66,7 @@ _ACCESSORY_WORDS_NO_HEADPHONES = ACCESSORY_WORDS - _HEADPHONE_WORDS
 
 # ── Category registry ──
 
-CATEGORIES: dict[str, ProductCategory] = {
+_BUILTIN_CATEGORIES: dict[str, ProductCategory] = {
     "phone": ProductCategory(
         slug="phone",
         name_az="Telefon",
@@ -121,6 +154,88 @@ CATEGORIES: dict[str, ProductCategory] = {
 }
 
 
+# Reloads mutate this dict in place, so modules that imported it see updates.
+CATEGORIES: dict[str, ProductCategory] = dict(_BUILTIN_CATEGORIES)
+
+
+_file_mtime: float | None = None
+_next_reload_check = 0.0
+
+
+def load_categories(path: str) -> dict[str, ProductCategory]:
+    """Built-in categories merged with the overrides in JSON file *path*.
+
+    The file maps slugs to objects with any of ``name_az``, ``emoji``,
+    ``trigger_keywords`` (replaces the built-in list), ``extra_exclude_words``
+    (added to the exclude set) and, for new slugs, ``exclude_accessories``
+    (default true: exclude ``ACCESSORY_WORDS``).
+    """
+    with open(path, encoding="utf-8") as f:
+        overrides = json.load(f)
+
+    categories = dict(_BUILTIN_CATEGORIES)
+    for slug, spec in overrides.items():
+        base = categories.get(slug)
+        if base is not None:
+            exclude = base.exclude_words
+        else:
+            exclude = ACCESSORY_WORDS if spec.get("exclude_accessories", True) else frozenset()
+        categories[slug] = ProductCategory(
+            slug=slug,
+            name_az=spec.get("name_az", base.name_az if base else slug),
+            emoji=spec.get("emoji", base.emoji if base else ""),
+            trigger_keywords=tuple(
+                kw.lower() for kw in spec.get("trigger_keywords", base.trigger_keywords if base else ())
+            ),
+            exclude_words=exclude | frozenset(w.lower() for w in spec.get("extra_exclude_words", ())),
+        )
+    return categories
+
+
+def reload_categories(categories: dict[str, ProductCategory] | None = None) -> None:
+    """Swap in new category definitions.
+
+    Without *categories*, re-reads ``CATEGORIES_FILE`` (or restores the
+    built-ins if none is configured).
+    """
+    global _file_mtime
+    if categories is None:
+        path = settings.CATEGORIES_FILE
+        if path:
+            _file_mtime = os.stat(path).st_mtime
+            categories = load_categories(path)
+        else:
+            categories = dict(_BUILTIN_CATEGORIES)
+
+    CATEGORIES.clear()
+    CATEGORIES.update(categories)
+    logger.info("categories_reloaded", categories=len(categories))
+
+
+def _reload_if_changed() -> None:
+    """Pick up edits to ``CATEGORIES_FILE``, checking at most every
+    ``CATEGORIES_RELOAD_SECONDS``."""
+    global _next_reload_check
+    path = settings.CATEGORIES_FILE
+    now = time.monotonic()
+    if not path or now < _next_reload_check:
+        return
+    _next_reload_check = now + settings.CATEGORIES_RELOAD_SECONDS
+    try:
+        if os.stat(path).st_mtime != _file_mtime:
+            reload_categories()
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        logger.warning("categories_reload_failed", path=path, error=str(e))
+
+
+def get_categories() -> dict[str, ProductCategory]:
+    """The current category definitions, re-read first if ``CATEGORIES_FILE``
+    changed. Use this rather than ``CATEGORIES`` in long-running processes
+    (e.g. Celery workers) that never call :func:`detect_categories`."""
+    _reload_if_changed()
+    return CATEGORIES
+
+
 def detect_categories(query: str) -> list[ProductCategory]:
     """Detect matching product categories from a search query.
 
@@ -129,28 +244,14 @@ def detect_categories(query: str) -> list[ProductCategory]:
     - ``accessory`` (always)
     - ``all`` (always)
 
-    Longer / more-specific trigger keywords are checked first so that
+    Longer / more-specific trigger keywords rank first so that
     e.g. "galaxy tab" matches *tablet* before "galaxy" could match *phone*.
     """
-    query_lower = query.lower()
-
-    # Build (keyword, category) pairs sorted by keyword length descending
-    # so longer/more-specific patterns are matched first.
-    keyword_pairs: list[tuple[str, ProductCategory]] = []
-    for cat in CATEGORIES.values():
-        for kw in cat.trigger_keywords:
-            keyword_pairs.append((kw, cat))
-    keyword_pairs.sort(key=lambda pair: len(pair[0]), reverse=True)
-
-    detected: list[ProductCategory] = []
-    seen_slugs: set[str] = set()
-
-    for kw, cat in keyword_pairs:
-        if cat.slug in seen_slugs:
-            continue
-        if kw in query_lower:
-            detected.append(cat)
-            seen_slugs.add(cat.slug)
+    _reload_if_changed()
+    text = query.lower()
+    # Longest matching keyword first; ties keep registry order.
+    matches = [(category.longest_trigger(text), category) for category in CATEGORIES.values()]
+    detected = [category for length, category in sorted(matches, key=lambda m: -m[0]) if length]
 
     # Fallback when nothing detected
     if not detected:
@@ -0,0 +1,129 @@
+"""Incremental price-check scheduling.
+
+Instead of re-checking every alert at once every few hours, Celery beat runs
+a short tick every ``PRICE_CHECK_TICK_MINUTES`` and only the alerts that are
+*due* get checked. Each alert has its own check interval derived from
+``PRICE_CHECK_INTERVAL_HOURS``:
+
+- shorter when ``lowest_price_found`` is close to ``target_price`` or the
+  lowest price has recently been volatile;
+- longer when it is stable and far from the target.
+
+The number of alerts per tick is capped at roughly the steady-state share
+(the sum of tick / interval over the active alerts, with some headroom for
+catching up), so load stays flat instead of spiking. Only alerts last
+checked longer ago than the shortest possible interval are loaded.
+"""
+
+import math
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import Row, func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.backend.core.config import settings
+from app.backend.models.alert import Alert
+from app.backend.models.daily_price import AlertDailyPrice
+from app.backend.services.alert_service import get_active_alerts_checked_before
+
+VOLATILITY_LOOKBACK = timedelta(days=7)
+VOLATILITY_MIN_DAYS = 2
+
+# Headroom over the steady-state per-tick share so overdue alerts catch up.
+_TICK_CATCH_UP_FACTOR = 2
+
+
+def check_interval(alert: Alert, volatility: float | None) -> timedelta:
+    """How often *alert* should be checked.
+
+    *volatility* is the coefficient of variation of the alert's lowest
+    price over the lookback window (``None`` if too little history).
+    """
+    factor = 1.0
+
+    if alert.lowest_price_found is not None and alert.target_price > 0:
+        gap = float((alert.lowest_price_found - alert.target_price) / alert.target_price)
+        if gap <= 0.05:
+            factor *= 0.25
+        elif gap <= 0.15:
+            factor *= 0.5
+        elif gap > 0.5:
+            factor *= 2.0
+
+    if volatility is not None:
+        if volatility >= 0.05:
+            factor *= 0.5
+        elif volatility < 0.005:
+            factor *= 2.0
+
+    interval = timedelta(hours=settings.PRICE_CHECK_INTERVAL_HOURS) * factor
+    return min(
+        timedelta(hours=settings.PRICE_CHECK_MAX_INTERVAL_HOURS),
+        max(timedelta(minutes=settings.PRICE_CHECK_MIN_INTERVAL_MINUTES), interval),
+    )
+
+
+async def get_price_volatility(session: AsyncSession, since: date) -> dict[int, float]:
+    """Coefficient of variation of each alert's lowest price since *since*.
+
+    Reads the alert's daily rollups (each day's min and max), so a tick
+    costs a few rows per alert instead of a scan of a week of observations,
+    and reads the same whether history is recorded on every check or only
+    on changes. An alert needs ``VOLATILITY_MIN_DAYS`` days of rollups
+    before it counts.
+    """
+    daily = union_all(
+        select(AlertDailyPrice.alert_id, AlertDailyPrice.day, AlertDailyPrice.min_price.label("price"))
+        .where(AlertDailyPrice.day >= since),
+        select(AlertDailyPrice.alert_id, AlertDailyPrice.day, AlertDailyPrice.max_price.label("price"))
+        .where(AlertDailyPrice.day >= since),
+    ).subquery()
+    result = await session.execute(
+        select(daily.c.alert_id, func.stddev_pop(daily.c.price) / func.avg(daily.c.price))
+        .group_by(daily.c.alert_id)
+        .having(func.count(func.distinct(daily.c.day)) >= VOLATILITY_MIN_DAYS)
+    )
+    return {alert_id: float(cv) for alert_id, cv in result.all() if cv is not None}
+
+
+def _priority(alert: Alert, interval: timedelta, now: datetime) -> float:
+    """How overdue an alert is, as a multiple of its interval."""
+    if alert.last_checked_at is None:
+        return math.inf
+    return (now - alert.last_checked_at) / interval
+
+
+async def get_active_alert_prices(session: AsyncSession) -> list[Row]:
+    """``(id, target_price, lowest_price_found)`` of every active alert,
+    enough for :func:`check_interval` without loading whole alerts."""
+    result = await session.execute(
+        select(Alert.id, Alert.target_price, Alert.lowest_price_found)
+        .where(Alert.is_active == True, Alert.is_triggered == False)  # noqa: E712
+    )
+    return list(result.all())
+
+
+async def get_due_alerts(session: AsyncSession, now: datetime | None = None) -> list[Alert]:
+    """Active alerts due for a check this tick, most overdue first."""
+    now = now or datetime.now(timezone.utc)
+    prices = await get_active_alert_prices(session)
+    if not prices:
+        return []
+
+    volatility = await get_price_volatility(session, (now - VOLATILITY_LOOKBACK).date())
+
+    tick = timedelta(minutes=settings.PRICE_CHECK_TICK_MINUTES)
+    steady_share = sum(tick / check_interval(row, volatility.get(row.id)) for row in prices)
+    limit = max(1, math.ceil(steady_share * _TICK_CATCH_UP_FACTOR))
+
+    # Nothing checked within the shortest possible interval can be due.
+    candidates = await get_active_alerts_checked_before(
+        session, now - timedelta(minutes=settings.PRICE_CHECK_MIN_INTERVAL_MINUTES)
+    )
+    due: list[tuple[float, Alert]] = []
+    for alert in candidates:
+        priority = _priority(alert, check_interval(alert, volatility.get(alert.id)), now)
+        if priority >= 1:
+            due.append((priority, alert))
+    due.sort(key=lambda pair: pair[0], reverse=True)
+    return [alert for _, alert in due[:limit]]
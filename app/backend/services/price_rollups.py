@@ -0,0 +1,136 @@
+"""Daily price rollups and chart-sized price history.
+
+Every check upserts one row per product and one per alert for the current
+UTC day (min, max, first, last price and number of checks), so a chart over
+months reads a few hundred rollup rows instead of every observation.
+Coarser resolutions aggregate the daily rows, and :func:`lttb` can
+downsample a series to a fixed number of points.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.backend.models.daily_price import AlertDailyPrice, ProductDailyPrice
+
+
+@dataclass
+class PricePoint:
+    day: date
+    min_price: Decimal
+    max_price: Decimal
+    first_price: Decimal
+    last_price: Decimal
+    count: int
+
+
+async def record_daily_prices(
+    session: AsyncSession,
+    model: type[ProductDailyPrice] | type[AlertDailyPrice],
+    prices: dict[int, Decimal],
+    day: date,
+) -> None:
+    """Fold one check's price per key (product or alert id) into *day*'s rollup."""
+    if not prices:
+        return
+    key = model.product_id if model is ProductDailyPrice else model.alert_id
+    # Sorted so concurrent checks lock shared rollup rows in the same order.
+    stmt = pg_insert(model).values([
+        {
+            key.key: key_id,
+            "day": day,
+            "min_price": price,
+            "max_price": price,
+            "first_price": price,
+            "last_price": price,
+            "count": 1,
+        }
+        for key_id, price in sorted(prices.items())
+    ])
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[key, model.day],
+            set_={
+                "min_price": func.least(model.min_price, stmt.excluded.min_price),
+                "max_price": func.greatest(model.max_price, stmt.excluded.max_price),
+                "last_price": stmt.excluded.last_price,
+                "count": model.count + 1,
+            },
+        )
+    )
+
+
+async def get_daily_prices(
+    session: AsyncSession,
+    model: type[ProductDailyPrice] | type[AlertDailyPrice],
+    key_id: int,
+    start: date | None = None,
+    end: date | None = None,
+    resolution: str = "day",
+) -> list[PricePoint]:
+    """Rollups for one product or alert, oldest first, at *resolution*."""
+    key = model.product_id if model is ProductDailyPrice else model.alert_id
+    if resolution == "day":
+        bucket = model.day
+    else:
+        bucket = cast(func.date_trunc(resolution, model.day), Date)
+
+    stmt = (
+        select(
+            bucket.label("day"),
+            func.min(model.min_price),
+            func.max(model.max_price),
+            array_agg(aggregate_order_by(model.first_price, model.day))[1],
+            array_agg(aggregate_order_by(model.last_price, model.day.desc()))[1],
+            func.sum(model.count),
+        )
+        .where(key == key_id)
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+    if start is not None:
+        stmt = stmt.where(model.day >= start)
+    if end is not None:
+        stmt = stmt.where(model.day <= end)
+
+    result = await session.execute(stmt)
+    return [PricePoint(*row) for row in result.all()]
+
+
+def lttb(points: list[PricePoint], threshold: int) -> list[PricePoint]:
+    """Largest-Triangle-Three-Buckets downsampling on each point's lowest price.
+
+    Keeps the first and last points and, from each of ``threshold - 2``
+    equal buckets in between, the point forming the largest triangle with
+    the previously kept point and the next bucket's average — so dips and
+    spikes survive while flat stretches collapse.
+    """
+    if threshold >= len(points) or threshold < 3:
+        return points
+
+    xs = [float(p.day.toordinal()) for p in points]
+    ys = [float(p.min_price) for p in points]
+    every = (len(points) - 2) / (threshold - 2)
+
+    sampled = [points[0]]
+    a = 0
+    for i in range(threshold - 2):
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, len(points))
+        avg_x = sum(xs[next_start:next_end]) / (next_end - next_start)
+        avg_y = sum(ys[next_start:next_end]) / (next_end - next_start)
+
+        best, best_area = next_start - 1, -1.0
+        for j in range(int(i * every) + 1, next_start):
+            area = abs((xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a]))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(points[best])
+        a = best
+    sampled.append(points[-1])
+    return sampled
@@ -1,57 +1,231 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 
-from sqlalchemy import select, delete
+from sqlalchemy import (
+    Integer,
+    Numeric,
+    Row,
+    String,
+    Text,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+    text,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.backend.core.config import settings
 from app.backend.core.logging import get_logger
+from app.backend.db.partitions import drop_partitions_before
 from app.backend.models.alert import Alert
-from app.backend.models.price_record import PriceRecord
+from app.backend.models.daily_price import AlertDailyPrice, ProductDailyPrice
+from app.backend.models.price_observation import AlertObservation, PriceObservation
+from app.backend.models.product import Product
 from app.backend.scrapers.base import ScrapedProduct
+from app.backend.services.price_rollups import record_daily_prices
 
 logger = get_logger(__name__)
 
 
-async def record_prices(
+async def _observe(
     session: AsyncSession,
-    alert: Alert,
-    products: list[ScrapedProduct],
-) -> PriceRecord | None:
-    if not products:
-        return None
+    seen: dict[tuple[str, str], ScrapedProduct],
+    product_ids: dict[tuple[str, str], int],
+) -> dict[tuple[str, str], PriceObservation]:
+    """The current observation of each product, inserting rows as needed.
+
+    Must run after the products upsert in the same transaction: that
+    upsert holds each product's row lock until commit, so two concurrent
+    checks of one product run this read-then-insert one after the other,
+    and the second one's ``SELECT`` (a fresh snapshot under READ COMMITTED)
+    sees the first one's observation.
+    """
+    observations: dict[tuple[str, str], PriceObservation] = {}
+    new_keys = list(seen)
 
-    lowest: ScrapedProduct | None = None
-    for product in products:
-        record = PriceRecord(
-            alert_id=alert.id,
-            store_slug=product.store_slug,
-            product_name=product.product_name,
-            price=product.price,
-            product_url=product.product_url,
+    if settings.PRICE_HISTORY_CHANGES_ONLY:
+        latest = await session.scalars(
+            select(PriceObservation)
+            .where(PriceObservation.product_id.in_(product_ids.values()))
+            .distinct(PriceObservation.product_id)
+            .order_by(PriceObservation.product_id, PriceObservation.observed_at.desc())
         )
-        session.add(record)
-        if lowest is None or product.price < lowest.price:
-            lowest = product
+        latest_by_product = {observation.product_id: observation for observation in latest.all()}
+        new_keys = []
+        for key, product in seen.items():
+            observation = latest_by_product.get(product_ids[key])
+            if observation is not None and observation.price == product.price:
+                observations[key] = observation
+            else:
+                new_keys.append(key)
+        if observations:
+            await session.execute(
+                update(PriceObservation)
+                .where(PriceObservation.id.in_([o.id for o in observations.values()]))
+                .values(last_seen_at=func.now())
+                .execution_options(synchronize_session=False)
+            )
+
+    if new_keys:
+        result = await session.scalars(
+            insert(PriceObservation).returning(PriceObservation, sort_by_parameter_order=True),
+            [{"product_id": product_ids[key], "price": seen[key].price} for key in new_keys],
+        )
+        observations.update(zip(new_keys, result.all()))
+    return observations
+
+
+async def record_prices_bulk(
+    session: AsyncSession,
+    alert_products: list[tuple[Alert, list[ScrapedProduct]]],
+) -> dict[int, PriceObservation]:
+    """Record one check for many alerts in a handful of statements.
+
+    Products are upserted into the shared ``products`` table and each one
+    gets a single observation per check, however many alerts returned it;
+    alerts only store a link to the observation. With
+    ``PRICE_HISTORY_CHANGES_ONLY`` an unchanged price extends the product's
+    latest observation instead of adding a row. Products without a URL
+    can't be identified across checks and are not recorded. Each product's
+    and each alert's daily rollup is updated too. Every alert's
+    ``last_checked_at`` / lowest-price columns are set by a single
+    ``UPDATE ... FROM (VALUES ...)``; alerts with no products only get
+    ``last_checked_at`` bumped.
+
+    Returns the observation of each alert's lowest-priced product.
+    """
+    if not alert_products:
+        return {}
 
     now = datetime.now(timezone.utc)
-    alert.last_checked_at = now
+    seen: dict[tuple[str, str], ScrapedProduct] = {}
+    lowest: dict[int, ScrapedProduct] = {}
+    for alert, products in alert_products:
+        for product in products:
+            if alert.id not in lowest or product.price < lowest[alert.id].price:
+                lowest[alert.id] = product
+            if product.product_url:
+                seen.setdefault((product.store_slug, product.product_url), product)
+
+    observations: dict[tuple[str, str], PriceObservation] = {}
+    if seen:
+        # Rows are locked in VALUES order; sorting by the conflict key makes
+        # every check take the shared products' locks in the same order, so
+        # concurrent groups wait on each other instead of deadlocking.
+        upsert = pg_insert(Product).values([
+            {
+                "store_slug": store_slug,
+                "product_url": product_url,
+                "product_name": product.product_name,
+                "image_url": product.image_url,
+            }
+            for (store_slug, product_url), product in sorted(seen.items(), key=lambda item: item[0])
+        ])
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[Product.store_slug, Product.product_url],
+            set_={
+                "product_name": upsert.excluded.product_name,
+                "image_url": func.coalesce(upsert.excluded.image_url, Product.image_url),
+                "last_seen_at": now,
+            },
+        ).returning(Product.id, Product.store_slug, Product.product_url)
+        product_ids = {
+            (store_slug, product_url): product_id
+            for product_id, store_slug, product_url in (await session.execute(upsert)).all()
+        }
+
+        observations = await _observe(session, seen, product_ids)
+        await record_daily_prices(
+            session,
+            ProductDailyPrice,
+            {product_ids[key]: product.price for key, product in seen.items()},
+            now.date(),
+        )
 
-    if lowest:
-        alert.lowest_price_found = lowest.price
-        alert.lowest_price_store = lowest.store_slug
-        alert.lowest_price_url = lowest.product_url
+        links = {
+            (alert.id, observations[(product.store_slug, product.product_url)])
+            for alert, products in alert_products
+            for product in products
+            if product.product_url
+        }
+        # An extended observation may already be linked from an earlier check.
+        await session.execute(
+            pg_insert(AlertObservation).on_conflict_do_nothing(),
+            [
+                {"alert_id": alert_id, "observation_id": obs.id, "observed_at": obs.observed_at}
+                for alert_id, obs in links
+            ],
+        )
+
+    await record_daily_prices(
+        session,
+        AlertDailyPrice,
+        {alert_id: product.price for alert_id, product in lowest.items()},
+        now.date(),
+    )
 
-    await session.flush()
+    checked_rows = []
+    for alert, _ in alert_products:
+        if alert.id in lowest:
+            product = lowest[alert.id]
+            checked_rows.append((alert.id, product.price, product.store_slug, product.product_url))
+        else:
+            checked_rows.append((alert.id, None, None, None))
 
-    if lowest:
-        result = await session.execute(
-            select(PriceRecord)
-            .where(PriceRecord.alert_id == alert.id)
-            .order_by(PriceRecord.scraped_at.desc())
-            .limit(1)
+    checked = values(
+        column("id", Integer),
+        column("price", Numeric(10, 2)),
+        column("store", String(50)),
+        column("url", Text),
+        name="checked",
+    ).data(checked_rows)
+    await session.execute(
+        update(Alert)
+        .where(Alert.id == checked.c.id)
+        .values(
+            last_checked_at=now,
+            # Cast: a VALUES column that is NULL in every row is typed as text.
+            lowest_price_found=func.coalesce(cast(checked.c.price, Numeric(10, 2)), Alert.lowest_price_found),
+            lowest_price_store=func.coalesce(checked.c.store, Alert.lowest_price_store),
+            lowest_price_url=func.coalesce(checked.c.url, Alert.lowest_price_url),
         )
-        return result.scalar_one_or_none()
-    return None
+        .execution_options(synchronize_session=False)
+    )
+
+    # Mirror the UPDATE onto the loaded objects without marking them dirty,
+    # so trigger checks see the new values and no second UPDATE is flushed.
+    for alert, _ in alert_products:
+        set_committed_value(alert, "last_checked_at", now)
+        if alert.id in lowest:
+            product = lowest[alert.id]
+            set_committed_value(alert, "lowest_price_found", product.price)
+            set_committed_value(alert, "lowest_price_store", product.store_slug)
+            set_committed_value(alert, "lowest_price_url", product.product_url)
+
+    return {
+        alert_id: observations[(product.store_slug, product.product_url)]
+        for alert_id, product in lowest.items()
+        if (product.store_slug, product.product_url) in observations
+    }
+
+
+async def record_prices(
+    session: AsyncSession,
+    alert: Alert,
+    products: list[ScrapedProduct],
+) -> PriceObservation | None:
+    if not products:
+        return None
+    observations = await record_prices_bulk(session, [(alert, products)])
+    return observations.get(alert.id)
 
 
 def check_price_trigger(alert: Alert, lowest_price: Decimal) -> bool:
@@ -64,22 +238,118 @@ async def mark_alert_triggered(session: AsyncSession, alert: Alert) -> None:
     logger.info("alert_triggered", alert_id=alert.id, price=str(alert.lowest_price_found))
 
 
-async def get_price_history(session: AsyncSession, alert_id: int) -> list[PriceRecord]:
-    result = await session.execute(
-        select(PriceRecord)
-        .where(PriceRecord.alert_id == alert_id)
-        .order_by(PriceRecord.scraped_at.desc())
+async def get_price_history(
+    session: AsyncSession,
+    alert_id: int,
+    start: date | None = None,
+    end: date | None = None,
+) -> list[Row]:
+    """The alert's last 100 observations in [*start*, *end*], newest first."""
+    stmt = (
+        select(
+            PriceObservation.id,
+            PriceObservation.product_id,
+            Product.store_slug,
+            Product.product_name,
+            PriceObservation.price,
+            Product.product_url,
+            PriceObservation.observed_at.label("scraped_at"),
+            PriceObservation.last_seen_at,
+        )
+        .join(
+            AlertObservation,
+            (AlertObservation.observation_id == PriceObservation.id)
+            & (AlertObservation.observed_at == PriceObservation.observed_at),
+        )
+        .join(Product, Product.id == PriceObservation.product_id)
+        .where(AlertObservation.alert_id == alert_id)
+        .order_by(PriceObservation.observed_at.desc())
         .limit(100)
     )
-    return list(result.scalars().all())
+    # Bounds on observed_at also prune the monthly partitions scanned.
+    if start is not None:
+        stmt = stmt.where(PriceObservation.observed_at >= start)
+    if end is not None:
+        stmt = stmt.where(PriceObservation.observed_at < end + timedelta(days=1))
+    result = await session.execute(stmt)
+    return list(result.all())
 
 
 async def cleanup_old_records(session: AsyncSession, days: int = 90) -> int:
-    from datetime import timedelta
+    """Drop whole months of price history older than *days*.
+
+    Months are dropped as partitions (see ``db/partitions.py``), so nothing
+    is deleted row by row; rows in the month straddling the cutoff stay
+    until that month is entirely past it.
+    """
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    result = await session.execute(
-        delete(PriceRecord).where(PriceRecord.scraped_at < cutoff)
+    dropped = await drop_partitions_before(session, cutoff)
+    # Products nobody has seen since the cutoff, once their history is gone:
+    # one with observations left in the straddling month stays until that
+    # partition is dropped, so the delete never cascades row by row.
+    products = await session.execute(
+        delete(Product).where(
+            Product.last_seen_at < cutoff,
+            ~exists().where(PriceObservation.product_id == Product.id),
+        )
+    )
+    logger.info(
+        "cleanup_old_records",
+        dropped_partitions=len(dropped),
+        deleted_products=products.rowcount,
+        older_than_days=days,
     )
+    return len(dropped)
+
+
+# Runs of identical consecutive prices per product; every row points at the
+# first observation (the head) of its run and the run's latest sighting.
+_OBSERVATION_RUNS_SQL = """
+CREATE TEMP TABLE observation_runs ON COMMIT DROP AS
+WITH marked AS (
+    SELECT id, product_id, observed_at, last_seen_at,
+           (price IS DISTINCT FROM lag(price) OVER (
+               PARTITION BY product_id ORDER BY observed_at, id
+           ))::int AS starts_run
+    FROM price_observations
+), numbered AS (
+    SELECT id, product_id, observed_at, last_seen_at,
+           sum(starts_run) OVER (PARTITION BY product_id ORDER BY observed_at, id) AS run
+    FROM marked
+)
+SELECT id, observed_at,
+       first_value(id) OVER (PARTITION BY product_id, run ORDER BY observed_at, id) AS head_id,
+       first_value(observed_at) OVER (PARTITION BY product_id, run ORDER BY observed_at, id) AS head_observed_at,
+       max(last_seen_at) OVER (PARTITION BY product_id, run) AS run_end
+FROM numbered
+"""
+
+
+async def compact_price_history(session: AsyncSession) -> int:
+    """Collapse runs of identical prices into one observation each.
+
+    One-off job for history recorded before ``PRICE_HISTORY_CHANGES_ONLY``:
+    the first observation of each run is kept and stretched to the run's
+    last sighting, alert links move to it, and the rest are deleted.
+    """
+    await session.execute(text(_OBSERVATION_RUNS_SQL))
+    await session.execute(text(
+        "UPDATE price_observations o SET last_seen_at = r.run_end "
+        "FROM observation_runs r "
+        "WHERE o.id = r.id AND o.observed_at = r.observed_at "
+        "AND r.id = r.head_id AND o.last_seen_at < r.run_end"
+    ))
+    await session.execute(text(
+        "INSERT INTO alert_observations (alert_id, observation_id, observed_at) "
+        "SELECT ao.alert_id, r.head_id, r.head_observed_at FROM alert_observations ao "
+        "JOIN observation_runs r ON r.id = ao.observation_id AND r.observed_at = ao.observed_at "
+        "WHERE r.id <> r.head_id "
+        "ON CONFLICT DO NOTHING"
+    ))
+    result = await session.execute(text(
+        "DELETE FROM price_observations o USING observation_runs r "
+        "WHERE o.id = r.id AND o.observed_at = r.observed_at AND r.id <> r.head_id"
+    ))
     count = result.rowcount
-    logger.info("cleanup_old_records", deleted=count, older_than_days=days)
+    logger.info("price_history_compacted", deleted=count)
     return count
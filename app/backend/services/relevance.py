@@ -35,6 +35,44 @@ ACCESSORY_WORDS = frozenset({
     "hub", "dock", "dongle",
 })
 
+
+def _trie_pattern(node: dict) -> str:
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # "" marks the end of a word that is also a prefix of longer ones.
+    return f"(?:{body})?" if "" in node else body
+
+
+def compile_words(words: frozenset[str]) -> re.Pattern[str]:
+    """Compile a word set into one regex for a single-pass substring search.
+
+    Words are factored into a trie first ("case|cable|cover" becomes
+    "c(?:a(?:se|ble)|over)"), so at each position of the text the regex
+    engine follows one branch instead of trying every word in turn.
+    Blank words are ignored: they would match every text.
+    """
+    trie: dict = {}
+    for word in words:
+        if not word.strip():
+            continue
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    # An empty trie would compile to "", which matches everywhere.
+    return re.compile(_trie_pattern(trie) or "(?!)")
+
+
+_ACCESSORY_PATTERN = compile_words(ACCESSORY_WORDS)
+
+
+def has_accessory_word(text_lower: str) -> bool:
+    """Whether *text_lower* contains any ``ACCESSORY_WORDS`` entry as a substring."""
+    return _ACCESSORY_PATTERN.search(text_lower) is not None
+
+
 # Words indicating "this product is FOR something" (not the thing itself).
 # Token-matched (exact) to avoid substring false positives ("for" ⊄ "format").
 FOR_WORDS = frozenset({"üçün", "для", "for", "uchun"})
@@ -70,8 +108,19 @@ def _token_matches(token: str, product_lower: str, product_tokens: set[str]) ->
     return token in product_lower
 
 
-def score_relevance(query: str, product_name: str, product_category: str | None = None) -> float:
-    """Score 0.0–1.0 how relevant a product is to the search query.
+def prepare_name(product_name: str) -> tuple[str, set[str]]:
+    """*product_name* lowercased, and its token set."""
+    product_lower = product_name.lower()
+    return product_lower, set(_tokenize(product_lower))
+
+
+class QueryMatcher:
+    """Relevance scorer for one query, reused across many product names.
+
+    Everything that depends only on the query — its tokens, which of them
+    are numeric, whether it mentions an accessory or a "for" word, and the
+    category's compiled exclude pattern — is computed once here instead of
+    on every :func:`score_relevance` call.
 
     Five signals:
     1. Query-word match ratio   — what fraction of query words appear
@@ -85,75 +134,91 @@ def score_relevance(query: str, product_name: str, product_category: str | None
     5. Numeric mismatch penalty — model numbers and specs (e.g. "17",
        "512") are critical identifiers; missing matches → heavy penalty.
     """
-    query_tokens = _tokenize(query)
-    if not query_tokens:
-        return 0.0
 
-    product_lower = product_name.lower()
+    def __init__(self, query: str, product_category: str | None = None):
+        self.query = query
+        self.product_category = product_category
+        self._tokens = _tokenize(query)
+        self._numeric = [t.isdigit() for t in self._tokens]
+        self._numeric_count = sum(self._numeric)
+        self._has_accessory = has_accessory_word(query.lower())
+        self._has_for = bool(set(self._tokens) & FOR_WORDS)
+
+        # Hard category filter: if a category is set and has exclude_words,
+        # any match means this product is completely irrelevant.
+        self._exclude: re.Pattern[str] | None = None
+        if product_category and product_category not in ("all", "accessory"):
+            from app.backend.services.category_detector import get_categories
 
-    # Hard category filter: if a category is set and has exclude_words,
-    # any match means this product is completely irrelevant.
-    if product_category and product_category not in ("all", "accessory"):
-        from app.backend.services.category_detector import CATEGORIES
-
-        cat = CATEGORIES.get(product_category)
-        if cat and cat.exclude_words:
-            if any(w in product_lower for w in cat.exclude_words):
-                return 0.0
-    product_tokens = set(_tokenize(product_lower))
-    query_lower = query.lower()
-
-    # 1. Query-word match ratio (smart matching)
-    matched = sum(
-        1 for t in query_tokens
-        if _token_matches(t, product_lower, product_tokens)
-    )
-    score = matched / len(query_tokens)
-
-    # 2. Accessory penalty (substring match handles suffixes)
-    query_has_accessory = any(w in query_lower for w in ACCESSORY_WORDS)
-    product_has_accessory = any(w in product_lower for w in ACCESSORY_WORDS)
-
-    if product_has_accessory and not query_has_accessory:
-        score *= 0.1
-
-    # 3. "For" indicator penalty (exact token match)
-    query_tokens_set = set(query_tokens)
-
-    product_has_for = bool(product_tokens & FOR_WORDS)
-    query_has_for = bool(query_tokens_set & FOR_WORDS)
-
-    if product_has_for and not query_has_for:
-        score *= 0.2
-
-    # 4. Noise penalty — if >70% of product tokens are unrelated to query,
-    #    the product is likely a different item that shares a few keywords.
-    if matched > 0 and len(product_tokens) > 3:
-        related = sum(
-            1 for pt in product_tokens
-            if any(qt in pt or pt in qt for qt in query_tokens)
-        )
-        noise_ratio = 1 - (related / len(product_tokens))
-        if noise_ratio > 0.7:
-            score *= 0.6
-
-    # 5. Numeric mismatch penalty — numbers are the strongest identifiers
-    #    (model numbers, storage, RAM). If they don't match, the product
-    #    is almost certainly a different model/spec.
-    numeric_query = [t for t in query_tokens if t.isdigit()]
-    if numeric_query:
-        numeric_matched = sum(
-            1 for t in numeric_query
-            if _token_matches(t, product_lower, product_tokens)
-        )
-        if numeric_matched == 0:
-            # No numbers match at all — wrong model entirely
+            cat = get_categories().get(product_category)
+            if cat:
+                self._exclude = cat.exclude_pattern
+
+    def score(self, product_name: str) -> float:
+        """Score 0.0–1.0 how relevant *product_name* is to the query."""
+        return self.score_prepared(*prepare_name(product_name))
+
+    def filter(self, products: list, min_score: float = 0.4) -> list:
+        """*products* scoring at least *min_score*, order preserved."""
+        return [p for p in products if self.score(p.product_name) >= min_score]
+
+    def score_prepared(self, product_lower: str, product_tokens: set[str]) -> float:
+        """:meth:`score` for a name already run through :func:`prepare_name`,
+        so one name can be scored by many matchers without re-tokenizing."""
+        query_tokens = self._tokens
+        if not query_tokens:
+            return 0.0
+        if self._exclude is not None and self._exclude.search(product_lower):
+            return 0.0
+
+        # 1. Query-word match ratio (smart matching)
+        hits = [_token_matches(t, product_lower, product_tokens) for t in query_tokens]
+        matched = sum(hits)
+        score = matched / len(query_tokens)
+
+        # 2. Accessory penalty (substring match handles suffixes)
+        if not self._has_accessory and has_accessory_word(product_lower):
             score *= 0.1
-        elif numeric_matched < len(numeric_query):
-            # Some numbers match — partially wrong spec
-            score *= 0.5
 
-    return score
+        # 3. "For" indicator penalty (exact token match)
+        if not self._has_for and product_tokens & FOR_WORDS:
+            score *= 0.2
+
+        # 4. Noise penalty — if >70% of product tokens are unrelated to query,
+        #    the product is likely a different item that shares a few keywords.
+        if matched > 0 and len(product_tokens) > 3:
+            related = sum(
+                1 for pt in product_tokens
+                if any(qt in pt or pt in qt for qt in query_tokens)
+            )
+            noise_ratio = 1 - (related / len(product_tokens))
+            if noise_ratio > 0.7:
+                score *= 0.6
+
+        # 5. Numeric mismatch penalty — numbers are the strongest identifiers
+        #    (model numbers, storage, RAM). If they don't match, the product
+        #    is almost certainly a different model/spec.
+        if self._numeric_count:
+            numeric_matched = sum(
+                hit for hit, numeric in zip(hits, self._numeric) if numeric
+            )
+            if numeric_matched == 0:
+                # No numbers match at all — wrong model entirely
+                score *= 0.1
+            elif numeric_matched < self._numeric_count:
+                # Some numbers match — partially wrong spec
+                score *= 0.5
+
+        return score
+
+
+def score_relevance(query: str, product_name: str, product_category: str | None = None) -> float:
+    """Score 0.0–1.0 how relevant a product is to the search query.
+
+    One-off convenience over :class:`QueryMatcher`; build a matcher instead
+    when scoring many products against the same query.
+    """
+    return QueryMatcher(query, product_category).score(product_name)
 
 
 def filter_relevant(
@@ -172,8 +237,21 @@ def filter_relevant(
     """
     if not products:
         return products
+    return QueryMatcher(query, product_category).filter(products, min_score)
+
 
+def filter_relevant_many(
+    products: list,
+    matchers: list[QueryMatcher],
+    min_score: float = 0.4,
+) -> list[list]:
+    """Filter one product set for several matchers (e.g. many alerts' queries).
+
+    Each product name is lowercased and tokenized once and then scored by
+    every matcher. Returns one filtered list per matcher, in order.
+    """
+    prepared = [(p, prepare_name(p.product_name)) for p in products]
     return [
-        p for p in products
-        if score_relevance(query, p.product_name, product_category) >= min_score
+        [p for p, name in prepared if matcher.score_prepared(*name) >= min_score]
+        for matcher in matchers
     ]
@@ -0,0 +1,218 @@
+"""Redis-backed cache of per-store search results.
+
+Entries hold the raw scraper output for one (store, query, max_results) so
+that the web search, the bot and alert checks all share them; relevance and
+category filtering run on top of the cached list. Each store has its own
+TTL (``cache_ttl`` in ``STORE_CONFIGS``, else ``SEARCH_CACHE_TTL_SECONDS``).
+Once an entry is past its TTL it is still served for
+``SEARCH_CACHE_STALE_SECONDS`` while a background task refreshes it
+(stale-while-revalidate). Concurrent misses for the same key share one
+in-flight scrape; with ``SEARCH_SINGLE_FLIGHT_REDIS`` enabled a Redis lock
+extends that across the API, bot and Celery processes, and processes that
+lose the race wait for the winner's result to land in the cache.
+
+Redis failures never fail a search — the cache is simply bypassed.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from decimal import Decimal
+
+from app.backend.core.config import settings
+from app.backend.core.logging import get_logger
+from app.backend.core.redis_client import UNLOCK_SCRIPT, get_redis
+from app.backend.core.single_flight import SingleFlight
+from app.backend.scrapers.base import ScrapedProduct
+from app.shared.constants import STORE_CONFIGS
+
+logger = get_logger(__name__)
+
+CACHE_PREFIX = "search:v1"
+
+Fetcher = Callable[[], Awaitable[list[ScrapedProduct]]]
+
+_PEER_POLL_INTERVAL = 0.25
+
+_flights: SingleFlight[list[ScrapedProduct]] = SingleFlight()
+_background: set[asyncio.Task] = set()
+
+
+def _cache_key(store_slug: str, query: str, max_results: int) -> str:
+    return f"{CACHE_PREFIX}:{store_slug}:{max_results}:{query}"
+
+
+def _store_ttl(store_slug: str) -> int:
+    return STORE_CONFIGS.get(store_slug, {}).get("cache_ttl", settings.SEARCH_CACHE_TTL_SECONDS)
+
+
+def _serialize(products: list[ScrapedProduct]) -> str:
+    return json.dumps({
+        "fetched_at": time.time(),
+        "products": [
+            {
+                "product_name": p.product_name,
+                "price": str(p.price),
+                "product_url": p.product_url,
+                "store_slug": p.store_slug,
+                "store_name": p.store_name,
+                "image_url": p.image_url,
+                "in_stock": p.in_stock,
+                "scraped_at": p.scraped_at.isoformat(),
+            }
+            for p in products
+        ],
+    })
+
+
+def _deserialize(raw: str) -> tuple[float, list[ScrapedProduct]]:
+    data = json.loads(raw)
+    products = [
+        ScrapedProduct(
+            product_name=item["product_name"],
+            price=Decimal(item["price"]),
+            product_url=item["product_url"],
+            store_slug=item["store_slug"],
+            store_name=item["store_name"],
+            image_url=item.get("image_url"),
+            in_stock=item.get("in_stock", True),
+            scraped_at=datetime.fromisoformat(item["scraped_at"]),
+        )
+        for item in data["products"]
+    ]
+    return data["fetched_at"], products
+
+
+async def _read(key: str) -> tuple[float, list[ScrapedProduct]] | None:
+    try:
+        raw = await get_redis().get(key)
+        return _deserialize(raw) if raw else None
+    except Exception as e:
+        logger.warning("search_cache_read_failed", key=key, error=str(e))
+        return None
+
+
+async def _write(key: str, ttl: int, products: list[ScrapedProduct]) -> None:
+    try:
+        await get_redis().set(key, _serialize(products), ex=ttl + settings.SEARCH_CACHE_STALE_SECONDS)
+    except Exception as e:
+        logger.warning("search_cache_write_failed", key=key, error=str(e))
+
+
+def _lock_key(key: str) -> str:
+    return f"{key}:lock"
+
+
+async def _try_lock(key: str) -> str | None:
+    """Claim the cross-process lock for *key*.
+
+    Returns the owner token, or ``None`` if another process holds it. If
+    Redis is unreachable the caller proceeds as if it had won.
+    """
+    token = uuid.uuid4().hex
+    try:
+        acquired = await get_redis().set(
+            _lock_key(key), token, nx=True, ex=int(settings.SEARCH_SINGLE_FLIGHT_WAIT_SECONDS) + 5
+        )
+    except Exception as e:
+        logger.warning("search_lock_failed", key=key, error=str(e))
+        return token
+    return token if acquired else None
+
+
+async def _unlock(key: str, token: str) -> None:
+    try:
+        await get_redis().eval(UNLOCK_SCRIPT, 1, _lock_key(key), token)
+    except Exception as e:
+        logger.warning("search_unlock_failed", key=key, error=str(e))
+
+
+async def _wait_for_peer(key: str, ttl: int) -> list[ScrapedProduct] | None:
+    """Wait for the process holding the lock to publish a fresh entry.
+
+    Returns ``None`` if the lock is released without a usable result (e.g.
+    the peer got nothing back) or the wait times out.
+    """
+    deadline = time.monotonic() + settings.SEARCH_SINGLE_FLIGHT_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_PEER_POLL_INTERVAL)
+        entry = await _read(key)
+        if entry is not None and time.time() - entry[0] < ttl:
+            return entry[1]
+        try:
+            if not await get_redis().exists(_lock_key(key)):
+                return None
+        except Exception:
+            return None
+    return None
+
+
+async def _fetch_and_store(key: str, ttl: int, fetch: Fetcher) -> list[ScrapedProduct]:
+    token: str | None = None
+    if settings.SEARCH_SINGLE_FLIGHT_REDIS:
+        token = await _try_lock(key)
+        if token is None:
+            products = await _wait_for_peer(key, ttl)
+            if products is not None:
+                logger.debug("search_single_flight_peer_hit", key=key)
+                return products
+
+    try:
+        products = await fetch()
+        # Errors propagate uncached, but an empty result may still be an
+        # outage (e.g. a block page parsed as no products) — don't pin it.
+        if products:
+            await _write(key, ttl, products)
+        return products
+    finally:
+        if token is not None:
+            await _unlock(key, token)
+
+
+async def _fetch_coalesced(key: str, ttl: int, fetch: Fetcher) -> list[ScrapedProduct]:
+    return await _flights.do(key, lambda: _fetch_and_store(key, ttl, fetch))
+
+
+def _refresh_in_background(key: str, ttl: int, fetch: Fetcher) -> None:
+    async def _refresh() -> None:
+        try:
+            await _fetch_coalesced(key, ttl, fetch)
+        except Exception as e:
+            logger.warning("search_cache_refresh_failed", key=key, error=str(e))
+
+    task = asyncio.get_running_loop().create_task(_refresh())
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+async def get_or_fetch(
+    store_slug: str,
+    query: str,
+    max_results: int,
+    fetch: Fetcher,
+    allow_stale: bool = True,
+) -> list[ScrapedProduct]:
+    """Return cached results for *query* at *store_slug*, calling *fetch* on a miss.
+
+    *query* must already be normalized. With ``allow_stale=False`` only
+    entries within the store's TTL are served.
+    """
+    key = _cache_key(store_slug, query, max_results)
+    ttl = _store_ttl(store_slug)
+
+    entry = await _read(key)
+    if entry is not None:
+        fetched_at, products = entry
+        age = time.time() - fetched_at
+        if age < ttl:
+            logger.debug("search_cache_hit", store=store_slug, query=query)
+            return products
+        if allow_stale and age < ttl + settings.SEARCH_CACHE_STALE_SECONDS:
+            logger.debug("search_cache_stale_hit", store=store_slug, query=query)
+            _refresh_in_background(key, ttl, fetch)
+            return products
+
+    return await _fetch_coalesced(key, ttl, fetch)
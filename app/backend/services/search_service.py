@@ -1,74 +1,380 @@
 import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
+import httpx
+
+from app.backend.core.config import settings
+from app.backend.core.exceptions import StoreUnavailable
 from app.backend.core.logging import get_logger
-from app.backend.scrapers.base import ScrapedProduct
+from app.backend.core.single_flight import SingleFlight
+from app.backend.scrapers.base import BaseScraper, ScrapedProduct
+from app.backend.scrapers.circuit_breaker import circuit_breaker
 from app.backend.scrapers.registry import scraper_registry
-from app.backend.services.relevance import filter_relevant
-from app.shared.constants import StoreSlug
+from app.backend.services import search_cache
+from app.backend.services.relevance import QueryMatcher
+from app.backend.services.store_latency import store_latency
+from app.shared.constants import STORE_CONFIGS, StoreSlug
 
 logger = get_logger(__name__)
 
+# Coalesces identical uncached scrapes; cached ones coalesce in search_cache.
+_flights: SingleFlight[list[ScrapedProduct]] = SingleFlight()
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so equivalent queries compare equal."""
+    return " ".join(query.lower().split())
+
+
+# Per-store concurrency caps. asyncio primitives are bound to the loop they
+# were first used on; the API and the worker each keep one loop for the life
+# of the process, but the semaphores are rebuilt if the loop ever changes
+# (e.g. a one-off asyncio.run() in a script or test).
+_store_semaphores: dict[str, asyncio.Semaphore] = {}
+_store_semaphores_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _store_semaphore(store_slug: str) -> asyncio.Semaphore:
+    global _store_semaphores_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _store_semaphores_loop:
+        _store_semaphores.clear()
+        _store_semaphores_loop = loop
+    semaphore = _store_semaphores.get(store_slug)
+    if semaphore is None:
+        limit = STORE_CONFIGS.get(store_slug, {}).get(
+            "max_concurrency", settings.SCRAPER_MAX_CONCURRENCY_PER_STORE
+        )
+        semaphore = _store_semaphores[store_slug] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def _hedged_search(scraper: BaseScraper, query: str, max_results: int) -> list[ScrapedProduct]:
+    """Run the search; if it is slower than the store's p95, fire a second
+    identical request and take whichever answers first. Scraper errors are
+    raised, not swallowed, so the caller can tell them from an answer."""
+    hedge_after = store_latency.hedge_delay(scraper.store_slug)
+    tasks = {asyncio.ensure_future(scraper.guarded_search(query, max_results))}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if not done:
+            logger.info("search_store_hedged", store=scraper.store_slug, after=round(hedge_after, 2))
+            tasks.add(asyncio.ensure_future(type(scraper)().guarded_search(query, max_results)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # A request that failed fast (e.g. an error page, or a hedge
+                # refused by the half-open breaker) shouldn't beat one still
+                # in flight.
+                if any(t.exception() is None for t in done):
+                    break
+        succeeded = [t for t in done if t.exception() is None]
+        return (succeeded or list(done))[0].result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
 
 async def _scrape_with_timeout(
-    scraper, query: str, max_results: int, timeout: float = 30.0
+    scraper, query: str, max_results: int, timeout: float | None = None
 ) -> list[ScrapedProduct]:
+    slug = scraper.store_slug
+    if timeout is None:
+        timeout = store_latency.deadline(slug)
     try:
-        return await asyncio.wait_for(
-            scraper.safe_search(query, max_results), timeout=timeout
-        )
+        async with _store_semaphore(slug):
+            started = time.monotonic()
+            result = await asyncio.wait_for(
+                _hedged_search(scraper, query, max_results), timeout=timeout
+            )
     except asyncio.TimeoutError:
-        try:
-            await scraper.close()
-        except Exception:
-            pass
+        store_latency.record(slug, timeout)
+        # A miss of the adaptive p95 deadline just widens it (via the sample
+        # above); only timing out at the static ceiling means the store is down.
+        if timeout >= settings.SEARCH_TIMEOUT_MAX_SECONDS:
+            await circuit_breaker.record_failure(slug)
         raise
+    # Scraper errors (already logged and counted by guarded_search) propagate
+    # to be reported as a failed store, and are not latency samples: a fast
+    # error would pull the p95 deadline down.
+    store_latency.record(slug, time.monotonic() - started)
+    return result
 
 
-async def search_all_stores(
+async def _search_store(
+    scraper_cls, query: str, max_results: int, use_cache: bool, allow_stale: bool
+) -> list[ScrapedProduct]:
+    async def fetch() -> list[ScrapedProduct]:
+        return await _scrape_with_timeout(scraper_cls(), query, max_results)
+
+    if not (use_cache and settings.SEARCH_CACHE_ENABLED):
+        key = f"{scraper_cls.store_slug}:{max_results}:{normalize_query(query)}"
+        return await _flights.do(key, fetch)
+    return await search_cache.get_or_fetch(
+        scraper_cls.store_slug, normalize_query(query), max_results, fetch, allow_stale=allow_stale
+    )
+
+
+# StoreSearchResult.status: the store answered; was not asked or did not
+# answer in time (open breaker, deadline, latency budget); or errored.
+STATUS_OK = "ok"
+STATUS_UNAVAILABLE = "unavailable"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class StoreSearchResult:
+    """One store's share of a search, already relevance-filtered."""
+    store_slug: str
+    products: list[ScrapedProduct]
+    error: str | None = None
+    skipped: bool = False
+    status: str = STATUS_OK
+
+
+def _select_scrapers(store_slugs: list[str] | None) -> dict[str, type[BaseScraper]]:
+    all_scrapers = scraper_registry.get_all()
+    if store_slugs:
+        return {k: v for k, v in all_scrapers.items() if k in store_slugs}
+    return all_scrapers
+
+
+def _store_result(slug: str, task: asyncio.Task, matcher: QueryMatcher | None) -> StoreSearchResult:
+    exc = task.exception()
+    if isinstance(exc, asyncio.TimeoutError):
+        logger.warning("search_store_timeout", store=slug)
+        return StoreSearchResult(slug, [], f"{slug}: timed out", status=STATUS_UNAVAILABLE)
+    if isinstance(exc, StoreUnavailable):
+        return StoreSearchResult(slug, [], f"{slug}: temporarily unavailable", status=STATUS_UNAVAILABLE)
+    if exc is not None:
+        logger.error("search_store_error", store=slug, error=str(exc))
+        return StoreSearchResult(slug, [], f"{slug}: {exc}", status=STATUS_FAILED)
+
+    result = task.result()
+    if not isinstance(result, list):
+        return StoreSearchResult(slug, [], f"{slug}: unexpected result type", status=STATUS_FAILED)
+    products = sorted(result, key=lambda p: p.price)
+    if matcher is not None:
+        products = matcher.filter(products)
+    return StoreSearchResult(slug, products)
+
+
+async def stream_search_stores(
     query: str,
     store_slugs: list[str] | None = None,
     max_results_per_store: int = 10,
     product_category: str | None = None,
-) -> tuple[list[ScrapedProduct], list[str]]:
-    all_scrapers = scraper_registry.get_all()
-    if store_slugs:
-        scrapers_to_use = {k: v for k, v in all_scrapers.items() if k in store_slugs}
-    else:
-        scrapers_to_use = all_scrapers
+    use_cache: bool = True,
+    allow_stale: bool = True,
+    latency_budget: float | None = None,
+    relevance_filter: bool = True,
+) -> AsyncIterator[StoreSearchResult]:
+    """Search all stores concurrently, yielding each store's results as soon
+    as that store answers (fastest first).
 
-    tasks = []
-    for slug, scraper_cls in scrapers_to_use.items():
-        scraper = scraper_cls()
-        tasks.append(_scrape_with_timeout(scraper, query, max_results_per_store))
+    With *latency_budget* set, stores that haven't answered within that many
+    seconds are given up on and yielded with ``skipped=True``. With
+    *relevance_filter* off, products are returned unfiltered so the caller
+    can score them itself (e.g. for several alerts at once).
+    """
+    # One matcher for every store's results: the query is only analysed once.
+    matcher = QueryMatcher(query, product_category) if relevance_filter else None
+    scrapers_to_use = _select_scrapers(store_slugs)
+    tasks = {
+        asyncio.ensure_future(
+            _search_store(scraper_cls, query, max_results_per_store, use_cache, allow_stale)
+        ): slug
+        for slug, scraper_cls in scrapers_to_use.items()
+    }
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + latency_budget if latency_budget else None
+    pending = set(tasks)
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield _store_result(tasks[task], task, matcher)
+            if not done:
+                for task in pending:
+                    slug = tasks[task]
+                    logger.warning("search_store_skipped", store=slug, budget=latency_budget)
+                    yield StoreSearchResult(
+                        slug, [], f"{slug}: skipped (too slow)", skipped=True, status=STATUS_UNAVAILABLE
+                    )
+                break
+    finally:
+        # Consumer stopped early (e.g. SSE client disconnected).
+        for task in pending:
+            task.cancel()
 
-    results_list = await asyncio.gather(*tasks, return_exceptions=True)
 
+async def search_all_stores(
+    query: str,
+    store_slugs: list[str] | None = None,
+    max_results_per_store: int = 10,
+    product_category: str | None = None,
+    use_cache: bool = True,
+    allow_stale: bool = True,
+    latency_budget: float | None = None,
+    relevance_filter: bool = True,
+) -> tuple[list[ScrapedProduct], list[str]]:
     all_products: list[ScrapedProduct] = []
     errors: list[str] = []
 
-    for slug, result in zip(scrapers_to_use.keys(), results_list):
-        if isinstance(result, asyncio.TimeoutError):
-            errors.append(f"{slug}: timed out")
-            logger.warning("search_store_timeout", store=slug)
-        elif isinstance(result, Exception):
-            errors.append(f"{slug}: {result}")
-            logger.error("search_store_error", store=slug, error=str(result))
-        elif isinstance(result, list):
-            all_products.extend(result)
-        else:
-            errors.append(f"{slug}: unexpected result type")
+    async for batch in stream_search_stores(
+        query,
+        store_slugs,
+        max_results_per_store,
+        product_category,
+        use_cache,
+        allow_stale,
+        latency_budget,
+        relevance_filter,
+    ):
+        all_products.extend(batch.products)
+        if batch.error:
+            errors.append(batch.error)
 
     all_products.sort(key=lambda p: p.price)
-    all_products = filter_relevant(all_products, query, product_category=product_category)
     return all_products, errors
 
 
+ALERT_MAX_RESULTS_PER_STORE = 5
+
+
+def batch_capable_stores(store_slugs: list[str] | None = None) -> list[str]:
+    """Stores among *store_slugs* (all when empty) that answer many queries per request."""
+    return [slug for slug, cls in _select_scrapers(store_slugs).items() if cls.supports_batch_search]
+
+
+async def _search_store_batch(
+    scraper_cls: type[BaseScraper], queries: list[str], max_results: int
+) -> dict[str, list[ScrapedProduct]]:
+    slug = scraper_cls.store_slug
+    if not await circuit_breaker.allow_request(slug):
+        logger.info("scraper_circuit_open", store=slug, queries=len(queries))
+        return {}
+    # The store answers every query in the batch within this one request,
+    # so the per-search deadline scales with the batch, up to a ceiling so
+    # a slow store can't hold a semaphore slot for minutes. Its duration is
+    # not fed back into store_latency, whose p95 sets single-search deadlines.
+    deadline = store_latency.deadline(slug)
+    timeout = min(deadline * len(queries), settings.SCRAPER_TIMEOUT * 2)
+    try:
+        async with _store_semaphore(slug):
+            results = await asyncio.wait_for(
+                scraper_cls().search_many(queries, max_results), timeout=timeout
+            )
+    except asyncio.TimeoutError:
+        logger.error("scraper_batch_search_timeout", store=slug, queries=len(queries))
+        # As in _scrape_with_timeout: only the static ceiling trips the breaker.
+        if deadline >= settings.SEARCH_TIMEOUT_MAX_SECONDS:
+            await circuit_breaker.record_failure(slug)
+        return {}
+    except Exception as e:
+        logger.error(
+            "scraper_batch_search_failed", store=slug, queries=len(queries), error=str(e) or type(e).__name__
+        )
+        await circuit_breaker.record_failure(slug)
+        return {}
+    await circuit_breaker.record_success(slug)
+    logger.info("scraper_batch_search_success", store=slug, queries=len(queries), answered=len(results))
+    return results
+
+
+async def search_store_batched(
+    store_slug: str, queries: list[str], max_results_per_query: int = ALERT_MAX_RESULTS_PER_STORE
+) -> dict[str, list[ScrapedProduct]]:
+    """Search one batch-capable store for many queries, packing up to
+    ``SCRAPER_GRAPHQL_BATCH_SIZE`` of them into each request.
+
+    Results are unfiltered and keyed by query; queries whose batch failed
+    are missing, so the caller can fall back to a regular search for them.
+    """
+    scraper_cls = scraper_registry.get(store_slug)
+    if scraper_cls is None or not queries:
+        return {}
+    size = max(1, settings.SCRAPER_GRAPHQL_BATCH_SIZE)
+    batches = await asyncio.gather(*(
+        _search_store_batch(scraper_cls, queries[i:i + size], max_results_per_query)
+        for i in range(0, len(queries), size)
+    ))
+    return {query: products for batch in batches for query, products in batch.items()}
+
+
+def _is_store_outage(exc: BaseException) -> bool:
+    """Whether a failed product read says the store itself is unwell."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError))
+
+
+async def _fetch_product(scraper_cls: type[BaseScraper], url: str) -> ScrapedProduct | None:
+    slug = scraper_cls.store_slug
+    if not await circuit_breaker.allow_request(slug):
+        logger.info("scraper_circuit_open", store=slug, url=url)
+        return None
+    try:
+        async with _store_semaphore(slug):
+            # The static ceiling, not the p95 search deadline: a single
+            # product read that exceeds it is a real outage.
+            product = await asyncio.wait_for(
+                scraper_cls().fetch_product(url), timeout=settings.SEARCH_TIMEOUT_MAX_SECONDS
+            )
+    except Exception as e:
+        if not _is_store_outage(e):
+            # One bad listing (4xx, unparseable page) says nothing about the
+            # store; don't let dead pins open the breaker for everyone.
+            logger.warning("pinned_product_fetch_failed", store=slug, url=url, error=str(e) or type(e).__name__)
+            return None
+        logger.error("scraper_fetch_product_failed", store=slug, url=url, error=str(e) or type(e).__name__)
+        await circuit_breaker.record_failure(slug)
+        return None
+    # Not recorded in store_latency: a product read is much quicker than a
+    # search and would skew the search deadlines.
+    await circuit_breaker.record_success(slug)
+    if product is None:
+        logger.info("pinned_product_unavailable", store=slug, url=url)
+    return product
+
+
+async def fetch_pinned_products(urls: list[str]) -> dict[str, ScrapedProduct]:
+    """Re-read each pinned product URL from its store's product endpoint.
+
+    No search and no relevance scoring: the user chose these listings.
+    URLs that are gone, unpriced, out of stock or failed to load are missing.
+    """
+    urls = list(dict.fromkeys(urls))
+    scrapers = [scraper_registry.for_url(url) for url in urls]
+    products = await asyncio.gather(*(
+        _fetch_product(cls, url) for cls, url in zip(scrapers, urls) if cls is not None
+    ))
+    known = [url for cls, url in zip(scrapers, urls) if cls is not None]
+    return {url: p for url, p in zip(known, products) if p is not None and p.in_stock}
+
+
 async def search_stores_for_alert(
     query: str,
     store_slugs: list[str],
-    max_results_per_store: int = 5,
+    max_results_per_store: int = ALERT_MAX_RESULTS_PER_STORE,
     product_category: str | None = None,
+    relevance_filter: bool = True,
 ) -> list[ScrapedProduct]:
-    products, _ = await search_all_stores(query, store_slugs, max_results_per_store, product_category=product_category)
+    # Alerts can trigger notifications, so never act on stale cache entries.
+    products, _ = await search_all_stores(
+        query,
+        store_slugs,
+        max_results_per_store,
+        product_category=product_category,
+        allow_stale=False,
+        relevance_filter=relevance_filter,
+    )
     return products
@@ -0,0 +1,57 @@
+"""Rolling per-store scrape latency, used to size search deadlines.
+
+Each process keeps the last ``STORE_LATENCY_WINDOW`` scrape durations per
+store. Once a store has enough samples its deadline becomes
+``p95 × SEARCH_TIMEOUT_P95_MULTIPLIER`` (clamped to the configured min/max)
+instead of the fixed worst-case timeout, and — if hedging is enabled — a
+second request is fired when the first one is slower than the store's p95.
+"""
+
+from collections import defaultdict, deque
+
+from app.backend.core.config import settings
+
+
+class StoreLatencyTracker:
+    def __init__(self, window: int):
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, store_slug: str, seconds: float) -> None:
+        self._samples[store_slug].append(seconds)
+
+    def percentile(self, store_slug: str, pct: float) -> float | None:
+        samples = self._samples.get(store_slug)
+        if not samples or len(samples) < settings.STORE_LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def deadline(self, store_slug: str) -> float:
+        p95 = self.percentile(store_slug, 95)
+        if p95 is None:
+            return settings.SEARCH_TIMEOUT_MAX_SECONDS
+        return min(
+            settings.SEARCH_TIMEOUT_MAX_SECONDS,
+            max(settings.SEARCH_TIMEOUT_MIN_SECONDS, p95 * settings.SEARCH_TIMEOUT_P95_MULTIPLIER),
+        )
+
+    def hedge_delay(self, store_slug: str) -> float | None:
+        """Seconds to wait before sending a hedged request, or ``None``."""
+        if not settings.SEARCH_HEDGE_ENABLED:
+            return None
+        return self.percentile(store_slug, 95)
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        return {
+            slug: {
+                "samples": len(samples),
+                "p50": self.percentile(slug, 50),
+                "p95": self.percentile(slug, 95),
+                "deadline": self.deadline(slug),
+            }
+            for slug, samples in self._samples.items()
+        }
+
+
+store_latency = StoreLatencyTracker(window=settings.STORE_LATENCY_WINDOW)
@@ -21,9 +21,14 @@ celery_app.conf.update(
 )
 
 celery_app.conf.beat_schedule = {
-    "check-all-alerts": {
-        "task": "app.backend.tasks.price_check.check_all_alerts",
-        "schedule": crontab(minute=0, hour=f"*/{settings.PRICE_CHECK_INTERVAL_HOURS}"),
+    # Short, frequent ticks that only check alerts that are due — see
+    # services/check_scheduler.py. A tick that runs long holds a Redis lock,
+    # so the next one is skipped rather than re-checking the same alerts.
+    # check_all_alerts is still available for a manual full sweep.
+    "check-due-alerts": {
+        "task": "app.backend.tasks.price_check.check_due_alerts",
+        "schedule": crontab(minute=f"*/{settings.PRICE_CHECK_TICK_MINUTES}"),
+        "options": {"expires": settings.PRICE_CHECK_TICK_MINUTES * 60},
     },
     "cleanup-old-records": {
         "task": "app.backend.tasks.cleanup.cleanup_old_price_records",
@@ -1,29 +1,38 @@
-import asyncio
-
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-
 from app.backend.core.config import settings
 from app.backend.core.logging import get_logger
-from app.backend.services.price_service import cleanup_old_records
+from app.backend.db.partitions import ensure_partitions
+from app.backend.services.price_service import cleanup_old_records, compact_price_history
 from app.backend.tasks.celery_app import celery_app
+from app.backend.tasks.runtime import get_session_factory, run_async
 
 logger = get_logger(__name__)
 
 
 async def _cleanup() -> None:
-    task_engine = create_async_engine(
-        settings.database_url, echo=False, pool_pre_ping=True, pool_size=2, max_overflow=0
-    )
-    factory = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
-    try:
-        async with factory() as session:
-            deleted = await cleanup_old_records(session, days=90)
-            await session.commit()
-            logger.info("cleanup_completed", deleted_records=deleted)
-    finally:
-        await task_engine.dispose()
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        await ensure_partitions(session)
+        # Release the partition DDL locks before the retention work.
+        await session.commit()
+        dropped = await cleanup_old_records(session, days=settings.PRICE_HISTORY_RETENTION_DAYS)
+        await session.commit()
+        logger.info("cleanup_completed", dropped_partitions=dropped)
 
 
 @celery_app.task(name="app.backend.tasks.cleanup.cleanup_old_price_records")
 def cleanup_old_price_records() -> None:
-    asyncio.run(_cleanup())
+    run_async(_cleanup())
+
+
+async def _compact() -> None:
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        deleted = await compact_price_history(session)
+        await session.commit()
+        logger.info("compaction_completed", deleted_records=deleted)
+
+
+@celery_app.task(name="app.backend.tasks.cleanup.compact_price_history")
+def compact_price_history_task() -> None:
+    """One-off: ``celery -A app.backend.tasks.celery_app call app.backend.tasks.cleanup.compact_price_history``."""
+    run_async(_compact())
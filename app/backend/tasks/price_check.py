@@ -1,121 +1,349 @@
 import asyncio
+import time
+import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.backend.core.config import settings
 from app.backend.core.logging import get_logger
+from app.backend.core.redis_client import UNLOCK_SCRIPT, get_redis
 from app.backend.models.alert import Alert
 from app.backend.models.bot_activity import log_bot_activity
+from app.backend.scrapers.base import ScrapedProduct
+from app.backend.scrapers.registry import scraper_registry
 from app.backend.services.alert_service import get_all_active_alerts
+from app.backend.services.check_scheduler import get_due_alerts
 from app.backend.services.notification_service import send_price_alert, send_push_alerts_for_alert
-from app.backend.services.price_service import check_price_trigger, mark_alert_triggered, record_prices
-from app.backend.services.search_service import search_stores_for_alert
+from app.backend.services.price_service import (
+    check_price_trigger,
+    mark_alert_triggered,
+    record_prices,
+    record_prices_bulk,
+)
+from app.backend.services.relevance import QueryMatcher, filter_relevant_many
+from app.backend.services.search_service import (
+    batch_capable_stores,
+    fetch_pinned_products,
+    normalize_query,
+    search_store_batched,
+    search_stores_for_alert,
+)
 from app.backend.tasks.celery_app import celery_app
+from app.backend.tasks.runtime import get_session_factory, run_async
 from app.shared.constants import STORE_CONFIGS
 
 logger = get_logger(__name__)
 
+TICK_LOCK_KEY = "price_check:tick:lock"
 
-def _make_session_factory() -> tuple:
-    """Create a fresh engine + session factory for each task invocation.
-    This avoids stale connections across asyncio.run() calls in Celery."""
-    task_engine = create_async_engine(
-        settings.database_url, echo=False, pool_pre_ping=True, pool_size=2, max_overflow=0
+AlertGroupKey = tuple[str, tuple[str, ...]]
+
+# Products already fetched by batched searches, by (store slug, query).
+Prefetched = dict[tuple[str, str], list[ScrapedProduct]]
+
+
+def _alert_group_key(alert: Alert) -> AlertGroupKey:
+    """Alerts sharing this key would run the exact same store search.
+
+    The category only affects relevance filtering, which is applied per
+    alert after the shared scrape.
+    """
+    return (
+        normalize_query(alert.search_query),
+        tuple(sorted(alert.store_slugs or ())),
+    )
+
+
+async def _handle_trigger(session: AsyncSession, alert: Alert, lowest: ScrapedProduct) -> None:
+    await mark_alert_triggered(session, alert)
+    store_config = STORE_CONFIGS.get(lowest.store_slug, {})
+    store_name = store_config.get("name", lowest.store_slug)
+
+    await log_bot_activity(
+        session,
+        user_id=alert.user_id,
+        telegram_id=alert.user.telegram_id if alert.user else None,
+        action="alert_triggered",
+        detail=f"{alert.search_query} \u2192 {lowest.price} AZN at {lowest.store_slug}",
+    )
+
+    if alert.user and alert.user.telegram_id:
+        await send_price_alert(
+            telegram_id=alert.user.telegram_id,
+            alert=alert,
+            product_name=lowest.product_name,
+            price=lowest.price,
+            store_name=store_name,
+            product_url=lowest.product_url,
+        )
+
+    # Send browser push notifications
+    await send_push_alerts_for_alert(
+        alert=alert,
+        product_name=lowest.product_name,
+        price=lowest.price,
+        store_name=store_name,
+        product_url=lowest.product_url,
+        session=session,
     )
-    factory = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
-    return task_engine, factory
 
 
 async def _check_single_alert(alert_id: int) -> None:
-    task_engine, session_factory = _make_session_factory()
-    try:
-        async with session_factory() as session:
-            result = await session.execute(
-                select(Alert).options(selectinload(Alert.user)).where(Alert.id == alert_id)
-            )
-            alert = result.scalar_one_or_none()
-            if not alert or not alert.is_active or alert.is_triggered:
-                return
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        result = await session.execute(
+            select(Alert).options(selectinload(Alert.user)).where(Alert.id == alert_id)
+        )
+        alert = result.scalar_one_or_none()
+        if not alert or not alert.is_active or alert.is_triggered:
+            return
 
+        if alert.pinned_product_urls:
+            found = await fetch_pinned_products(alert.pinned_product_urls)
+            products = sorted(found.values(), key=lambda p: p.price)
+        else:
             products = await search_stores_for_alert(
                 alert.search_query, alert.store_slugs, product_category=alert.product_category
             )
-            alert.last_checked_at = datetime.now(timezone.utc)
+        alert.last_checked_at = datetime.now(timezone.utc)
 
-            if not products:
-                logger.info("no_products_found", alert_id=alert.id)
-                await session.commit()
-                return
+        if not products:
+            logger.info("no_products_found", alert_id=alert.id)
+            await session.commit()
+            return
+
+        await record_prices(session, alert, products)
 
-            await record_prices(session, alert, products)
+        lowest = products[0]  # Already sorted by price
+        if check_price_trigger(alert, lowest.price):
+            await _handle_trigger(session, alert, lowest)
 
+        await session.commit()
+
+
+async def _apply_group_results(alert_products: dict[int, list[ScrapedProduct]]) -> None:
+    """Record one group's search results for all its alerts in a single
+    transaction (bulk insert + bulk alert update), then fire triggers.
+
+    *alert_products* maps each alert id to its relevant products, sorted
+    by price.
+    """
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        result = await session.execute(
+            select(Alert)
+            .options(selectinload(Alert.user))
+            .where(
+                Alert.id.in_(alert_products),
+                Alert.is_active == True,  # noqa: E712
+                Alert.is_triggered == False,  # noqa: E712
+            )
+        )
+        alerts = list(result.scalars().all())
+        if not alerts:
+            return
+
+        await record_prices_bulk(session, [(alert, alert_products[alert.id]) for alert in alerts])
+
+        empty = [a.id for a in alerts if not alert_products[a.id]]
+        if empty:
+            logger.info("no_products_found", alert_ids=empty)
+        for alert in alerts:
+            products = alert_products[alert.id]
+            if not products:
+                continue
             lowest = products[0]  # Already sorted by price
-            if check_price_trigger(alert, lowest.price):
-                await mark_alert_triggered(session, alert)
-                store_config = STORE_CONFIGS.get(lowest.store_slug, {})
-                store_name = store_config.get("name", lowest.store_slug)
-
-                await log_bot_activity(
-                    session,
-                    user_id=alert.user_id,
-                    telegram_id=alert.user.telegram_id if alert.user else None,
-                    action="alert_triggered",
-                    detail=f"{alert.search_query} \u2192 {lowest.price} AZN at {lowest.store_slug}",
-                )
-
-                if alert.user and alert.user.telegram_id:
-                    await send_price_alert(
-                        telegram_id=alert.user.telegram_id,
-                        alert=alert,
-                        product_name=lowest.product_name,
-                        price=lowest.price,
-                        store_name=store_name,
-                        product_url=lowest.product_url,
-                    )
-
-                # Send browser push notifications
-                await send_push_alerts_for_alert(
-                    alert=alert,
-                    product_name=lowest.product_name,
-                    price=lowest.price,
-                    store_name=store_name,
-                    product_url=lowest.product_url,
-                    session=session,
-                )
+            if not check_price_trigger(alert, lowest.price):
+                continue
+            try:
+                await _handle_trigger(session, alert, lowest)
+            except Exception as e:
+                logger.error("alert_trigger_failed", alert_id=alert.id, error=str(e))
 
-            await session.commit()
-    finally:
-        await task_engine.dispose()
+        await session.commit()
 
 
-async def _check_all_alerts() -> None:
-    task_engine, session_factory = _make_session_factory()
-    try:
-        async with session_factory() as session:
-            alerts = await get_all_active_alerts(session)
-            alert_ids = [a.id for a in alerts]
-    finally:
-        await task_engine.dispose()
+async def _prefetch_batched(keys: list[AlertGroupKey]) -> Prefetched:
+    """Search each batch-capable store for every query the cycle needs from
+    it, many queries per request, before the groups run."""
+    queries_by_store: dict[str, dict[str, None]] = defaultdict(dict)
+    for query, store_slugs in keys:
+        for slug in batch_capable_stores(list(store_slugs)):
+            queries_by_store[slug][query] = None
+
+    stores = list(queries_by_store)
+    results = await asyncio.gather(*(
+        search_store_batched(slug, list(queries_by_store[slug])) for slug in stores
+    ))
+    return {
+        (slug, query): products
+        for slug, found in zip(stores, results)
+        for query, products in found.items()
+    }
+
+
+async def _search_group(
+    query: str, store_slugs: tuple[str, ...], prefetched: Prefetched
+) -> list[ScrapedProduct]:
+    """Unfiltered products for the group: prefetched stores are reused, the
+    rest (and any whose batch failed) are searched now."""
+    stores = list(store_slugs) or list(scraper_registry.get_all())
+    products = [p for slug in stores for p in prefetched.get((slug, query), [])]
+    remaining = [slug for slug in stores if (slug, query) not in prefetched]
+    if remaining:
+        products += await search_stores_for_alert(query, remaining, relevance_filter=False)
+    products.sort(key=lambda p: p.price)
+    return products
 
-    logger.info("price_check_started", total_alerts=len(alert_ids))
 
-    for alert_id in alert_ids:
+async def _check_alert_group(
+    semaphore: asyncio.Semaphore,
+    key: AlertGroupKey,
+    alerts: dict[int, str | None],
+    prefetched: Prefetched | None = None,
+) -> None:
+    """Scrape once for the group, then score the products for each alert's
+    category in one batch (names are tokenized once for all categories).
+
+    *alerts* maps alert id to product category.
+    """
+    query, store_slugs = key
+    async with semaphore:
         try:
-            await _check_single_alert(alert_id)
+            products = await _search_group(query, store_slugs, prefetched or {})
+            categories = list(dict.fromkeys(alerts.values()))
+            relevant = dict(zip(
+                categories,
+                filter_relevant_many(products, [QueryMatcher(query, c) for c in categories]),
+            ))
+            await _apply_group_results(
+                {alert_id: relevant[category] for alert_id, category in alerts.items()}
+            )
         except Exception as e:
-            logger.error("alert_check_failed", alert_id=alert_id, error=str(e))
+            logger.error("alert_group_check_failed", query=query, alerts=len(alerts), error=str(e))
+
+
+async def _check_pinned_alerts(alerts: list[Alert]) -> None:
+    """Re-read each pinned product once, however many alerts pin it, and
+    hand every alert its own products — no search, no relevance scoring."""
+    try:
+        found = await fetch_pinned_products([url for a in alerts for url in a.pinned_product_urls])
+        await _apply_group_results({
+            a.id: sorted(
+                (found[url] for url in a.pinned_product_urls if url in found),
+                key=lambda p: p.price,
+            )
+            for a in alerts
+        })
+    except Exception as e:
+        logger.error("pinned_alert_check_failed", alerts=len(alerts), error=str(e))
+
+
+async def _check_alerts(alerts: list[Alert]) -> None:
+    pinned = [a for a in alerts if a.pinned_product_urls]
+    groups: dict[AlertGroupKey, dict[int, str | None]] = defaultdict(dict)
+    for a in alerts:
+        if not a.pinned_product_urls:
+            groups[_alert_group_key(a)][a.id] = a.product_category
+
+    total_alerts = sum(len(group) for group in groups.values()) + len(pinned)
+    logger.info(
+        "price_check_started",
+        total_alerts=total_alerts,
+        pinned_alerts=len(pinned),
+        distinct_searches=len(groups),
+        concurrency=settings.PRICE_CHECK_CONCURRENCY,
+    )
+    started = time.monotonic()
+
+    # Stores with a GraphQL API answer many distinct queries per request,
+    # so fetch all of theirs up front.
+    try:
+        prefetched = await _prefetch_batched(list(groups))
+    except Exception as e:
+        logger.error("price_check_prefetch_failed", error=str(e))
+        prefetched = {}
+
+    # Scrape each distinct search once and fan the results out to every
+    # alert in the group. Groups run concurrently up to
+    # PRICE_CHECK_CONCURRENCY; per-store caps are enforced in search_service.
+    semaphore = asyncio.Semaphore(settings.PRICE_CHECK_CONCURRENCY)
+    await asyncio.gather(
+        *(_check_alert_group(semaphore, key, group, prefetched) for key, group in groups.items()),
+        *([_check_pinned_alerts(pinned)] if pinned else []),
+    )
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        "price_check_completed",
+        total_alerts=total_alerts,
+        distinct_searches=len(groups),
+        duration_seconds=round(elapsed, 2),
+        alerts_per_second=round(total_alerts / elapsed, 2) if elapsed > 0 else None,
+    )
 
-    logger.info("price_check_completed", total_alerts=len(alert_ids))
+
+async def _check_all_alerts() -> None:
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        alerts = await get_all_active_alerts(session)
+    await _check_alerts(alerts)
+
+
+async def _claim_tick() -> str | None:
+    """Claim the tick lock so a slow tick and the next one don't both check
+    the same due alerts.
+
+    Returns the owner token, or ``None`` if another tick is still running.
+    If Redis is unreachable the tick runs anyway.
+    """
+    token = uuid.uuid4().hex
+    try:
+        acquired = await get_redis().set(
+            TICK_LOCK_KEY, token, nx=True, ex=settings.PRICE_CHECK_TICK_LOCK_SECONDS
+        )
+    except Exception as e:
+        logger.warning("price_check_tick_lock_failed", error=str(e))
+        return token
+    return token if acquired else None
+
+
+async def _release_tick(token: str) -> None:
+    try:
+        await get_redis().eval(UNLOCK_SCRIPT, 1, TICK_LOCK_KEY, token)
+    except Exception as e:
+        logger.warning("price_check_tick_unlock_failed", error=str(e))
+
+
+async def _check_due_alerts() -> None:
+    token = await _claim_tick()
+    if token is None:
+        logger.info("price_check_tick_skipped", reason="previous tick still running")
+        return
+    try:
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            alerts = await get_due_alerts(session)
+        if alerts:
+            await _check_alerts(alerts)
+    finally:
+        await _release_tick(token)
 
 
 @celery_app.task(name="app.backend.tasks.price_check.check_all_alerts")
 def check_all_alerts() -> None:
-    asyncio.run(_check_all_alerts())
+    run_async(_check_all_alerts())
+
+
+@celery_app.task(name="app.backend.tasks.price_check.check_due_alerts")
+def check_due_alerts() -> None:
+    run_async(_check_due_alerts())
 
 
 @celery_app.task(name="app.backend.tasks.price_check.check_single_alert")
 def check_single_alert(alert_id: int) -> None:
-    asyncio.run(_check_single_alert(alert_id))
+    run_async(_check_single_alert(alert_id))
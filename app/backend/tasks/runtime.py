@@ -0,0 +1,89 @@
+"""Per-process event loop and database engine for Celery tasks.
+
+Celery tasks are synchronous, so every task used to wrap its coroutine in
+``asyncio.run()`` and build a throwaway engine to avoid asyncpg connections
+bound to a closed loop. Instead, each worker process keeps one event loop
+alive for its whole lifetime, and the engine (and its connection pool) is
+created lazily on that loop and shared by every task in the process.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.backend.core.config import settings
+from app.backend.core.logging import get_logger
+from app.backend.core.redis_client import close_redis
+from app.backend.scrapers.client_pool import client_pool
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run *coro* to completion on the process-wide task loop."""
+    return _get_loop().run_until_complete(coro)
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory bound to this process's shared engine."""
+    global _engine, _session_factory
+    if _session_factory is None:
+        _engine = create_async_engine(
+            settings.database_url,
+            echo=False,
+            pool_pre_ping=True,
+            pool_size=settings.PRICE_CHECK_CONCURRENCY,
+            max_overflow=2,
+        )
+        _session_factory = async_sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
+    return _session_factory
+
+
+async def _dispose_engine() -> None:
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs) -> None:
+    # A forked child must never reuse the parent's loop or pooled sockets.
+    global _loop, _engine, _session_factory
+    _loop = None
+    _engine = None
+    _session_factory = None
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs) -> None:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        _loop.run_until_complete(client_pool.aclose())
+        _loop.run_until_complete(close_redis())
+        _loop.run_until_complete(_dispose_engine())
+    except Exception as e:
+        logger.error("task_runtime_shutdown_failed", error=str(e))
+    finally:
+        _loop.close()
+        _loop = None
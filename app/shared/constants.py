@@ -38,6 +38,9 @@ STORE_CONFIGS = {
         "base_url": "https://tap.az",
         "search_url_template": "https://tap.az/elanlar?keywords={query}",
         "scraper_class": "TapAzScraper",
+        # Classified listings churn much faster than store catalogues.
+        "cache_ttl": 300,
+        "rate_limit": {"per_second": 1.0, "burst": 3},
     },
     StoreSlug.UMICO: {
         "name": "Birmarket",
@@ -0,0 +1,66 @@
+"""Micro-benchmark of ``detect_categories``.
+
+Compares the compiled keyword automaton with the previous approach
+(rebuild and sort every (keyword, category) pair, then substring-scan the
+query for each) on a mix of queries::
+
+    python -m benchmarks.bench_category_detector [--seconds N]
+"""
+
+import argparse
+import time
+
+from app.backend.services.category_detector import CATEGORIES, detect_categories
+
+QUERIES = [
+    "iPhone 15 Pro Max 256GB",
+    "Samsung Galaxy Tab S9",
+    "macbook air m2 13",
+    "Xiaomi Redmi Note 13 Pro",
+    "sony playstation 5 slim",
+    "LG OLED televizor 55",
+    "Bosch paltaryuyan 8 kq",
+    "JBL Tune 520BT",
+    "dyson tozsoran v15",
+    "kofe maşını delonghi",
+]
+
+
+def _linear(query: str) -> list:
+    query_lower = query.lower()
+    pairs = [(kw, cat) for cat in CATEGORIES.values() for kw in cat.trigger_keywords]
+    pairs.sort(key=lambda pair: len(pair[0]), reverse=True)
+    detected, seen = [], set()
+    for kw, cat in pairs:
+        if cat.slug not in seen and kw in query_lower:
+            detected.append(cat)
+            seen.add(cat.slug)
+    return detected or [CATEGORIES["main_product"]]
+
+
+def _rate(fn, seconds: float) -> float:
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for query in QUERIES:
+            fn(query)
+        calls += len(QUERIES)
+    return calls / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    keywords = sum(len(c.trigger_keywords) for c in CATEGORIES.values())
+    print(f"{len(QUERIES)} queries, {keywords} trigger keywords\n")
+    linear = _rate(_linear, args.seconds)
+    indexed = _rate(detect_categories, args.seconds)
+    print("queries/s")
+    print(f"  sort + substring scan {linear:>12,.0f}")
+    print(f"  keyword automaton     {indexed:>12,.0f}   x{indexed / linear:.1f}")
+
+
+if __name__ == "__main__":
+    main()
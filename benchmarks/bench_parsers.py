@@ -0,0 +1,89 @@
+"""Parse time of the HTML scrapers on saved search pages.
+
+Compares the targeted extraction paths — the ``__NEXT_DATA__`` slice for
+Baku Electronics and the lxml/XPath grid extractor for Irshad — with the
+BeautifulSoup code they fall back to, and checks both return the same
+products. For Baku Electronics it also sizes the ``/_next/data`` JSON
+response against the full page::
+
+    python -m benchmarks.bench_parsers [--pages DIR] [--seconds N]
+
+``DIR`` holds ``irshad_search.html`` and ``baku_electronics_search.html``;
+save fresh ones from the sites (or record them with ``SCRAPER_RECORD_DIR``)
+to measure against current markup.
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from app.backend.scrapers import baku_electronics
+from app.backend.scrapers.baku_electronics import BakuElectronicsScraper
+from app.backend.scrapers.irshad import IrshadScraper
+
+PAGES_DIR = Path(__file__).resolve().parent / "pages"
+
+
+def _rate(fn, seconds: float) -> float:
+    """Calls of *fn* per second, repeated for about *seconds*."""
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        fn()
+        calls += 1
+    return calls / elapsed
+
+
+def _bench(label: str, fast, fallback, seconds: float) -> None:
+    fast_rate = _rate(fast, seconds)
+    fallback_rate = _rate(fallback, seconds)
+    print(
+        f"{label:<18} fast {1000 / fast_rate:7.3f} ms   "
+        f"beautifulsoup {1000 / fallback_rate:7.3f} ms   x{fast_rate / fallback_rate:.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=Path, default=PAGES_DIR)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    irshad_html = (args.pages / "irshad_search.html").read_text(encoding="utf-8")
+    irshad = IrshadScraper()
+    fast_cards = irshad._extract_cards(irshad_html, 24)
+    assert fast_cards == irshad._extract_cards_soup(irshad_html, 24), "irshad extractors disagree"
+    print(f"irshad: {len(irshad.parse_results(irshad_html, 24))} products, {len(irshad_html) // 1024} KiB page")
+    _bench(
+        "irshad",
+        lambda: irshad._extract_cards(irshad_html, 24),
+        lambda: irshad._extract_cards_soup(irshad_html, 24),
+        args.seconds,
+    )
+
+    baku_html = (args.pages / "baku_electronics_search.html").read_text(encoding="utf-8")
+    assert baku_electronics.extract_next_data(baku_html) == baku_electronics._extract_next_data_soup(baku_html), (
+        "baku_electronics extractors disagree"
+    )
+    baku = BakuElectronicsScraper()
+    print(f"baku_electronics: {len(baku.parse_results(baku_html, 24))} products, {len(baku_html) // 1024} KiB page")
+    _bench(
+        "baku_electronics",
+        lambda: baku_electronics.extract_next_data(baku_html),
+        lambda: baku_electronics._extract_next_data_soup(baku_html),
+        args.seconds,
+    )
+
+    # What the /_next/data/<buildId> route would send instead of the page.
+    page_props = baku_electronics.extract_next_data(baku_html)["props"]["pageProps"]
+    data_route = json.dumps({"pageProps": page_props, "__N_SSP": True}, ensure_ascii=False)
+    print(
+        f"baku_electronics data route: {len(data_route.encode()) // 1024} KiB "
+        f"vs {len(baku_html.encode()) // 1024} KiB page, "
+        f"parse {1000 / _rate(lambda: json.loads(data_route), args.seconds):.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Throughput of relevance scoring on a recorded search.
+
+Scores every result of ``ucuzbottest_samsung.json`` against its query under
+each product category — per call and through a reused ``QueryMatcher`` —
+and compares the compiled accessory/exclude matchers with the per-word
+substring scans they replaced::
+
+    python -m benchmarks.bench_relevance [path/to/results.json] [--seconds N]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from app.backend.services.category_detector import CATEGORIES
+from app.backend.services.relevance import (
+    ACCESSORY_WORDS,
+    QueryMatcher,
+    has_accessory_word,
+    score_relevance,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CORPUS = ROOT / "ucuzbottest_samsung.json"
+
+
+def _rate(fn, names: list[str], seconds: float) -> float:
+    """Calls of *fn* per second over *names*, repeated for about *seconds*."""
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for name in names:
+            fn(name)
+        calls += len(names)
+    return calls / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", nargs="?", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    data = json.loads(args.corpus.read_text(encoding="utf-8"))
+    query = data["query"]
+    names = [r["product_name"] for r in data["results"]]
+    lowered = [n.lower() for n in names]
+    print(f"corpus: {args.corpus.name} — query {query!r}, {len(names)} products\n")
+
+    naive = _rate(lambda n: any(w in n for w in ACCESSORY_WORDS), lowered, args.seconds)
+    compiled = _rate(has_accessory_word, lowered, args.seconds)
+    print("accessory check (products/s)")
+    print(f"  per-word scan   {naive:>12,.0f}")
+    print(f"  compiled        {compiled:>12,.0f}   x{compiled / naive:.1f}\n")
+
+    print("score_relevance (products/s)")
+    for slug, category in CATEGORIES.items():
+        rate = _rate(lambda n: score_relevance(query, n, slug), names, args.seconds)
+        if category.exclude_words:
+            words = category.exclude_words
+            naive = _rate(lambda n: any(w in n for w in words), lowered, args.seconds)
+            compiled = _rate(lambda n: category.exclude_pattern.search(n), lowered, args.seconds)
+            exclude = f"exclude check x{compiled / naive:.1f}"
+        else:
+            exclude = ""
+        print(f"  {slug:<14}{rate:>12,.0f}   {exclude}")
+
+    print("\nQueryMatcher, query analysed once (products/s)")
+    for slug in CATEGORIES:
+        matcher = QueryMatcher(query, slug)
+        rate = _rate(matcher.score, names, args.seconds)
+        print(f"  {slug:<14}{rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""End-to-end search latency against the store simulator.
+
+Replays recorded store responses (see ``benchmarks/store_simulator.py``) and
+drives ``search_all_stores`` with ``--concurrency`` searches in flight until
+``--requests`` have completed, then reports latency percentiles, throughput
+and the share of store errors. Identical searches in flight at the same
+time are coalesced by the search service, as in production, so the
+simulator sees fewer requests than there are searches::
+
+    python -m benchmarks.bench_search benchmarks/cassettes --concurrency 20 \\
+        --requests 500 --latency 150 --jitter 50 --error-rate 0.02
+
+The simulator runs in-process on a free port unless ``--simulator-url``
+points at one started separately (which keeps its work off this event
+loop). ``--live`` searches the real stores instead; combined with
+``SCRAPER_RECORD_DIR`` that is how cassettes are recorded.
+"""
+
+import argparse
+import asyncio
+import socket
+import time
+from pathlib import Path
+
+from app.backend.core.config import settings
+from app.backend.scrapers.client_pool import client_pool
+from app.backend.scrapers.registry import scraper_registry
+from app.backend.services.search_service import search_all_stores
+
+DEFAULT_CASSETTES = Path(__file__).resolve().parent / "cassettes"
+DEFAULT_QUERIES = ["samsung", "iphone 15", "airpods pro", "playstation 5", "macbook air"]
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _start_simulator(args):
+    import uvicorn
+
+    from benchmarks.store_simulator import SimulatorConfig, create_app
+
+    config = SimulatorConfig(args.latency, args.jitter, args.error_rate, args.recorded_latency, args.seed)
+    app = create_app(args.cassettes, config)
+    if not app.state.cassettes:
+        raise SystemExit(f"no cassettes in {args.cassettes}; record some with SCRAPER_RECORD_DIR and --live")
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server, task, f"http://127.0.0.1:{port}", app
+
+
+async def _run(args) -> None:
+    server = task = app = None
+    if not args.live:
+        if args.simulator_url:
+            settings.SCRAPER_SIMULATOR_URL = args.simulator_url
+        else:
+            server, task, settings.SCRAPER_SIMULATOR_URL, app = await _start_simulator(args)
+
+    stores = args.stores or list(scraper_registry.get_all())
+    latencies: list[float] = []
+    store_errors = 0
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int) -> None:
+        nonlocal store_errors
+        query = args.queries[i % len(args.queries)]
+        async with semaphore:
+            started = time.perf_counter()
+            _, errors = await search_all_stores(query, stores, use_cache=False)
+            latencies.append(time.perf_counter() - started)
+        store_errors += len(errors)
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+    finally:
+        elapsed = time.perf_counter() - started
+        await client_pool.aclose()
+        if server is not None:
+            server.should_exit = True
+            await task
+
+    ordered = sorted(latencies)
+    print(f"searches:    {len(ordered)} at concurrency {args.concurrency}, {elapsed:.1f}s")
+    print(f"throughput:  {len(ordered) / elapsed:.1f} searches/s")
+    for pct in (50, 90, 95, 99):
+        print(f"p{pct:<10} {percentile(ordered, pct) * 1000:8.1f} ms")
+    print(f"max         {ordered[-1] * 1000:8.1f} ms")
+    store_searches = len(ordered) * len(stores)
+    print(f"store errors: {store_errors}/{store_searches} ({store_errors / max(store_searches, 1):.1%})")
+    if app is not None:
+        print(f"simulator:   {app.state.stats}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassettes", type=Path, nargs="?", default=DEFAULT_CASSETTES)
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES)
+    parser.add_argument("--stores", nargs="+", default=None)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated latency, ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="ms, uniform ±")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--recorded-latency", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--simulator-url", default="")
+    parser.add_argument("--live", action="store_true", help="search the real stores")
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Relevance quality and throughput suite over labelled search results.
+
+Each corpus in ``benchmarks/corpora/`` is a recorded search: the query and
+its products, each labelled with a ``kind`` (``phone``, ``tv``,
+``appliance``, ``accessory``, ``other``, ...) and, when the product is not
+the item the query asks for, ``"match": false``. A product is expected to
+pass ``filter_relevant`` under a category when it matches the query and:
+
+- no category, ``all``: always;
+- ``accessory``: its kind is ``accessory``;
+- ``main_product``: its kind is anything but ``accessory``;
+- any other category: its kind is that category.
+
+The suite reports precision/recall for every corpus × category and the
+scoring throughput. Throughput is also reported relative to a fixed
+pure-Python calibration loop so it can be compared across machines.
+
+``relevance_baseline.json`` holds hand-set quality ``floors`` for the
+categories a user would actually pick for each corpus's query. Recall is
+held at 1.0 (a real match must never be filtered out under its own
+category); precision floors sit just under today's values and are raised
+as the filter improves. ``--check`` exits non-zero if quality drops below
+a floor. Throughput is too noisy on shared machines to gate on, so a drop
+of more than ``tolerance`` under the recorded value is only reported
+(``--strict-throughput`` fails on it too, for a quiet dedicated machine).
+``--update-baseline`` re-records only the throughput::
+
+    python -m benchmarks.relevance_suite            # report
+    python -m benchmarks.relevance_suite --check    # CI gate
+    python -m benchmarks.relevance_suite --update-baseline
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.backend.services.category_detector import CATEGORIES
+from app.backend.services.relevance import filter_relevant, score_relevance
+
+BENCH_DIR = Path(__file__).resolve().parent
+CORPORA_DIR = BENCH_DIR / "corpora"
+BASELINE_PATH = BENCH_DIR / "relevance_baseline.json"
+
+# Quality is deterministic; allow only float noise.
+_QUALITY_EPSILON = 1e-9
+
+
+@dataclass
+class LabelledProduct:
+    product_name: str
+    kind: str
+    match: bool = True
+
+
+@dataclass
+class Corpus:
+    name: str
+    query: str
+    products: list[LabelledProduct]
+
+
+@dataclass
+class Quality:
+    precision: float
+    recall: float
+
+
+def load_corpora(directory: Path = CORPORA_DIR) -> list[Corpus]:
+    corpora = []
+    for path in sorted(directory.glob("*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        products = [
+            LabelledProduct(p["product_name"], p["kind"], p.get("match", True))
+            for p in data["products"]
+        ]
+        corpora.append(Corpus(path.stem, data["query"], products))
+    return corpora
+
+
+def categories() -> list[str | None]:
+    return [None, *CATEGORIES]
+
+
+def expected_relevant(product: LabelledProduct, category: str | None) -> bool:
+    if not product.match:
+        return False
+    if category in (None, "all"):
+        return True
+    if category == "accessory":
+        return product.kind == "accessory"
+    if category == "main_product":
+        return product.kind != "accessory"
+    return product.kind == category
+
+
+def measure_quality(corpus: Corpus, category: str | None) -> Quality:
+    kept = {id(p) for p in filter_relevant(corpus.products, corpus.query, product_category=category)}
+    expected = {id(p) for p in corpus.products if expected_relevant(p, category)}
+    true_positives = len(kept & expected)
+    # Nothing kept / nothing expected counts as perfect, not undefined.
+    precision = true_positives / len(kept) if kept else float(not expected)
+    recall = true_positives / len(expected) if expected else 1.0
+    return Quality(precision, recall)
+
+
+def _calibration_rate(seconds: float) -> float:
+    """Iterations/s of a fixed string workload, to normalise for machine speed."""
+    text = "Smartfon Samsung Galaxy A06 4GB/128GB GOLD (A065)"
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for _ in range(1000):
+            tokens = set(text.lower().replace("/", " ").split())
+            "samsung" in tokens and any(t in text for t in tokens)
+        iterations += 1000
+    return iterations / elapsed
+
+
+def measure_throughput(corpora: list[Corpus], seconds: float) -> float:
+    """Products scored per second by score_relevance, over every corpus and category."""
+    work = [
+        (corpus.query, p.product_name, category)
+        for corpus in corpora
+        for category in categories()
+        for p in corpus.products
+    ]
+    scored = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for query, name, category in work:
+            score_relevance(query, name, category)
+        scored += len(work)
+    return scored / elapsed
+
+
+def run(seconds: float) -> dict:
+    corpora = load_corpora()
+    quality = {
+        corpus.name: {
+            str(category): measure_quality(corpus, category).__dict__
+            for category in categories()
+        }
+        for corpus in corpora
+    }
+    throughput = measure_throughput(corpora, seconds)
+    calibration = _calibration_rate(seconds)
+    return {
+        "quality": quality,
+        "products_per_second": throughput,
+        "relative_throughput": throughput / calibration,
+    }
+
+
+def check(results: dict, baseline: dict) -> list[str]:
+    """Quality floors *results* falls below, as messages."""
+    failures = []
+    for corpus, per_category in baseline["floors"].items():
+        for category, floors in per_category.items():
+            actual = results["quality"].get(corpus, {}).get(category)
+            if actual is None:
+                failures.append(f"{corpus}/{category}: missing from results")
+                continue
+            for metric in ("precision", "recall"):
+                if actual[metric] < floors[metric] - _QUALITY_EPSILON:
+                    failures.append(
+                        f"{corpus}/{category}: {metric} {actual[metric]:.3f} < floor {floors[metric]:.3f}"
+                    )
+    return failures
+
+
+def check_throughput(results: dict, baseline: dict) -> str | None:
+    """A message if relative throughput fell more than the tolerance."""
+    floor = baseline["relative_throughput"] * (1 - baseline["tolerance"])
+    if results["relative_throughput"] >= floor:
+        return None
+    return (
+        f"relative throughput {results['relative_throughput']:.3f} < {floor:.3f} "
+        f"(baseline {baseline['relative_throughput']:.3f} - {baseline['tolerance']:.0%})"
+    )
+
+
+def _report(results: dict) -> None:
+    for corpus, per_category in results["quality"].items():
+        print(f"{corpus}")
+        for category, q in per_category.items():
+            print(f"  {category:<14} precision {q['precision']:.2f}   recall {q['recall']:.2f}")
+    print(
+        f"\nthroughput: {results['products_per_second']:,.0f} products/s "
+        f"(relative {results['relative_throughput']:.3f})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--check", action="store_true", help="fail if quality drops below the floors")
+    parser.add_argument("--strict-throughput", action="store_true", help="with --check, fail on throughput drops too")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=None, help="allowed throughput drop (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = run(args.seconds)
+    _report(results)
+
+    if args.update_baseline:
+        previous = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        baseline = {
+            "tolerance": args.tolerance or previous.get("tolerance", 0.25),
+            "relative_throughput": round(results["relative_throughput"], 4),
+            # Floors are set by hand, not recorded.
+            "floors": previous.get("floors", {}),
+        }
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nbaseline written to {BASELINE_PATH.name}")
+
+    if args.check:
+        baseline = json.loads(BASELINE_PATH.read_text())
+        if args.tolerance is not None:
+            baseline["tolerance"] = args.tolerance
+        failures = check(results, baseline)
+        slow = check_throughput(results, baseline)
+        if slow and args.strict_throughput:
+            failures.append(slow)
+        elif slow:
+            print(f"\nwarning (not gated): {slow}")
+        if failures:
+            print("\nREGRESSIONS:")
+            for failure in failures:
+                print(f"  {failure}")
+            sys.exit(1)
+        print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
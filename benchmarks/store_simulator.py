@@ -0,0 +1,93 @@
+"""Local HTTP server that replays recorded store responses.
+
+Record cassettes by running searches with ``SCRAPER_RECORD_DIR`` set, then
+serve them and point the scrapers here with ``SCRAPER_SIMULATOR_URL``::
+
+    SCRAPER_RECORD_DIR=benchmarks/cassettes python -m benchmarks.bench_search --live
+    python -m benchmarks.store_simulator benchmarks/cassettes --port 8900 \\
+        --latency 150 --jitter 50 --error-rate 0.02
+
+Each response is delayed by ``latency`` ± ``jitter`` milliseconds (or by
+the latency observed when it was recorded, with ``--recorded-latency``), and
+a fraction ``error_rate`` of requests fail with a 503. Requests without a
+cassette get a 404.
+"""
+
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import FastAPI, Request, Response
+
+from app.backend.scrapers.recording import (
+    ORIGINAL_URL_HEADER,
+    cassette_response,
+    load_cassettes,
+    request_key,
+)
+
+
+@dataclass
+class SimulatorConfig:
+    latency: float = 0.0  # milliseconds
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    recorded_latency: bool = False
+    seed: int | None = None
+
+
+def create_app(cassette_dir: Path, config: SimulatorConfig) -> FastAPI:
+    cassettes = load_cassettes(cassette_dir)
+    rng = random.Random(config.seed)
+    app = FastAPI(title="Store simulator")
+    app.state.cassettes = cassettes
+    app.state.stats = {"served": 0, "errors": 0, "missing": 0}
+
+    def delay(cassette: dict | None) -> float:
+        base = cassette["elapsed"] * 1000 if config.recorded_latency and cassette else config.latency
+        return max(0.0, base + rng.uniform(-config.jitter, config.jitter)) / 1000
+
+    @app.api_route("/{path:path}", methods=["GET", "POST"])
+    async def replay(path: str, request: Request) -> Response:
+        url = request.headers.get(ORIGINAL_URL_HEADER, "")
+        cassette = cassettes.get(request_key(request.method, url, await request.body()))
+        await asyncio.sleep(delay(cassette))
+
+        if cassette is None:
+            app.state.stats["missing"] += 1
+            return Response(f"no cassette for {request.method} {url}\n", status_code=404)
+        if rng.random() < config.error_rate:
+            app.state.stats["errors"] += 1
+            return Response("simulated outage\n", status_code=503)
+
+        app.state.stats["served"] += 1
+        status, headers, body = cassette_response(cassette)
+        return Response(body, status_code=status, headers=headers)
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassettes", type=Path)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="milliseconds, uniform ±")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--recorded-latency", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = SimulatorConfig(args.latency, args.jitter, args.error_rate, args.recorded_latency, args.seed)
+    app = create_app(args.cassettes, config)
+    print(f"serving {len(app.state.cassettes)} cassettes on http://{args.host}:{args.port}")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,74 +1,91 @@
+import json
+
+import fakeredis
 import pytest
 
 
 @pytest.fixture
-def kontakt_html():
-    return """
-    <div class="product-item">
-        <a href="/iphone-15-128gb.html" class="product-item-link">Apple iPhone 15 128GB Black</a>
-        <span class="price" data-price-amount="1799.00">1 799 ₼</span>
-        <img src="/media/catalog/product/iphone15.jpg" />
-    </div>
-    <div class="product-item">
-        <a href="/iphone-15-256gb.html" class="product-item-link">Apple iPhone 15 256GB Blue</a>
-        <span class="price" data-price-amount="2099.00">2 099 ₼</span>
-        <img src="/media/catalog/product/iphone15-256.jpg" />
-    </div>
-    """
+async def fake_redis():
+    """In-memory Redis (Lua scripts included) for the shared-state helpers."""
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield redis
+    await redis.aclose()
+
+
+# Trimmed copies of what each store currently returns for "iphone 15".
 
 
 @pytest.fixture
-def baku_electronics_html():
-    return """
-    <div class="product-card">
-        <h3><a href="/products/iphone-15-128gb" class="product-card__name">iPhone 15 128GB</a></h3>
-        <div class="product-card__price">1 749 ₼</div>
-        <img src="/images/iphone15.webp" />
-    </div>
-    <div class="product-card">
-        <h3><a href="/products/iphone-15-pro" class="product-card__name">iPhone 15 Pro 256GB</a></h3>
-        <div class="product-card__price">2 899,00 ₼</div>
-        <img src="/images/iphone15pro.webp" />
-    </div>
-    """
+def kontakt_graphql_response():
+    def item(name: str, url_key: str, price: float, image: str) -> dict:
+        return {
+            "name": name,
+            "url_key": url_key,
+            "price_range": {"minimum_price": {"final_price": {"value": price, "currency": "AZN"}}},
+            "small_image": {"url": f"https://kontakt.az/media/catalog/product/{image}"},
+        }
+
+    return {"data": {"q0": {
+        "items": [
+            item("Apple iPhone 15 128GB Black", "iphone-15-128gb-black", 1799, "iphone15.jpg"),
+            item("Apple iPhone 15 256GB Blue", "iphone-15-256gb-blue", 2099, "iphone15-256.jpg"),
+        ],
+        "total_count": 2,
+    }}}
 
 
 @pytest.fixture
-def irshad_html():
-    return """
-    <div class="product-card">
-        <a href="/product/apple-iphone-15" class="product-card__name">Apple iPhone 15 128GB</a>
-        <span class="product-card__price">1.799,00 ₼</span>
-        <img data-src="/uploads/iphone15.jpg" />
-    </div>
-    """
+def baku_electronics_html():
+    next_data = {
+        "buildId": "build-1",
+        "props": {"pageProps": {"products": {"products": {"items": [
+            {"name": "iPhone 15 128GB", "slug": "iphone-15-128gb", "price": 1749, "discount": "0",
+             "image": "https://www.bakuelectronics.az/images/iphone15.webp"},
+            {"name": "iPhone 15 Pro 256GB", "slug": "iphone-15-pro-256gb", "price": 2999, "discount": "100",
+             "image": ""},
+        ]}}}},
+    }
+    return (
+        '<html><head></head><body><div id="__next"></div>'
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script>'
+        "</body></html>"
+    )
 
 
 @pytest.fixture
-def tap_az_html():
+def irshad_html():
     return """
-    <div class="products-i">
-        <a href="/elan/12345" class="products-name">iPhone 15 128GB, yeni</a>
-        <span class="products-price">1 650 AZN</span>
-        <img src="/uploads/img1.jpg" />
-    </div>
-    <div class="products-i">
-        <a href="/elan/12346" class="products-name">iPhone 15 Pro Max</a>
-        <span class="products-price">2 800 AZN</span>
-        <img src="/uploads/img2.jpg" />
-        <span class="products-i__shop">Mağaza</span>
+    <div id="productGridItems">
+        <div class="product">
+            <div class="product__img"><img data-src="/uploads/iphone15.jpg" /></div>
+            <a href="/az/product/apple-iphone-15" class="product__name">Apple iPhone 15 128GB</a>
+            <span class="old-price">1.899,00 ₼</span>
+            <span class="new-price">1.799,00 ₼</span>
+        </div>
+        <div class="product">
+            <a href="/az/product/apple-iphone-15-pro" class="product__name">Apple iPhone 15 Pro 256GB</a>
+        </div>
     </div>
     """
 
 
 @pytest.fixture
-def umico_html():
-    return """
-    <div class="product-card">
-        <a href="/products/iphone-15-128" class="product-card__name">Apple iPhone 15 128GB</a>
-        <div class="product-card__price">1 750 ₼</div>
-        <img src="/images/products/iphone15.jpg" />
-    </div>
-    """
+def tap_az_graphql_response():
+    return {"data": {"q0": {"nodes": [
+        {"id": "12345", "title": "iPhone 15 128GB, yeni", "price": 1650, "path": "/elanlar/12345",
+         "region": "Bakı", "photo": {"url": "https://tap.az/uploads/img1.jpg"}, "shop": None},
+        {"id": "12346", "title": "iPhone 15 Pro Max", "price": 2800, "path": "/elanlar/12346",
+         "region": "Bakı", "photo": None, "shop": {"id": "77"}},
+        {"id": "12347", "title": "Samsung Galaxy A06", "price": 249, "path": "/elanlar/12347",
+         "region": "Bakı", "photo": None, "shop": None},
+    ]}}}
 
 
+@pytest.fixture
+def umico_suggests_response():
+    return {"products": [
+        {"id": 501, "name": "Apple iPhone 15 128GB", "slugged_name": "apple-iphone-15-128gb",
+         "retail_price": 1750, "main_img": {"medium": "https://birmarket.az/images/iphone15.jpg"}},
+        {"id": 502, "name": "Apple iPhone 15 çexol", "slugged_name": "apple-iphone-15-cexol",
+         "retail_price": None, "main_img": {}},
+    ]}
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from app.backend.core.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(flights.do("k", fetch) for _ in range(10)))
+
+    assert calls == 1
+    assert results == [42] * 10
+    # Forgotten once done: the next caller starts a new call.
+    assert await flights.do("k", fetch) == 42
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_error_is_raised_to_every_waiter():
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("store down")
+
+    results = await asyncio.gather(*(flights.do("k", fetch) for _ in range(5)), return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) and str(r) == "store down" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    flights: SingleFlight[int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> int:
+        await release.wait()
+        return 42
+
+    impatient = asyncio.ensure_future(flights.do("k", fetch))
+    patient = asyncio.ensure_future(flights.do("k", fetch))
+    await asyncio.sleep(0)
+    impatient.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await patient == 42
+    with pytest.raises(asyncio.CancelledError):
+        await impatient
@@ -0,0 +1,55 @@
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.backend.db import partitions
+
+
+def test_add_months_rolls_over_year():
+    assert partitions.add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert partitions.add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def _existing(months: list[date]):
+    async def _list(session, table):
+        return {month: partitions.partition_name(table, month) for month in months}
+    return _list
+
+
+def _statements(session: MagicMock) -> list[str]:
+    return [str(call.args[0]) for call in session.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_only_missing_months():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.scalar = AsyncMock(return_value=0)
+    with patch.object(partitions, "list_partitions", _existing([date(2026, 10, 1)])), \
+            patch.object(partitions.settings, "PRICE_PARTITIONS_AHEAD_MONTHS", 1):
+        created = await partitions.ensure_partitions(session, today=date(2026, 10, 17))
+
+    assert created == ["price_observations_2026_11", "alert_observations_2026_11"]
+
+
+@pytest.mark.asyncio
+async def test_drop_partitions_before_keeps_month_straddling_cutoff():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    months = [date(2026, 6, 1), date(2026, 7, 1), date(2026, 8, 1)]
+    with patch.object(partitions, "list_partitions", _existing(months)):
+        dropped = await partitions.drop_partitions_before(
+            session, datetime(2026, 8, 10, tzinfo=timezone.utc)
+        )
+
+    assert dropped == [
+        "alert_observations_2026_06",
+        "alert_observations_2026_07",
+        "price_observations_2026_06",
+        "price_observations_2026_07",
+    ]
+    statements = _statements(session)
+    # Live runs are carried forward before any partition is detached.
+    assert statements[0].startswith("CREATE TEMP TABLE carried_observations")
+    assert "DETACH PARTITION alert_observations_2026_06" in statements[4]
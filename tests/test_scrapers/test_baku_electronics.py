@@ -1,21 +1,94 @@
 from decimal import Decimal
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
-from app.backend.scrapers.baku_electronics import BakuElectronicsScraper
+from app.backend.scrapers.baku_electronics import BakuElectronicsScraper, _extract_next_data_soup, extract_next_data
+
+SAVED_PAGE = Path(__file__).resolve().parents[2] / "benchmarks" / "pages" / "baku_electronics_search.html"
 
 
 @pytest.mark.asyncio
-async def test_baku_electronics_html_parsing(baku_electronics_html):
+async def test_baku_electronics_html_parsing(baku_electronics_html, monkeypatch):
+    monkeypatch.setattr(BakuElectronicsScraper, "_build_id", None)
     scraper = BakuElectronicsScraper()
 
     with patch.object(scraper, "_get_page", new_callable=AsyncMock, return_value=baku_electronics_html):
-        with patch.object(scraper, "_delay", new_callable=AsyncMock):
-            results = await scraper.search("iphone 15")
+        results = await scraper.search("iphone 15")
 
     assert len(results) == 2
     assert results[0].product_name == "iPhone 15 128GB"
     assert results[0].price == Decimal("1749.00")
     assert results[0].store_slug == "baku_electronics"
     assert results[1].price == Decimal("2899.00")
+    assert BakuElectronicsScraper._build_id == "build-1"
+
+
+def test_next_data_slice_matches_beautifulsoup_on_saved_page(monkeypatch):
+    monkeypatch.setattr(BakuElectronicsScraper, "_build_id", None)
+    html = SAVED_PAGE.read_text()
+
+    assert extract_next_data(html) == _extract_next_data_soup(html)
+    assert len(BakuElectronicsScraper().parse_results(html, 24)) == 24
+
+
+def test_parse_results_falls_back_when_tag_is_not_sliceable():
+    # Single-quoted id: the slice misses it, BeautifulSoup still finds it.
+    html = (
+        "<html><body><script id='__NEXT_DATA__' type='application/json'>"
+        '{"props": {"pageProps": {"products": {"products": {"items": '
+        '[{"name": "iPhone 15 128GB", "slug": "iphone-15", "price": 1749, "discount": "0"}]}}}}}'
+        "</script></body></html>"
+    )
+
+    results = BakuElectronicsScraper().parse_results(html)
+
+    assert [(p.product_name, p.price) for p in results] == [("iPhone 15 128GB", Decimal("1749.00"))]
+
+
+DATA_ROUTE_PROPS = {
+    "pageProps": {
+        "products": {"products": {"items": [
+            {"name": "iPhone 15 128GB", "slug": "iphone-15", "price": 1749, "discount": "0"},
+        ]}}
+    },
+    "__N_SSP": True,
+}
+
+
+@pytest.mark.asyncio
+async def test_known_build_id_uses_data_route(monkeypatch):
+    monkeypatch.setattr(BakuElectronicsScraper, "_build_id", "abc123")
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=DATA_ROUTE_PROPS)
+
+    scraper = BakuElectronicsScraper()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client), \
+                patch.object(scraper, "_get_page", new_callable=AsyncMock) as get_page:
+            results = await scraper.search("iphone 15")
+
+    assert [(p.product_name, p.price) for p in results] == [("iPhone 15 128GB", Decimal("1749.00"))]
+    assert requests[0].url.path == "/_next/data/abc123/axtaris-neticesi.json"
+    assert requests[0].url.params["name"] == "iphone 15"
+    get_page.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rotated_build_id_falls_back_to_html_and_refreshes(monkeypatch):
+    monkeypatch.setattr(BakuElectronicsScraper, "_build_id", "stale")
+    scraper = BakuElectronicsScraper()
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client), \
+                patch.object(scraper, "_get_page", new_callable=AsyncMock, return_value=SAVED_PAGE.read_text()):
+            results = await scraper.search("iphone", max_results=24)
+
+    assert len(results) == 24
+    assert BakuElectronicsScraper._build_id == "b7Xk2mQp9"
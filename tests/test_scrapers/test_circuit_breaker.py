@@ -0,0 +1,100 @@
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+import pytest
+
+from app.backend.core.config import settings
+from app.backend.core.exceptions import StoreUnavailable
+from app.backend.scrapers import circuit_breaker as breaker_module
+from app.backend.scrapers.circuit_breaker import CLOSED, HALF_OPEN, OPEN, circuit_breaker
+from app.backend.scrapers.kontakt import KontaktScraper
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast():
+    scraper = KontaktScraper()
+
+    with patch.object(circuit_breaker, "allow_request", new_callable=AsyncMock, return_value=False):
+        with patch.object(scraper, "search", new_callable=AsyncMock) as search:
+            with pytest.raises(StoreUnavailable):
+                await scraper.safe_search("iphone")
+
+    search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failure_and_success_are_recorded():
+    scraper = KontaktScraper()
+
+    with patch.object(circuit_breaker, "allow_request", new_callable=AsyncMock, return_value=True), \
+            patch.object(circuit_breaker, "record_failure", new_callable=AsyncMock) as record_failure, \
+            patch.object(circuit_breaker, "record_success", new_callable=AsyncMock) as record_success:
+        with patch.object(scraper, "search", side_effect=Exception("Connection error")):
+            assert await scraper.safe_search("iphone") == []
+        with patch.object(scraper, "search", new_callable=AsyncMock, return_value=[]):
+            await scraper.safe_search("iphone")
+
+    record_failure.assert_awaited_once_with("kontakt")
+    record_success.assert_awaited_once_with("kontakt")
+
+
+@pytest.fixture
+def redis(fake_redis):
+    with patch.object(breaker_module, "get_redis", return_value=fake_redis):
+        yield fake_redis
+
+
+async def _trip(store_slug: str) -> None:
+    for _ in range(settings.SCRAPER_BREAKER_FAILURE_THRESHOLD):
+        await circuit_breaker.record_failure(store_slug)
+
+
+async def test_opens_at_failure_threshold(redis):
+    for _ in range(settings.SCRAPER_BREAKER_FAILURE_THRESHOLD - 1):
+        await circuit_breaker.record_failure("kontakt")
+    assert await circuit_breaker.state("kontakt") == CLOSED
+    assert 0 < await redis.ttl("breaker:kontakt:failures") <= settings.SCRAPER_BREAKER_WINDOW_SECONDS
+
+    await circuit_breaker.record_failure("kontakt")
+
+    assert await circuit_breaker.state("kontakt") == OPEN
+    assert not await circuit_breaker.allow_request("kontakt")
+    assert 0 < await redis.ttl("breaker:kontakt:open") <= settings.SCRAPER_BREAKER_OPEN_SECONDS
+    assert not await redis.exists("breaker:kontakt:failures")
+    # Other stores are unaffected.
+    assert await circuit_breaker.allow_request("irshad")
+
+
+async def test_closed_open_half_open_closed_cycle(redis):
+    await _trip("kontakt")
+    await redis.delete("breaker:kontakt:open")  # the open period expires
+
+    assert await circuit_breaker.state("kontakt") == HALF_OPEN
+    assert await circuit_breaker.allow_request("kontakt")
+    # Only one probe at a time.
+    assert not await circuit_breaker.allow_request("kontakt")
+
+    await circuit_breaker.record_success("kontakt")
+
+    assert await circuit_breaker.state("kontakt") == CLOSED
+    assert await circuit_breaker.allow_request("kontakt")
+    assert await redis.keys("breaker:kontakt:*") == []
+
+
+async def test_failed_probe_reopens_immediately(redis):
+    await _trip("kontakt")
+    await redis.delete("breaker:kontakt:open")
+    assert await circuit_breaker.allow_request("kontakt")
+
+    await circuit_breaker.record_failure("kontakt")
+
+    assert await circuit_breaker.state("kontakt") == OPEN
+    assert not await redis.exists("breaker:kontakt:probe")
+
+
+async def test_unreachable_redis_keeps_breaker_closed():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    with patch.object(breaker_module, "get_redis", return_value=fakeredis.FakeAsyncRedis(server=server)):
+        await _trip("kontakt")
+        assert await circuit_breaker.allow_request("kontakt")
@@ -0,0 +1,25 @@
+import pytest
+
+from app.backend.scrapers.client_pool import ClientPool
+
+
+@pytest.mark.asyncio
+async def test_client_reused_per_store():
+    pool = ClientPool()
+    try:
+        first = pool.get("kontakt")
+        assert pool.get("kontakt") is first
+        assert pool.get("irshad") is not first
+    finally:
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_closed_client_is_replaced():
+    pool = ClientPool()
+    try:
+        first = pool.get("kontakt")
+        await first.aclose()
+        assert pool.get("kontakt") is not first
+    finally:
+        await pool.aclose()
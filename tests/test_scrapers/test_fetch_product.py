@@ -0,0 +1,122 @@
+import json
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.backend.scrapers.irshad import IrshadScraper
+from app.backend.scrapers.kontakt import KontaktScraper
+from app.backend.scrapers.registry import scraper_registry
+from app.backend.services import search_service
+
+PRODUCT_PAGE = """
+<html><head>
+<meta property="og:title" content="Apple iPhone 15 128GB Black">
+<script type="application/ld+json">{"@context": "https://schema.org", "@type": "BreadcrumbList"}</script>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@graph": [{"@type": "Product", "name": "Apple iPhone 15 128GB Black",
+ "image": ["https://irshad.az/storage/iphone15.webp"],
+ "offers": {"@type": "Offer", "price": "1799.00", "priceCurrency": "AZN",
+            "availability": "https://schema.org/InStock"}}]}
+</script>
+</head><body>...</body></html>
+"""
+
+
+@pytest.mark.asyncio
+async def test_default_fetch_product_reads_json_ld():
+    scraper = IrshadScraper()
+    url = "https://irshad.az/az/product/apple-iphone-15"
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=PRODUCT_PAGE))
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
+            product = await scraper.fetch_product(url)
+
+    assert product.product_name == "Apple iPhone 15 128GB Black"
+    assert product.price == Decimal("1799.00")
+    assert product.product_url == url
+    assert product.image_url == "https://irshad.az/storage/iphone15.webp"
+    assert product.in_stock
+
+
+def test_product_meta_tags_are_a_fallback():
+    html = (
+        '<meta property="og:title" content="Samsung Galaxy A06">'
+        '<meta property="product:price:amount" content="249.00">'
+        '<meta property="product:availability" content="out of stock">'
+    )
+
+    product = IrshadScraper()._product_from_page("https://irshad.az/az/product/a06", html)
+
+    assert product.price == Decimal("249.00")
+    assert not product.in_stock
+    assert IrshadScraper()._product_from_page("https://irshad.az/x", "<html></html>") is None
+
+
+@pytest.mark.asyncio
+async def test_kontakt_fetch_product_looks_up_url_key():
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(200, json={"data": {"q0": {"items": [{
+            "name": "Apple iPhone 15 128GB Black",
+            "url_key": "apple-iphone-15-128gb-black",
+            "price_range": {"minimum_price": {"final_price": {"value": 1749, "currency": "AZN"}}},
+        }]}}})
+
+    url = "https://kontakt.az/apple-iphone-15-128gb-black.html"
+    scraper = KontaktScraper()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
+            product = await scraper.fetch_product(url)
+
+    assert sent[0]["variables"] == {"q0": "apple-iphone-15-128gb-black", "limit": 1}
+    assert "filter: {url_key: {eq: $q0}}" in sent[0]["query"]
+    assert product.price == Decimal("1749.00")
+    assert product.product_url == url
+
+
+@pytest.mark.asyncio
+async def test_vanished_listing_is_not_a_store_failure():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.host == "kontakt.az":
+            return httpx.Response(200, json={"data": {"q0": {"items": []}}})
+        return httpx.Response(404, text="Not found")
+
+    urls = ["https://irshad.az/az/product/discontinued", "https://kontakt.az/discontinued.html"]
+    breaker = AsyncMock()
+    breaker.allow_request.return_value = True
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with patch("app.backend.scrapers.base.BaseScraper._get_client", new_callable=AsyncMock, return_value=client), \
+             patch.object(search_service, "circuit_breaker", breaker):
+            found = await search_service.fetch_pinned_products(urls)
+
+    assert found == {}
+    assert len(requests) == 2  # no retries on a 404
+    breaker.record_failure.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_store_error_on_product_read_counts_against_breaker():
+    breaker = AsyncMock()
+    breaker.allow_request.return_value = True
+    transport = httpx.MockTransport(lambda request: httpx.Response(503))
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch("app.backend.scrapers.base.BaseScraper._get_client", new_callable=AsyncMock, return_value=client), \
+             patch.object(search_service, "circuit_breaker", breaker):
+            found = await search_service.fetch_pinned_products(["https://irshad.az/az/product/apple-iphone-15"])
+
+    assert found == {}
+    breaker.record_failure.assert_awaited_once_with("irshad")
+
+
+def test_registry_finds_scraper_by_url():
+    assert scraper_registry.for_url("https://www.bakuelectronics.az/mehsul/iphone-15").store_slug == "baku_electronics"
+    assert scraper_registry.for_url("https://birmarket.az/product/1-a06").store_slug == "umico"
+    assert scraper_registry.for_url("https://example.com/iphone") is None
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -11,10 +12,36 @@ async def test_irshad_html_parsing(irshad_html):
     scraper = IrshadScraper()
 
     with patch.object(scraper, "_get_page", new_callable=AsyncMock, return_value=irshad_html):
-        with patch.object(scraper, "_delay", new_callable=AsyncMock):
-            results = await scraper.search("iphone 15")
+        results = await scraper.search("iphone 15")
 
+    # The card without a price is skipped; the discounted price wins.
     assert len(results) == 1
+    assert results[0].product_url == "https://irshad.az/az/product/apple-iphone-15"
+    assert results[0].image_url == "/uploads/iphone15.jpg"
     assert results[0].product_name == "Apple iPhone 15 128GB"
     assert results[0].price == Decimal("1799.00")
     assert results[0].store_slug == "irshad"
+
+
+def test_fast_extractor_matches_beautifulsoup_on_saved_page():
+    html = (Path(__file__).resolve().parents[2] / "benchmarks" / "pages" / "irshad_search.html").read_text()
+
+    cards = IrshadScraper._extract_cards(html, 24)
+    assert cards == IrshadScraper._extract_cards_soup(html, 24)
+    assert len(IrshadScraper().parse_results(html, 24)) == 24
+
+
+def test_parse_results_falls_back_to_beautifulsoup():
+    html = """
+    <div id="productGridItems"><div class="product">
+        <a class="product__name" href="/az/product/a06">Samsung Galaxy A06</a>
+        <span class="new-price">249,00 ₼</span>
+    </div></div>
+    """
+    scraper = IrshadScraper()
+
+    with patch.object(IrshadScraper, "_extract_cards", side_effect=ValueError("bad markup")):
+        results = scraper.parse_results(html)
+
+    assert [(p.product_name, p.price) for p in results] == [("Samsung Galaxy A06", Decimal("249.00"))]
+    assert results[0].product_url == "https://irshad.az/az/product/a06"
@@ -1,25 +1,27 @@
+import json
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from app.backend.scrapers.kontakt import KontaktScraper
 
 
 @pytest.mark.asyncio
-async def test_kontakt_html_parsing(kontakt_html):
+async def test_kontakt_graphql_parsing(kontakt_graphql_response):
     scraper = KontaktScraper()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=kontakt_graphql_response))
 
-    with patch.object(scraper, "_search_api", return_value=[]):
-        with patch.object(scraper, "_get_page", new_callable=AsyncMock, return_value=kontakt_html):
-            with patch.object(scraper, "_delay", new_callable=AsyncMock):
-                results = await scraper.search("iphone 15")
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
+            results = await scraper.search("iphone 15")
 
     assert len(results) == 2
     assert results[0].product_name == "Apple iPhone 15 128GB Black"
     assert results[0].price == Decimal("1799.00")
     assert results[0].store_slug == "kontakt"
-    assert "iphone-15-128gb" in results[0].product_url
+    assert results[0].product_url == "https://kontakt.az/iphone-15-128gb-black.html"
 
 
 @pytest.mark.asyncio
@@ -30,3 +32,50 @@ async def test_kontakt_safe_search_handles_error():
         results = await scraper.safe_search("iphone")
 
     assert results == []
+
+
+def _item(name: str, price: float) -> dict:
+    return {
+        "name": name,
+        "url_key": name.lower().replace(" ", "-"),
+        "price_range": {"minimum_price": {"final_price": {"value": price, "currency": "AZN"}}},
+        "small_image": {"url": None},
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_many_packs_queries_into_one_request():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "data": {
+                "q0": {"items": [_item("Apple iPhone 15 128GB", 1799)], "total_count": 1},
+                "q1": None,
+                "q2": {"items": [_item("Samsung Galaxy A06", 249)], "total_count": 1},
+            },
+            "errors": [{"message": "search failed", "path": ["q1"]}],
+        })
+
+    scraper = KontaktScraper()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
+            results = await scraper.search_many(['iphone 15', 'tv "55"', "samsung"], max_results=5)
+
+    assert len(requests) == 1
+    assert requests[0]["variables"] == {"q0": "iphone 15", "q1": 'tv "55"', "q2": "samsung", "limit": 5}
+    assert "q2: products(search: $q2, pageSize: $limit)" in requests[0]["query"]
+    assert set(results) == {"iphone 15", "samsung"}
+    assert results["samsung"][0].price == Decimal("249.00")
+
+
+@pytest.mark.asyncio
+async def test_search_returns_nothing_when_field_is_null():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": {"q0": None}, "errors": [{"message": "search failed"}]})
+
+    scraper = KontaktScraper()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
+            assert await scraper.search("iphone 15") == []
@@ -0,0 +1,84 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.backend.scrapers import rate_limiter as rate_limiter_module
+from app.backend.scrapers.rate_limiter import _TAKE_TOKEN_SCRIPT, _limits, rate_limiter
+
+
+def test_store_override_and_default_limits():
+    assert _limits("tap_az") == (1.0, 3)
+    assert _limits("kontakt") == (
+        rate_limiter_module.settings.SCRAPER_RATE_LIMIT_PER_SECOND,
+        rate_limiter_module.settings.SCRAPER_RATE_LIMIT_BURST,
+    )
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_until_token_available():
+    redis = MagicMock()
+    redis.eval = AsyncMock(side_effect=[250, 0])
+
+    with patch.object(rate_limiter_module, "get_redis", return_value=redis), \
+            patch.object(rate_limiter_module.asyncio, "sleep", new_callable=AsyncMock) as sleep:
+        await rate_limiter.acquire("kontakt")
+
+    sleep.assert_awaited_once_with(0.25)
+    assert redis.eval.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_acquire_passes_through_when_redis_down():
+    redis = MagicMock()
+    redis.eval = AsyncMock(side_effect=ConnectionError("down"))
+
+    with patch.object(rate_limiter_module, "get_redis", return_value=redis):
+        await rate_limiter.acquire("kontakt")
+
+
+async def _take(redis, key: str, rate: float, burst: int) -> int:
+    return await redis.eval(_TAKE_TOKEN_SCRIPT, 1, key, rate, burst)
+
+
+async def _rewind(redis, key: str, seconds: float) -> None:
+    """Pretend *seconds* passed since the bucket was last touched."""
+    ts = float(await redis.hget(key, "ts"))
+    await redis.hset(key, "ts", str(ts - seconds))
+
+
+async def test_token_bucket_allows_burst_then_asks_to_wait(fake_redis):
+    assert [await _take(fake_redis, "bucket", 2.0, 3) for _ in range(3)] == [0, 0, 0]
+
+    wait_ms = await _take(fake_redis, "bucket", 2.0, 3)
+
+    # Half a second per token at 2/s.
+    assert 0 < wait_ms <= 500
+    assert 0 < await fake_redis.pttl("bucket") <= 3 / 2.0 * 1000 + 1000
+
+
+async def test_token_bucket_refills_with_elapsed_time_up_to_burst(fake_redis):
+    for _ in range(3):
+        await _take(fake_redis, "bucket", 2.0, 3)
+
+    await _rewind(fake_redis, "bucket", 0.5)
+    assert await _take(fake_redis, "bucket", 2.0, 3) == 0
+    assert await _take(fake_redis, "bucket", 2.0, 3) > 0
+
+    # A long idle period refills to the burst size, not beyond.
+    await _rewind(fake_redis, "bucket", 60)
+    assert [await _take(fake_redis, "bucket", 2.0, 3) for _ in range(4)][-1] > 0
+
+
+async def test_acquire_sleeps_for_the_scripts_wait(fake_redis):
+    rate, burst = _limits("tap_az")
+
+    async def sleep(seconds: float) -> None:
+        await _rewind(fake_redis, "ratelimit:tap_az", seconds)
+
+    with patch.object(rate_limiter_module, "get_redis", return_value=fake_redis), \
+            patch.object(rate_limiter_module.asyncio, "sleep", side_effect=sleep) as slept:
+        for _ in range(burst + 1):
+            await rate_limiter.acquire("tap_az")
+
+    [call] = slept.await_args_list
+    assert 0 < call.args[0] <= 1 / rate
@@ -0,0 +1,55 @@
+import gzip
+import json
+
+import httpx
+import pytest
+
+from app.backend.scrapers.recording import RecordingTransport, SimulatorTransport, load_cassettes
+from benchmarks.store_simulator import SimulatorConfig, create_app
+
+PAYLOAD = {"data": {"products": {"items": [{"name": "Samsung Galaxy A06", "url_key": "a06"}]}}}
+
+
+def _live_store(request: httpx.Request) -> httpx.Response:
+    body = gzip.compress(json.dumps(PAYLOAD).encode())
+    return httpx.Response(
+        200,
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        content=body,
+    )
+
+
+@pytest.mark.asyncio
+async def test_recorded_response_replays_through_simulator(tmp_path):
+    recorder = RecordingTransport(httpx.MockTransport(_live_store), "kontakt", tmp_path)
+    async with httpx.AsyncClient(transport=recorder) as client:
+        live = await client.post("https://kontakt.az/graphql", json={"query": "samsung"})
+    assert live.json() == PAYLOAD
+
+    cassettes = load_cassettes(tmp_path)
+    assert [c["url"] for c in cassettes.values()] == ["https://kontakt.az/graphql"]
+
+    app = create_app(tmp_path, SimulatorConfig())
+    simulator = SimulatorTransport(httpx.ASGITransport(app), "kontakt", "http://simulator")
+    async with httpx.AsyncClient(transport=simulator) as client:
+        replayed = await client.post("https://kontakt.az/graphql", json={"query": "samsung"})
+        missing = await client.post("https://kontakt.az/graphql", json={"query": "iphone"})
+
+    assert replayed.status_code == 200
+    assert replayed.json() == PAYLOAD
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_simulator_injects_errors(tmp_path):
+    recorder = RecordingTransport(httpx.MockTransport(_live_store), "umico", tmp_path)
+    async with httpx.AsyncClient(transport=recorder) as client:
+        await client.get("https://mp-catalog.umico.az/api/v1/suggests", params={"q": "samsung"})
+
+    app = create_app(tmp_path, SimulatorConfig(error_rate=1.0))
+    simulator = SimulatorTransport(httpx.ASGITransport(app), "umico", "http://simulator")
+    async with httpx.AsyncClient(transport=simulator) as client:
+        response = await client.get("https://mp-catalog.umico.az/api/v1/suggests", params={"q": "samsung"})
+
+    assert response.status_code == 503
+    assert app.state.stats["errors"] == 1
@@ -1,21 +1,67 @@
+import json
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from app.backend.scrapers.tap_az import TapAzScraper
 
 
 @pytest.mark.asyncio
-async def test_tap_az_html_parsing(tap_az_html):
+async def test_tap_az_graphql_parsing(tap_az_graphql_response):
     scraper = TapAzScraper()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=tap_az_graphql_response))
 
-    with patch.object(scraper, "_get_page", new_callable=AsyncMock, return_value=tap_az_html):
-        with patch.object(scraper, "_delay", new_callable=AsyncMock):
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
             results = await scraper.search("iphone 15")
 
+    # The Samsung ad doesn't match the query.
     assert len(results) == 2
+    assert results[0].product_url == "https://tap.az/elanlar/12345"
     assert results[0].price == Decimal("1650.00")
     assert results[0].store_slug == "tap_az"
     # Second result should have shop badge
     assert "[Mağaza]" in results[1].product_name
+
+
+def _node(title: str, price: int) -> dict:
+    return {"id": title, "title": title, "price": price, "path": f"/elanlar/{price}", "photo": None, "shop": None}
+
+
+@pytest.mark.asyncio
+async def test_search_many_keeps_answered_queries_from_partial_response():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "data": {
+                "q0": {"nodes": [_node("Apple iPhone 15 128GB", 1650), _node("iPhone kabro", 15)]},
+                "q1": None,
+            },
+            "errors": [{"message": "timeout", "path": ["q1"]}],
+        })
+
+    scraper = TapAzScraper()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
+            results = await scraper.search_many(["iphone 15", "playstation 5"], max_results=5)
+
+    assert len(requests) == 1
+    assert requests[0]["variables"] == {"q0": "iphone 15", "q1": "playstation 5", "limit": 15}
+    assert "q1: ads(keywords: $q1, first: $limit, source: DESKTOP)" in requests[0]["query"]
+    assert list(results) == ["iphone 15"]
+    assert [p.price for p in results["iphone 15"]] == [Decimal("1650.00")]
+
+
+@pytest.mark.asyncio
+async def test_search_returns_nothing_when_field_is_null():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": {"q0": None}, "errors": [{"message": "timeout"}]})
+
+    scraper = TapAzScraper()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
+            assert await scraper.search("iphone 15") == []
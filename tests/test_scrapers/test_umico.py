@@ -1,21 +1,24 @@
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from app.backend.scrapers.umico import UmicoScraper
 
 
 @pytest.mark.asyncio
-async def test_umico_html_parsing(umico_html):
+async def test_umico_suggests_parsing(umico_suggests_response):
     scraper = UmicoScraper()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=umico_suggests_response))
 
-    with patch.object(scraper, "_search_api", return_value=[]):
-        with patch.object(scraper, "_get_page", new_callable=AsyncMock, return_value=umico_html):
-            with patch.object(scraper, "_delay", new_callable=AsyncMock):
-                results = await scraper.search("iphone 15")
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch.object(scraper, "_get_client", new_callable=AsyncMock, return_value=client):
+            results = await scraper.search("iphone 15")
 
+    # The item without a price is skipped.
     assert len(results) == 1
+    assert results[0].product_url == "https://birmarket.az/product/501-apple-iphone-15-128gb"
     assert results[0].product_name == "Apple iPhone 15 128GB"
     assert results[0].price == Decimal("1750.00")
     assert results[0].store_slug == "umico"
@@ -0,0 +1,61 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.backend.services import category_detector
+from app.backend.services.category_detector import CATEGORIES, detect_categories, reload_categories
+from app.backend.services.relevance import QueryMatcher
+
+
+def _slugs(query: str) -> list[str]:
+    return [c.slug for c in detect_categories(query)]
+
+
+def test_longest_keyword_ranks_first():
+    assert _slugs("Samsung Galaxy Tab S9") == ["phone", "tablet", "accessory", "all"]
+    assert _slugs("galaxy tab s9") == ["tablet", "accessory", "all"]
+
+
+def test_no_keyword_falls_back_to_main_product():
+    assert _slugs("bosch drel") == ["main_product", "accessory", "all"]
+
+
+@pytest.fixture
+def categories_file(tmp_path):
+    path = tmp_path / "categories.json"
+    with patch.object(category_detector.settings, "CATEGORIES_FILE", str(path)), \
+            patch.object(category_detector.settings, "CATEGORIES_RELOAD_SECONDS", 0):
+        yield path
+    reload_categories()
+
+
+def test_file_changes_are_picked_up_without_restart(categories_file):
+    categories_file.write_text(json.dumps({
+        "watch": {"name_az": "Saat", "emoji": "⌚", "trigger_keywords": ["apple watch"]},
+    }))
+    assert _slugs("Apple Watch Series 9") == ["watch", "accessory", "all"]
+    assert "çexol" in CATEGORIES["watch"].exclude_words
+
+    categories_file.write_text(json.dumps({
+        "watch": {"name_az": "Saat", "emoji": "⌚", "trigger_keywords": ["smartwatch"]},
+    }))
+    # Ensure the mtime differs even on coarse-grained filesystems.
+    category_detector._file_mtime = None
+    assert _slugs("Apple Watch Series 9") == ["main_product", "accessory", "all"]
+    assert _slugs("huawei smartwatch") == ["watch", "phone", "accessory", "all"]
+
+
+def test_broken_file_keeps_current_definitions(categories_file):
+    categories_file.write_text("{not json")
+    assert _slugs("iphone 15") == ["phone", "accessory", "all"]
+
+
+def test_relevance_matchers_pick_up_file_changes(categories_file):
+    categories_file.write_text("{}")
+    assert QueryMatcher("iphone 15", "phone").score("iPhone 15 stend") > 0
+
+    categories_file.write_text(json.dumps({"phone": {"extra_exclude_words": ["stend"]}}))
+    category_detector._file_mtime = None
+    # No detect_categories() call, as in a worker filtering alert results.
+    assert QueryMatcher("iphone 15", "phone").score("iPhone 15 stend") == 0
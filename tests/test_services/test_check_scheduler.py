@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.backend.core.config import settings
+from app.backend.services import check_scheduler
+from app.backend.services.check_scheduler import check_interval, get_due_alerts
+
+BASE = timedelta(hours=settings.PRICE_CHECK_INTERVAL_HOURS)
+
+
+class TestCheckInterval:
+    def _make_alert(self, target: str, lowest: str | None) -> MagicMock:
+        alert = MagicMock()
+        alert.target_price = Decimal(target)
+        alert.lowest_price_found = Decimal(lowest) if lowest is not None else None
+        return alert
+
+    def test_unknown_price_uses_base_interval(self):
+        assert check_interval(self._make_alert("1000", None), None) == BASE
+
+    def test_near_target_checked_more_often(self):
+        assert check_interval(self._make_alert("1000", "1030"), None) == BASE * 0.25
+
+    def test_far_from_target_and_stable_checked_less_often(self):
+        interval = check_interval(self._make_alert("1000", "2000"), 0.001)
+        assert interval == min(BASE * 4, timedelta(hours=settings.PRICE_CHECK_MAX_INTERVAL_HOURS))
+
+    def test_volatile_checked_more_often(self):
+        assert check_interval(self._make_alert("1000", "1300"), 0.1) == BASE * 0.5
+
+    def test_clamped_to_minimum(self):
+        interval = check_interval(self._make_alert("1000", "1010"), 0.2)
+        assert interval == max(BASE * 0.125, timedelta(minutes=settings.PRICE_CHECK_MIN_INTERVAL_MINUTES))
+
+
+class TestGetDueAlerts:
+    NOW = datetime(2026, 10, 17, 12, tzinfo=timezone.utc)
+
+    def _make_alert(self, alert_id: int, hours_since_check: float | None) -> MagicMock:
+        alert = MagicMock()
+        alert.id = alert_id
+        alert.target_price = Decimal("1000")
+        alert.lowest_price_found = None
+        alert.last_checked_at = (
+            self.NOW - timedelta(hours=hours_since_check) if hours_since_check is not None else None
+        )
+        return alert
+
+    async def _due(self, alerts: list[MagicMock], volatility: dict[int, float] | None = None) -> list[int]:
+        checked_before = AsyncMock(side_effect=lambda session, before: [
+            alert for alert in alerts if alert.last_checked_at is None or alert.last_checked_at < before
+        ])
+        with patch.object(check_scheduler, "get_active_alert_prices", AsyncMock(return_value=alerts)), \
+                patch.object(check_scheduler, "get_active_alerts_checked_before", checked_before), \
+                patch.object(check_scheduler, "get_price_volatility", AsyncMock(return_value=volatility or {})):
+            due = await get_due_alerts(MagicMock(), now=self.NOW)
+        return [alert.id for alert in due]
+
+    async def test_most_overdue_first_and_not_yet_due_skipped(self):
+        base = settings.PRICE_CHECK_INTERVAL_HOURS
+        alerts = [
+            self._make_alert(1, base * 1.5),
+            self._make_alert(2, None),
+            self._make_alert(3, base * 0.5),
+            self._make_alert(4, base * 3),
+        ]
+        with patch.object(settings, "PRICE_CHECK_TICK_MINUTES", base * 60):
+            assert await self._due(alerts) == [2, 4, 1]
+
+    async def test_volatile_alert_becomes_due_sooner(self):
+        base = settings.PRICE_CHECK_INTERVAL_HOURS
+        alerts = [self._make_alert(1, base * 0.75), self._make_alert(2, base * 0.75)]
+        with patch.object(settings, "PRICE_CHECK_TICK_MINUTES", base * 60):
+            assert await self._due(alerts, {2: 0.1}) == [2]
+
+    async def test_capped_at_twice_the_steady_share(self):
+        base = settings.PRICE_CHECK_INTERVAL_HOURS
+        alerts = [self._make_alert(i, base * (1 + i)) for i in range(100)]
+        ticks_per_interval = 10
+        with patch.object(settings, "PRICE_CHECK_TICK_MINUTES", base * 60 // ticks_per_interval):
+            due = await self._due(alerts)
+
+        # Steady share is 100 / 10 = 10 alerts per tick; catch-up allows 2x.
+        assert due == list(range(99, 79, -1))
+
+    async def test_cap_follows_the_alerts_own_intervals(self):
+        base = settings.PRICE_CHECK_INTERVAL_HOURS
+        alerts = [self._make_alert(i, base * (1 + i)) for i in range(100)]
+        for alert in alerts[:20]:
+            alert.lowest_price_found = Decimal("1030")  # near target: a quarter of the base interval
+        with patch.object(settings, "PRICE_CHECK_TICK_MINUTES", base * 60 // 10):
+            due = await self._due(alerts)
+
+        # 80 alerts at 1/10 of their interval per tick plus 20 at 4/10: 16 per tick, 32 with catch-up.
+        assert len(due) == 32
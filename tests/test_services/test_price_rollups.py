@@ -0,0 +1,56 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.backend.models.daily_price import ProductDailyPrice
+from app.backend.services.price_rollups import PricePoint, lttb, record_daily_prices
+
+
+def _series(prices: list[int]) -> list[PricePoint]:
+    start = date(2026, 1, 1)
+    return [
+        PricePoint(start + timedelta(days=i), Decimal(p), Decimal(p), Decimal(p), Decimal(p), 1)
+        for i, p in enumerate(prices)
+    ]
+
+
+def test_lttb_returns_fixed_number_of_points_with_endpoints():
+    points = _series([1000 + (i % 7) * 10 for i in range(365)])
+
+    sampled = lttb(points, 50)
+
+    assert len(sampled) == 50
+    assert sampled[0] is points[0]
+    assert sampled[-1] is points[-1]
+    assert [p.day for p in sampled] == sorted(p.day for p in sampled)
+
+
+def test_lttb_keeps_price_drop():
+    prices = [1500] * 200
+    prices[120] = 999
+    points = _series(prices)
+
+    sampled = lttb(points, 20)
+
+    assert Decimal(999) in {p.min_price for p in sampled}
+
+
+def test_lttb_short_series_unchanged():
+    points = _series([1, 2, 3])
+    assert lttb(points, 10) is points
+
+
+@pytest.mark.asyncio
+async def test_daily_rollup_rows_are_upserted_in_key_order():
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    await record_daily_prices(
+        session, ProductDailyPrice, {3: Decimal("10"), 1: Decimal("12"), 2: Decimal("11")}, date(2026, 10, 17)
+    )
+
+    params = session.execute.await_args.args[0].compile(dialect=postgresql.dialect()).params
+    assert [params[f"product_id_m{i}"] for i in range(3)] == [1, 2, 3]
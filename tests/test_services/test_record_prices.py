@@ -0,0 +1,138 @@
+import re
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.backend.core.config import settings
+from app.backend.models.alert import Alert
+from app.backend.models.price_observation import PriceObservation
+from app.backend.scrapers.base import ScrapedProduct
+from app.backend.services.price_service import record_prices_bulk
+
+_MULTI_VALUES_PARAM = re.compile(r"^(.+)_m(\d+)$")
+
+
+def _product(price: str, store_slug: str = "kontakt") -> ScrapedProduct:
+    return ScrapedProduct(
+        product_name=f"iPhone 15 {price}",
+        price=Decimal(price),
+        product_url=f"https://{store_slug}.az/{price}",
+        store_slug=store_slug,
+        store_name=store_slug,
+    )
+
+
+def _session(products: list[ScrapedProduct]) -> MagicMock:
+    session = MagicMock()
+    upserted = MagicMock()
+    upserted.all.return_value = [
+        (i, p.store_slug, p.product_url) for i, p in enumerate(products, start=1)
+    ]
+    session.execute = AsyncMock(return_value=upserted)
+    scalars_result = MagicMock()
+    scalars_result.all.return_value = [MagicMock(id=100 + i) for i in range(len(products))]
+    session.scalars = AsyncMock(return_value=scalars_result)
+    return session
+
+
+def _rows(compiled) -> list[dict]:
+    """The rows of a compiled multi-row ``INSERT ... VALUES``, in order."""
+    rows: dict[int, dict] = {}
+    for name, value in compiled.params.items():
+        match = _MULTI_VALUES_PARAM.match(name)
+        if match:
+            rows.setdefault(int(match[2]), {})[match[1]] = value
+    return [rows[i] for i in sorted(rows)]
+
+
+def _writes(session: MagicMock, kind: str, table: str) -> list[list[dict] | dict]:
+    """What each ``INSERT``/``UPDATE`` on *table* wrote: executemany rows,
+    multi-VALUES rows, or the SET params of an UPDATE."""
+    writes = []
+    for call in session.execute.await_args_list + session.scalars.await_args_list:
+        stmt = call.args[0]
+        if getattr(stmt, f"is_{kind}", False) and stmt.table.name == table:
+            compiled = stmt.compile(dialect=postgresql.dialect())
+            if len(call.args) > 1:
+                writes.append(call.args[1])
+            elif kind == "insert":
+                writes.append(_rows(compiled))
+            else:
+                writes.append(compiled.params)
+    return writes
+
+
+@pytest.mark.asyncio
+@patch.object(settings, "PRICE_HISTORY_CHANGES_ONLY", False)
+async def test_one_observation_per_product_shared_by_alerts():
+    alerts = [Alert(id=1, target_price=Decimal("1000")), Alert(id=2, target_price=Decimal("900"))]
+    products = [_product("1100"), _product("1050", "irshad"), _product("1200")]
+    session = _session(products)
+
+    observations = await record_prices_bulk(session, [(a, products) for a in alerts])
+
+    [upserted] = _writes(session, "insert", "products")
+    # Upserted once each, in conflict-key order.
+    assert [(r["store_slug"], r["product_url"]) for r in upserted] == sorted(
+        (p.store_slug, p.product_url) for p in products
+    )
+    [observed] = _writes(session, "insert", "price_observations")
+    assert sorted(r["price"] for r in observed) == sorted(p.price for p in products)
+    [links] = _writes(session, "insert", "alert_observations")
+    assert {(link["alert_id"], link["observation_id"]) for link in links} == {
+        (alert.id, 100 + i) for alert in alerts for i in range(len(products))
+    }
+    [alert_rollup] = _writes(session, "insert", "alert_daily_prices")
+    assert {(r["alert_id"], r["min_price"]) for r in alert_rollup} == {(1, Decimal("1050")), (2, Decimal("1050"))}
+    assert _writes(session, "update", "alerts")
+
+    assert set(observations) == {1, 2}
+    assert observations[1] is observations[2]
+    for alert in alerts:
+        assert alert.lowest_price_found == Decimal("1050")
+        assert alert.lowest_price_store == "irshad"
+        assert alert.last_checked_at is not None
+
+
+@pytest.mark.asyncio
+async def test_alert_without_products_only_marks_checked():
+    alert = Alert(id=1, target_price=Decimal("1000"))
+    session = _session([])
+
+    observations = await record_prices_bulk(session, [(alert, [])])
+
+    assert not _writes(session, "insert", "products")
+    assert not _writes(session, "insert", "price_observations")
+    assert not _writes(session, "insert", "alert_daily_prices")
+    assert _writes(session, "update", "alerts")
+    assert observations == {}
+    assert alert.lowest_price_found is None
+    assert alert.last_checked_at is not None
+
+
+@pytest.mark.asyncio
+@patch.object(settings, "PRICE_HISTORY_CHANGES_ONLY", True)
+async def test_unchanged_price_extends_latest_observation():
+    alert = Alert(id=1, target_price=Decimal("1000"))
+    products = [_product("1100"), _product("1050", "irshad")]
+    session = _session(products)
+    latest = MagicMock()
+    # kontakt (product 1) is unchanged, irshad (product 2) changed price.
+    latest.all.return_value = [
+        PriceObservation(id=7, product_id=1, price=Decimal("1100")),
+        PriceObservation(id=8, product_id=2, price=Decimal("1099")),
+    ]
+    inserted = MagicMock()
+    inserted.all.return_value = [PriceObservation(id=9, product_id=2, price=Decimal("1050"))]
+    session.scalars = AsyncMock(side_effect=[latest, inserted])
+
+    observations = await record_prices_bulk(session, [(alert, products)])
+
+    assert _writes(session, "insert", "price_observations") == [[{"product_id": 2, "price": Decimal("1050")}]]
+    [extended] = _writes(session, "update", "price_observations")
+    assert [value for value in extended.values() if isinstance(value, list)] == [[7]]
+    [links] = _writes(session, "insert", "alert_observations")
+    assert {link["observation_id"] for link in links} == {7, 9}
+    assert observations[1].id == 9
@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.backend.services.category_detector import CATEGORIES, load_categories
+from app.backend.services.relevance import (
+    ACCESSORY_WORDS,
+    QueryMatcher,
+    compile_words,
+    filter_relevant,
+    filter_relevant_many,
+    has_accessory_word,
+)
+from benchmarks.relevance_suite import BASELINE_PATH, categories, check, load_corpora, measure_quality
+
+CORPUS = Path(__file__).resolve().parents[2] / "ucuzbottest_samsung.json"
+
+_NAMES = [r["product_name"].lower() for r in json.loads(CORPUS.read_text(encoding="utf-8"))["results"]]
+
+
+def test_compile_words_handles_shared_prefixes():
+    pattern = compile_words(frozenset({"ca", "case", "cable", "cover"}))
+
+    for text, expected in [("phone case", True), ("cab", True), ("cov", False), ("usb cable", True)]:
+        assert bool(pattern.search(text)) is expected
+
+
+def test_compile_words_ignores_blank_words(tmp_path):
+    assert compile_words(frozenset({"", "  "})).search("iphone 15") is None
+    assert compile_words(frozenset({"", " ", "case"})).search("iphone 15") is None
+
+    # e.g. a stray "" in a category file's extra_exclude_words
+    path = tmp_path / "categories.json"
+    path.write_text(json.dumps({"phone": {"extra_exclude_words": ["", " "]}}))
+    assert load_categories(str(path))["phone"].exclude_pattern.search("iphone 15 128gb") is None
+
+
+@pytest.mark.parametrize("name", _NAMES + ["ekran şüşə iphone 15", "galaxy tab s9 qələm"])
+def test_compiled_matchers_agree_with_substring_scan(name):
+    assert has_accessory_word(name) == any(w in name for w in ACCESSORY_WORDS)
+    for category in CATEGORIES.values():
+        if category.exclude_words:
+            expected = any(w in name for w in category.exclude_words)
+            assert bool(category.exclude_pattern.search(name)) == expected
+
+
+class _Product:
+    def __init__(self, name: str):
+        self.product_name = name
+
+
+def test_filter_relevant_many_matches_per_matcher_filtering():
+    products = [_Product(n) for n in _NAMES]
+    categories = [None, "phone", "tv", "accessory", "all"]
+
+    batched = filter_relevant_many(products, [QueryMatcher("samsung", c) for c in categories])
+
+    for category, filtered in zip(categories, batched):
+        assert filtered == filter_relevant(products, "samsung", product_category=category)
+
+
+def test_relevance_quality_meets_floors():
+    baseline = json.loads(BASELINE_PATH.read_text())
+    quality = {
+        corpus.name: {str(c): measure_quality(corpus, c).__dict__ for c in categories()}
+        for corpus in load_corpora()
+    }
+    assert check({"quality": quality}, baseline) == []
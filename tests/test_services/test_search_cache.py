@@ -0,0 +1,165 @@
+import asyncio
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from app.backend.scrapers.base import ScrapedProduct
+from app.backend.services import search_cache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def eval(self, script, numkeys, key, token):
+        # The compare-and-delete unlock script.
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+def _product(price: str = "1499.00") -> ScrapedProduct:
+    return ScrapedProduct(
+        product_name="iPhone 15 128GB",
+        price=Decimal(price),
+        product_url="https://kontakt.az/iphone-15.html",
+        store_slug="kontakt",
+        store_name="Kontakt Home",
+    )
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch.object(search_cache, "get_redis", return_value=redis):
+        yield redis
+
+
+@pytest.fixture
+def redis_single_flight(fake_redis):
+    with patch.object(search_cache.settings, "SEARCH_SINGLE_FLIGHT_REDIS", True), \
+            patch.object(search_cache, "_PEER_POLL_INTERVAL", 0.001):
+        yield fake_redis
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_skips_fetch(fake_redis):
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return [_product()]
+
+    first = await search_cache.get_or_fetch("kontakt", "iphone 15", 5, fetch)
+    second = await search_cache.get_or_fetch("kontakt", "iphone 15", 5, fetch)
+
+    assert calls == 1
+    assert second[0].price == first[0].price == Decimal("1499.00")
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_and_refreshed(fake_redis):
+    async def fetch():
+        return [_product("1399.00")]
+
+    key = search_cache._cache_key("kontakt", "iphone 15", 5)
+    payload = json.loads(search_cache._serialize([_product("1499.00")]))
+    payload["fetched_at"] -= search_cache._store_ttl("kontakt") + 1
+    fake_redis.data[key] = json.dumps(payload)
+
+    stale = await search_cache.get_or_fetch("kontakt", "iphone 15", 5, fetch)
+    assert stale[0].price == Decimal("1499.00")
+
+    await asyncio.gather(*search_cache._background)
+    fresh = await search_cache.get_or_fetch("kontakt", "iphone 15", 5, fetch, allow_stale=False)
+    assert fresh[0].price == Decimal("1399.00")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(fake_redis):
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [_product()]
+
+    results = await asyncio.gather(*(
+        search_cache.get_or_fetch("kontakt", "iphone 15", 5, fetch) for _ in range(5)
+    ))
+
+    assert calls == 1
+    assert all(r[0].price == Decimal("1499.00") for r in results)
+
+
+@pytest.mark.asyncio
+async def test_empty_results_not_cached(fake_redis):
+    async def fetch():
+        return []
+
+    await search_cache.get_or_fetch("kontakt", "iphone 15", 5, fetch)
+    assert fake_redis.data == {}
+
+
+# _fetch_and_store is what each process runs after its in-process single
+# flight; calling it concurrently stands in for several processes.
+
+@pytest.mark.asyncio
+async def test_processes_wait_for_lock_holder_instead_of_fetching(redis_single_flight):
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return [_product()]
+
+    key = search_cache._cache_key("kontakt", "iphone 15", 5)
+    ttl = search_cache._store_ttl("kontakt")
+    results = await asyncio.gather(*(search_cache._fetch_and_store(key, ttl, fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert all(r[0].price == Decimal("1499.00") for r in results)
+    assert search_cache._lock_key(key) not in redis_single_flight.data
+
+
+@pytest.mark.asyncio
+async def test_waiters_fetch_themselves_when_lock_holder_fails(redis_single_flight):
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.02)
+            raise RuntimeError("store down")
+        return [_product()]
+
+    key = search_cache._cache_key("kontakt", "iphone 15", 5)
+    ttl = search_cache._store_ttl("kontakt")
+    results = await asyncio.gather(
+        *(search_cache._fetch_and_store(key, ttl, fetch) for _ in range(3)), return_exceptions=True
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    # The error isn't shared across processes: a waiter retries the fetch.
+    assert all(r[0].price == Decimal("1499.00") for r in results[1:])
+    assert calls >= 2
+    assert search_cache._lock_key(key) not in redis_single_flight.data
@@ -0,0 +1,162 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.backend.scrapers.base import ScrapedProduct
+from app.backend.services import search_service
+
+
+def _product(store_slug: str, name: str, price: str) -> ScrapedProduct:
+    return ScrapedProduct(
+        product_name=name,
+        price=Decimal(price),
+        product_url=f"https://example.az/{store_slug}",
+        store_slug=store_slug,
+        store_name=store_slug,
+    )
+
+
+class FakeScraper:
+    def __init__(self, store_slug: str):
+        self.store_slug = store_slug
+
+
+_DELAYS = {"slow": 0.05, "fast": 0.0, "broken": 0.01}
+
+
+async def _fake_search_store(scraper_cls, query, max_results, use_cache, allow_stale):
+    await asyncio.sleep(_DELAYS[scraper_cls.store_slug])
+    if scraper_cls.store_slug == "broken":
+        raise asyncio.TimeoutError()
+    return [_product(scraper_cls.store_slug, "Apple iPhone 15 128GB", "1500")]
+
+
+@pytest.fixture
+def fake_stores():
+    scrapers = {slug: FakeScraper(slug) for slug in _DELAYS}
+    with patch.object(search_service, "_select_scrapers", return_value=scrapers), \
+            patch.object(search_service, "_search_store", side_effect=_fake_search_store):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_in_completion_order(fake_stores):
+    batches = [b async for b in search_service.stream_search_stores("iphone 15")]
+
+    assert [b.store_slug for b in batches] == ["fast", "broken", "slow"]
+    assert batches[1].error == "broken: timed out"
+    assert batches[1].products == []
+    assert len(batches[0].products) == 1
+    assert [b.status for b in batches] == ["ok", "unavailable", "ok"]
+
+
+@pytest.mark.asyncio
+async def test_search_all_stores_collects_stream(fake_stores):
+    products, errors = await search_service.search_all_stores("iphone 15")
+
+    assert {p.store_slug for p in products} == {"fast", "slow"}
+    assert errors == ["broken: timed out"]
+
+
+@pytest.mark.asyncio
+async def test_latency_budget_skips_slow_store(fake_stores):
+    batches = [
+        b async for b in search_service.stream_search_stores("iphone 15", latency_budget=0.03)
+    ]
+
+    skipped = [b for b in batches if b.skipped]
+    assert [b.store_slug for b in skipped] == ["slow"]
+    assert skipped[0].error == "slow: skipped (too slow)"
+    assert skipped[0].status == "unavailable"
+
+
+@pytest.mark.asyncio
+async def test_scraper_error_reports_failed_status():
+    async def failing_search_store(scraper_cls, query, max_results, use_cache, allow_stale):
+        raise ValueError("bad response")
+
+    with patch.object(search_service, "_select_scrapers", return_value={"kontakt": FakeScraper("kontakt")}), \
+            patch.object(search_service, "_search_store", side_effect=failing_search_store):
+        [batch] = [b async for b in search_service.stream_search_stores("iphone 15")]
+
+    assert (batch.status, batch.error) == ("failed", "kontakt: bad response")
+
+
+class _BatchScraper:
+    store_slug = "kontakt"
+
+    async def search_many(self, queries, max_results):
+        await asyncio.sleep(0)
+        return {q: [_product("kontakt", q, "100")] for q in queries[:-1]}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("deadline, expected", [(2.0, 6.0), (20.0, search_service.settings.SCRAPER_TIMEOUT * 2)])
+async def test_batch_deadline_scales_up_to_a_ceiling_and_latency_is_not_recorded(deadline, expected):
+    breaker = AsyncMock()
+    breaker.allow_request.return_value = True
+    latency = MagicMock()
+    latency.deadline.return_value = deadline
+    timeouts = []
+    real_wait_for = asyncio.wait_for
+
+    async def wait_for(aw, timeout):
+        timeouts.append(timeout)
+        return await real_wait_for(aw, timeout)
+
+    with patch.object(search_service, "circuit_breaker", breaker), \
+            patch.object(search_service, "store_latency", latency), \
+            patch.object(search_service.asyncio, "wait_for", wait_for):
+        results = await search_service._search_store_batch(_BatchScraper, ["a", "b", "c"], 5)
+
+    assert list(results) == ["a", "b"]
+    assert timeouts == [expected]
+    latency.record.assert_not_called()
+    breaker.record_success.assert_awaited_once_with("kontakt")
+
+
+class _HangingScraper:
+    store_slug = "kontakt"
+
+    async def guarded_search(self, query, max_results):
+        await asyncio.sleep(1)
+        return []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("at_ceiling", [False, True])
+async def test_only_timeouts_at_static_ceiling_count_against_breaker(at_ceiling):
+    breaker = AsyncMock()
+    latency = MagicMock()
+    latency.hedge_delay.return_value = None
+    ceiling = 0.01 if at_ceiling else 30.0
+
+    with patch.object(search_service, "circuit_breaker", breaker), \
+            patch.object(search_service, "store_latency", latency), \
+            patch.object(search_service.settings, "SEARCH_TIMEOUT_MAX_SECONDS", ceiling):
+        with pytest.raises(asyncio.TimeoutError):
+            await search_service._scrape_with_timeout(_HangingScraper(), "iphone 15", 5, timeout=0.01)
+
+    latency.record.assert_called_once_with("kontakt", 0.01)
+    assert breaker.record_failure.await_count == (1 if at_ceiling else 0)
+
+
+class _FailingScraper:
+    store_slug = "kontakt"
+
+    async def guarded_search(self, query, max_results):
+        raise ValueError("blocked")
+
+
+@pytest.mark.asyncio
+async def test_failed_search_raises_and_is_not_a_latency_sample():
+    latency = MagicMock()
+    latency.hedge_delay.return_value = None
+
+    with patch.object(search_service, "store_latency", latency):
+        with pytest.raises(ValueError):
+            await search_service._scrape_with_timeout(_FailingScraper(), "iphone 15", 5, timeout=1.0)
+
+    latency.record.assert_not_called()
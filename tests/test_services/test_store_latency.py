@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+from app.backend.core.config import settings
+from app.backend.services.store_latency import StoreLatencyTracker
+
+
+class TestStoreLatencyTracker:
+    def test_uses_max_timeout_until_enough_samples(self):
+        tracker = StoreLatencyTracker(window=50)
+        tracker.record("kontakt", 1.0)
+        assert tracker.deadline("kontakt") == settings.SEARCH_TIMEOUT_MAX_SECONDS
+
+    def test_deadline_follows_p95(self):
+        tracker = StoreLatencyTracker(window=100)
+        for i in range(1, 101):
+            tracker.record("kontakt", i / 10)  # 0.1s .. 10.0s
+        p95 = tracker.percentile("kontakt", 95)
+        assert 9.0 <= p95 <= 10.0
+        expected = min(settings.SEARCH_TIMEOUT_MAX_SECONDS, p95 * settings.SEARCH_TIMEOUT_P95_MULTIPLIER)
+        assert tracker.deadline("kontakt") == expected
+
+    def test_deadline_clamped_to_minimum(self):
+        tracker = StoreLatencyTracker(window=50)
+        for _ in range(settings.STORE_LATENCY_MIN_SAMPLES):
+            tracker.record("umico", 0.2)
+        assert tracker.deadline("umico") == settings.SEARCH_TIMEOUT_MIN_SECONDS
+
+    def test_hedging_disabled_by_default(self):
+        tracker = StoreLatencyTracker(window=50)
+        for _ in range(settings.STORE_LATENCY_MIN_SAMPLES):
+            tracker.record("umico", 0.2)
+        assert tracker.hedge_delay("umico") is None
+        with patch.object(settings, "SEARCH_HEDGE_ENABLED", True):
+            assert tracker.hedge_delay("umico") == 0.2
@@ -0,0 +1,85 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.backend.tasks import price_check
+from app.backend.tasks.price_check import _alert_group_key, _check_pinned_alerts, _search_group
+
+
+class TestAlertGroupKey:
+    def _make_alert(self, query: str, stores: list[str], category: str | None = None) -> MagicMock:
+        alert = MagicMock()
+        alert.search_query = query
+        alert.store_slugs = stores
+        alert.product_category = category
+        return alert
+
+    def test_same_search_groups_together(self):
+        a = self._make_alert("iPhone 15  128GB", ["kontakt", "irshad"], "phone")
+        b = self._make_alert("iphone 15 128gb ", ["irshad", "kontakt"], "phone")
+        assert _alert_group_key(a) == _alert_group_key(b)
+
+    def test_different_stores_split(self):
+        a = self._make_alert("iphone 15", ["kontakt"])
+        b = self._make_alert("iphone 15", ["kontakt", "irshad"])
+        assert _alert_group_key(a) != _alert_group_key(b)
+
+    def test_different_category_shares_scrape(self):
+        # Category only changes relevance filtering, applied per alert.
+        a = self._make_alert("iphone 15", ["kontakt"], "phone")
+        b = self._make_alert("iphone 15", ["kontakt"], "accessory")
+        assert _alert_group_key(a) == _alert_group_key(b)
+
+
+class TestSearchGroup:
+    async def test_prefetched_stores_are_not_searched_again(self):
+        def product(slug: str, price: str) -> MagicMock:
+            p = MagicMock()
+            p.store_slug, p.price = slug, Decimal(price)
+            return p
+
+        prefetched = {("kontakt", "iphone 15"): [product("kontakt", "1799")]}
+        irshad = [product("irshad", "1749")]
+
+        with patch(
+            "app.backend.tasks.price_check.search_stores_for_alert",
+            new_callable=AsyncMock,
+            return_value=irshad,
+        ) as search:
+            products = await _search_group("iphone 15", ("irshad", "kontakt", "tap_az"), prefetched)
+
+        search.assert_awaited_once_with("iphone 15", ["irshad", "tap_az"], relevance_filter=False)
+        assert [p.store_slug for p in products] == ["irshad", "kontakt"]
+
+
+class TestPinnedAlerts:
+    async def test_each_pinned_url_is_fetched_once_and_not_filtered(self):
+        shared, other = "https://kontakt.az/iphone-15.html", "https://irshad.az/az/product/iphone-15"
+        a, b = MagicMock(id=1, pinned_product_urls=[shared, other]), MagicMock(id=2, pinned_product_urls=[shared])
+        found = {shared: MagicMock(price=Decimal("1799")), other: MagicMock(price=Decimal("1749"))}
+
+        with patch(
+            "app.backend.tasks.price_check.fetch_pinned_products", new_callable=AsyncMock, return_value=found
+        ) as fetch, patch(
+            "app.backend.tasks.price_check._apply_group_results", new_callable=AsyncMock
+        ) as apply:
+            await _check_pinned_alerts([a, b])
+
+        fetch.assert_awaited_once_with([shared, other, shared])
+        apply.assert_awaited_once_with({1: [found[other], found[shared]], 2: [found[shared]]})
+
+
+class TestDueAlertsTick:
+    async def test_tick_skipped_while_previous_one_holds_the_lock(self):
+        redis = MagicMock()
+        redis.set = AsyncMock(side_effect=[True, None])
+        redis.eval = AsyncMock()
+        with patch.object(price_check, "get_redis", return_value=redis), \
+                patch.object(price_check, "get_session_factory", return_value=MagicMock()), \
+                patch.object(price_check, "get_due_alerts", AsyncMock(return_value=[])) as get_due:
+            await price_check._check_due_alerts()
+            await price_check._check_due_alerts()
+
+        get_due.assert_awaited_once()
+        assert redis.set.await_args.kwargs["nx"] is True
+        token = redis.set.await_args_list[0].args[1]
+        redis.eval.assert_awaited_once_with(price_check.UNLOCK_SCRIPT, 1, price_check.TICK_LOCK_KEY, token)